@@ -3,12 +3,38 @@ from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
+from werkzeug.middleware.proxy_fix import ProxyFix
 
 from app.config import config
-from app.models import db
+from app.models import db, User
+from app.models.search import include_in_migrations
+from app.models.session import use_primary
+from app.services.archive import TaskArchiver
+from app.services.database import SQLiteProfile
+from app.services.events import EventBroker
+from app.services.ordering import RankRebalancer
+from app.services.passwords import HasherBusyError, PasswordHasher
+from app.services.rate_limit import RateLimiter
+from app.services.replicas import ReplicaRouter
+from app.services.stats import StatsCache
+from app.services.token_blocklist import TokenBlocklist
+from app.utils.json_provider import get_json_provider_class
+from app.utils.log import init_logging
+from app.utils.metrics import RequestMetrics
 
-migrate = Migrate()
+# The SQLite FTS5 search table is managed by hand-written DDL, not autogenerate
+migrate = Migrate(render_as_batch=True, include_name=include_in_migrations)
 jwt = JWTManager()
+token_blocklist = TokenBlocklist()
+password_hasher = PasswordHasher()
+event_broker = EventBroker()
+stats_cache = StatsCache()
+rank_rebalancer = RankRebalancer()
+sqlite_profile = SQLiteProfile()
+request_metrics = RequestMetrics()
+rate_limiter = RateLimiter()
+replica_router = ReplicaRouter()
+task_archiver = TaskArchiver()
 
 
 def create_app(config_name=None):
@@ -19,11 +45,28 @@ def create_app(config_name=None):
     app = Flask(__name__)
     app.config.from_object(config[config_name])
     config[config_name].init_app(app)
+    app.json = get_json_provider_class(app.config['JSON_PROVIDER'])(app)
+    if app.config['PROXY_FIX_X_FOR']:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['PROXY_FIX_X_FOR'])
 
     # Initialize extensions
     db.init_app(app)
-    migrate.init_app(app, db)
+    sqlite_profile.init_app(app)
+    migrate.init_app(app, db, directory=os.path.join(os.path.dirname(app.root_path), 'migrations'))
     jwt.init_app(app)
+    token_blocklist.init_app(app)
+    password_hasher.init_app(app)
+    event_broker.init_app(app)
+    stats_cache.init_app(app)
+    rank_rebalancer.init_app(app)
+    task_archiver.init_app(app)
+    init_logging(app)
+    # Registered after logging so its after_request hook runs first and
+    # its fields land in the request log event
+    request_metrics.init_app(app)
+    # After metrics so bucket checks are included in the request's DB time
+    rate_limiter.init_app(app)
+    replica_router.init_app(app)
     CORS(app, origins="*", supports_credentials=True)
 
     # JWT error handlers
@@ -59,19 +102,44 @@ def create_app(config_name=None):
             'error': {'message': 'Token has been revoked', 'code': 401}
         }), 401
 
+    @app.errorhandler(HasherBusyError)
+    def hasher_busy_callback(error):
+        response = jsonify({
+            'success': False,
+            'error': {'message': 'Server is busy, please retry', 'code': 503}
+        })
+        return response, 503, {'Retry-After': str(error.retry_after)}
+
+    # Load the authenticated user once per request; flask_jwt_extended keeps
+    # it on flask.g so decorators and routes share the same instance. Read
+    # from the primary so new users and role or team changes apply at once.
+    @jwt.user_lookup_loader
+    def user_lookup_callback(jwt_header, jwt_payload):
+        with use_primary():
+            return db.session.get(User, int(jwt_payload['sub']))
+
+    @jwt.user_lookup_error_loader
+    def user_lookup_error_callback(jwt_header, jwt_payload):
+        return jsonify({
+            'success': False,
+            'error': {'message': 'User not found', 'code': 404}
+        }), 404
+
     # Register token revocation callback
     from app.routes.auth import is_token_revoked
     jwt.token_in_blocklist_loader(is_token_revoked)
 
     # Register blueprints
-    from app.routes import auth_bp, users_bp, private_todos_bp, team_tasks_bp
+    from app.routes import auth_bp, users_bp, private_todos_bp, team_tasks_bp, health_bp, search_bp
     app.register_blueprint(auth_bp)
     app.register_blueprint(users_bp)
     app.register_blueprint(private_todos_bp)
     app.register_blueprint(team_tasks_bp)
+    app.register_blueprint(health_bp)
+    app.register_blueprint(search_bp)
 
-    # Create database tables
-    with app.app_context():
-        db.create_all()
+    # Register CLI commands
+    from app.cli import register_commands
+    register_commands(app)
 
     return app
@@ -0,0 +1,88 @@
+import click
+from flask import current_app
+from flask_migrate import stamp, upgrade
+from sqlalchemy import inspect
+from app.models import db, User
+from app.services.archive import archive_done_tasks
+from app.services.board import repair_sub_task_counters
+from app.services.ordering import long_rank_columns, rebalance_column
+from app.services.seed import seed_data, seed_email
+from app.services.sync import prune_tombstones
+
+
+# Schema as created by db.create_all() before migrations were introduced
+LEGACY_SCHEMA_REVISION = '25dedda94cfb'
+
+
+def register_commands(app):
+    """Register Taskish CLI commands on the app."""
+
+    @app.cli.command('bootstrap-db')
+    def bootstrap_db():
+        """Create or upgrade the database schema through migrations."""
+        tables = set(inspect(db.engine).get_table_names())
+        if 'alembic_version' not in tables and 'users' in tables:
+            # Created by create_app() on startup in older releases
+            stamp(revision=LEGACY_SCHEMA_REVISION)
+            click.echo(f'Stamped existing schema at {LEGACY_SCHEMA_REVISION}')
+        upgrade()
+        click.echo('Database schema is up to date')
+
+    @app.cli.command('prune-revoked-tokens')
+    def prune_revoked_tokens():
+        """Delete revoked-token entries whose token has expired."""
+        removed = current_app.extensions['token_blocklist'].prune()
+        click.echo(f'Pruned {removed} expired revoked tokens')
+
+    @app.cli.command('prune-tombstones')
+    def prune_tombstones_command():
+        """Delete deletion records older than TOMBSTONE_RETENTION_DAYS."""
+        removed = prune_tombstones(current_app.config['TOMBSTONE_RETENTION_DAYS'])
+        click.echo(f'Pruned {removed} tombstones')
+
+    @app.cli.command('archive-tasks')
+    @click.option('--older-than-days', type=int, default=None,
+                  help='Archive DONE tasks not updated for this many days [default: ARCHIVE_AFTER_DAYS].')
+    @click.option('--batch-size', type=int, default=None,
+                  help='Tasks moved per transaction [default: ARCHIVE_BATCH_SIZE].')
+    def archive_tasks(older_than_days, batch_size):
+        """Move old DONE tasks and their sub-tasks into the archive tables."""
+        if older_than_days is None:
+            older_than_days = current_app.config['ARCHIVE_AFTER_DAYS']
+        if batch_size is None:
+            batch_size = current_app.config['ARCHIVE_BATCH_SIZE']
+        tasks, sub_tasks = archive_done_tasks(older_than_days, batch_size)
+        click.echo(f'Archived {tasks} tasks and {sub_tasks} sub-tasks')
+
+    @app.cli.command('repair-subtask-counters')
+    def repair_subtask_counters_command():
+        """Recompute drifted sub-task counters on team tasks."""
+        fixed = repair_sub_task_counters()
+        click.echo(f'Repaired sub-task counters on {fixed} tasks')
+
+    @app.cli.command('rebalance-ranks')
+    @click.option('--max-length', type=int, default=None,
+                  help='Renumber columns holding a longer rank [default: RANK_REBALANCE_LENGTH].')
+    def rebalance_ranks(max_length):
+        """Renumber board columns whose task ranks have grown long."""
+        if max_length is None:
+            max_length = current_app.config['RANK_REBALANCE_LENGTH']
+        columns = long_rank_columns(max_length)
+        tasks = sum(rebalance_column(team_id, status) for team_id, status in columns)
+        click.echo(f'Rebalanced {len(columns)} columns ({tasks} tasks)')
+
+    @app.cli.command('seed-bench')
+    @click.option('--teams', default=10, show_default=True)
+    @click.option('--users-per-team', default=20, show_default=True)
+    @click.option('--tasks-per-team', default=500, show_default=True)
+    @click.option('--sub-tasks-per-task', default=5, show_default=True)
+    @click.option('--todos-per-user', default=20, show_default=True)
+    @click.option('--password', default='benchmark', show_default=True)
+    @click.option('--seed', default=0, show_default=True, help='Random seed for reproducible data.')
+    def seed_bench(teams, users_per_team, tasks_per_team, sub_tasks_per_task, todos_per_user, password, seed):
+        """Bulk-insert synthetic data for the benchmark suite."""
+        if User.query.filter_by(email=seed_email(0, 0)).first() is not None:
+            raise click.ClickException('Benchmark data is already seeded; start from an empty database')
+        counts = seed_data(teams, users_per_team, tasks_per_team, sub_tasks_per_task,
+                           todos_per_user, password, seed)
+        click.echo(', '.join(f'{count} {table}' for table, count in counts.items()))
@@ -2,6 +2,49 @@ import os
 from datetime import timedelta
 
 
+def engine_options(config) -> dict:
+    """Build SQLALCHEMY_ENGINE_OPTIONS from the DB_* settings.
+
+    Pool sizing only applies to server databases; SQLite pools are set up
+    by Flask-SQLAlchemy (in-memory databases need a single shared
+    connection). A statement timeout is passed to PostgreSQL as a
+    connection option so it covers every session on the pool.
+    """
+    uri = config.get('SQLALCHEMY_DATABASE_URI') or ''
+    options = {'pool_pre_ping': config['DB_POOL_PRE_PING']}
+    if uri.startswith('sqlite'):
+        return options
+
+    options.update(
+        pool_size=config['DB_POOL_SIZE'],
+        max_overflow=config['DB_MAX_OVERFLOW'],
+        pool_timeout=config['DB_POOL_TIMEOUT'],
+        pool_recycle=config['DB_POOL_RECYCLE'],
+    )
+    if uri.startswith('postgresql') and config['DB_STATEMENT_TIMEOUT_MS']:
+        options['connect_args'] = {
+            'options': f"-c statement_timeout={config['DB_STATEMENT_TIMEOUT_MS']}"
+        }
+    return options
+
+
+# SQLALCHEMY_BINDS entries whose key starts with this are read replicas of the primary
+REPLICA_BIND_PREFIX = 'replica'
+
+
+def replica_binds(config) -> dict:
+    """Build SQLALCHEMY_BINDS from DB_REPLICA_URLS, keeping any binds configured directly."""
+    binds = dict(config.get('SQLALCHEMY_BINDS') or {})
+    index = 0
+    for url in config['DB_REPLICA_URLS']:
+        if url.startswith('postgres://'):
+            url = url.replace('postgres://', 'postgresql://', 1)
+        while f'{REPLICA_BIND_PREFIX}_{index}' in binds:
+            index += 1
+        binds[f'{REPLICA_BIND_PREFIX}_{index}'] = url
+    return binds
+
+
 class Config:
     """Base configuration."""
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key')
@@ -9,9 +52,104 @@ class Config:
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Database engine / connection pool (see engine_options)
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 0))  # PostgreSQL only, 0 = off
+
+    # Read replicas (comma-separated URLs), added to SQLALCHEMY_BINDS as replica_0, replica_1, ...
+    # GETs to these blueprints read from them, except for callers who wrote in the last few seconds
+    DB_REPLICA_URLS = [url.strip() for url in os.environ.get('DB_REPLICA_URLS', '').split(',') if url.strip()]
+    DB_REPLICA_BLUEPRINTS = ('team_tasks', 'private_todos', 'users')
+    DB_REPLICA_STICKY_SECONDS = int(os.environ.get('DB_REPLICA_STICKY_SECONDS', 5))
+    # Where writers are remembered: 'database' is shared by all workers, 'memory' is per process
+    DB_REPLICA_STICKY_BACKEND = os.environ.get('DB_REPLICA_STICKY_BACKEND', 'database')
+    DB_REPLICA_STICKY_CACHE_SIZE = int(os.environ.get('DB_REPLICA_STICKY_CACHE_SIZE', 10000))
+    DB_REPLICA_STICKY_PRUNE_INTERVAL = int(os.environ.get('DB_REPLICA_STICKY_PRUNE_INTERVAL', 3600))
+
+    # Opt-in SQLite concurrency profile for file databases (see SQLiteProfile)
+    SQLITE_WAL = os.environ.get('SQLITE_WAL', 'false').lower() == 'true'
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+    SQLITE_CACHE_SIZE = int(os.environ.get('SQLITE_CACHE_SIZE', -64000))  # negative = KiB
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    SQLITE_CHECKPOINT_INTERVAL = int(os.environ.get('SQLITE_CHECKPOINT_INTERVAL', 300))  # seconds, 0 = off
+
+    # 'auto' uses orjson when installed, 'stdlib' forces the built-in json module
+    JSON_PROVIDER = os.environ.get('JSON_PROVIDER', 'auto')
+    PAGE_SIZE_DEFAULT = int(os.environ.get('PAGE_SIZE_DEFAULT', 100))
+    PAGE_SIZE_MAX = int(os.environ.get('PAGE_SIZE_MAX', 500))
+    BATCH_MAX_ITEMS = int(os.environ.get('BATCH_MAX_ITEMS', 500))
+    # Rows fetched and written per chunk by ?stream=1 list responses
+    STREAM_BATCH_SIZE = int(os.environ.get('STREAM_BATCH_SIZE', 500))
+    # Rows inserted and committed per transaction by the bulk import endpoints
+    IMPORT_CHUNK_SIZE = int(os.environ.get('IMPORT_CHUNK_SIZE', 5000))
+    IMPORT_MAX_ERRORS = int(os.environ.get('IMPORT_MAX_ERRORS', 100))
+    TOMBSTONE_RETENTION_DAYS = int(os.environ.get('TOMBSTONE_RETENTION_DAYS', 30))
+    # /changes re-sends this much history before the watermark; must exceed the longest write transaction
+    SYNC_OVERLAP_SECONDS = int(os.environ.get('SYNC_OVERLAP_SECONDS', 30))
+    # DONE tasks untouched for this many days are moved to the archive tables, in batches
+    ARCHIVE_AFTER_DAYS = int(os.environ.get('ARCHIVE_AFTER_DAYS', 90))
+    ARCHIVE_BATCH_SIZE = int(os.environ.get('ARCHIVE_BATCH_SIZE', 500))
+    ARCHIVE_INTERVAL = int(os.environ.get('ARCHIVE_INTERVAL', 0))  # seconds between runs in each worker, 0 = off
+    # Board columns are renumbered in the background once a task rank exceeds this length (0 = off)
+    RANK_REBALANCE_LENGTH = int(os.environ.get('RANK_REBALANCE_LENGTH', 32))
+
+    # Board statistics cache; entries are checked against the board version and expire as a backstop
+    STATS_CACHE_SIZE = int(os.environ.get('STATS_CACHE_SIZE', 1000))
+    STATS_CACHE_TTL = int(os.environ.get('STATS_CACHE_TTL', 60))
+
+    # Token revocation store ('database' or 'memory')
+    TOKEN_BLOCKLIST_BACKEND = os.environ.get('TOKEN_BLOCKLIST_BACKEND', 'database')
+    TOKEN_BLOCKLIST_CACHE_SIZE = int(os.environ.get('TOKEN_BLOCKLIST_CACHE_SIZE', 10000))
+    TOKEN_BLOCKLIST_NEGATIVE_TTL = float(os.environ.get('TOKEN_BLOCKLIST_NEGATIVE_TTL', 0))
+    TOKEN_BLOCKLIST_PRUNE_INTERVAL = int(os.environ.get('TOKEN_BLOCKLIST_PRUNE_INTERVAL', 3600))
+
+    # Token-bucket limits on write requests ('database' shares buckets across
+    # workers, 'memory' is per process). RATE_LIMITS overrides the default per
+    # blueprint; auth is strict because every login/register costs a bcrypt hash.
+    RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+    RATE_LIMIT_BACKEND = os.environ.get('RATE_LIMIT_BACKEND', 'database')
+    RATE_LIMIT_DEFAULT = os.environ.get('RATE_LIMIT_DEFAULT', '120/minute')
+    RATE_LIMITS = {
+        'auth': os.environ.get('RATE_LIMIT_AUTH', '10/minute'),
+    }
+    RATE_LIMIT_PRUNE_INTERVAL = int(os.environ.get('RATE_LIMIT_PRUNE_INTERVAL', 3600))
+    # Number of reverse proxies in front of the app whose X-Forwarded-For is trusted
+    PROXY_FIX_X_FOR = int(os.environ.get('PROXY_FIX_X_FOR', 0))
+
+    # Live board events ('local' or 'postgres' for LISTEN/NOTIFY fan-out across workers)
+    EVENT_BACKEND = os.environ.get('EVENT_BACKEND', 'local')
+    EVENT_DATABASE_URL = os.environ.get('EVENT_DATABASE_URL')
+    SSE_CLIENT_BUFFER = int(os.environ.get('SSE_CLIENT_BUFFER', 100))
+    SSE_HEARTBEAT_SECONDS = int(os.environ.get('SSE_HEARTBEAT_SECONDS', 15))
+
+    # Password hashing
+    BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 0))  # 0 = min(4, CPUs)
+    PASSWORD_HASH_QUEUE_SIZE = int(os.environ.get('PASSWORD_HASH_QUEUE_SIZE', 16))
+    PASSWORD_HASH_RETRY_AFTER = int(os.environ.get('PASSWORD_HASH_RETRY_AFTER', 1))
+
+    # Structured request logging
+    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+    LOG_FILE = os.environ.get('LOG_FILE')
+    LOG_SAMPLE_RATE = float(os.environ.get('LOG_SAMPLE_RATE', 1.0))
+    LOG_HEADERS = os.environ.get('LOG_HEADERS', 'false').lower() == 'true'
+    LOG_REDACT_HEADERS = ('Authorization', 'Cookie', 'Set-Cookie', 'X-Api-Key')
+
+    # Per-request instrumentation: Server-Timing header and /metrics (Prometheus)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+    # When set, /metrics requires "Authorization: Bearer <METRICS_TOKEN>"
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+    SERVER_TIMING = os.environ.get('SERVER_TIMING', 'true').lower() == 'true'
+
     @staticmethod
     def init_app(app):
-        pass
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(app.config))
+        app.config['SQLALCHEMY_BINDS'] = replica_binds(app.config)
 
 
 class DevelopmentConfig(Config):
@@ -27,11 +165,21 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=5)
+    BCRYPT_ROUNDS = 4
+    LOG_LEVEL = 'WARNING'
+    DB_POOL_PRE_PING = False
+    RATE_LIMIT_ENABLED = False
 
 
 class ProductionConfig(Config):
     """Production configuration."""
     DEBUG = False
+    # Query counts and timings are internal detail; opt in explicitly
+    SERVER_TIMING = os.environ.get('SERVER_TIMING', 'false').lower() == 'true'
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'false').lower() == 'true'
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 30000))
+    # Render forwards requests through one load balancer hop
+    PROXY_FIX_X_FOR = int(os.environ.get('PROXY_FIX_X_FOR', 1))
 
     @staticmethod
     def get_database_uri():
@@ -45,11 +193,11 @@ class ProductionConfig(Config):
 
     @classmethod
     def init_app(cls, app):
-        Config.init_app(app)
         # Fix DATABASE_URL for Render/Heroku compatibility
         db_uri = cls.get_database_uri()
         if db_uri:
             app.config['SQLALCHEMY_DATABASE_URI'] = db_uri
+        Config.init_app(app)
         # Production-specific initialization
         assert db_uri, 'DATABASE_URL must be set'
         assert cls.SECRET_KEY != 'dev-secret-key', 'SECRET_KEY must be changed'
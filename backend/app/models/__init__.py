@@ -1,11 +1,18 @@
 from flask_sqlalchemy import SQLAlchemy
+from .session import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 from .user import User
 from .team import Team
 from .private_todo import PrivateTodo
 from .team_task import TeamTask
 from .sub_task import SubTask
+from .revoked_token import RevokedToken
+from .tombstone import Tombstone
+from .rate_limit_bucket import RateLimitBucket
+from .recent_writer import RecentWriter
+from .archive import ArchivedTeamTask, ArchivedSubTask
 
-__all__ = ['db', 'User', 'Team', 'PrivateTodo', 'TeamTask', 'SubTask']
+__all__ = ['db', 'User', 'Team', 'PrivateTodo', 'TeamTask', 'SubTask', 'RevokedToken', 'Tombstone',
+           'RateLimitBucket', 'RecentWriter', 'ArchivedTeamTask', 'ArchivedSubTask']
@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+from app.utils.serializers import ModelSerializer
+from . import db
+
+
+class ArchivedTeamTask(db.Model):
+    """Finished team task moved out of team_tasks by the archiving job.
+
+    Rows keep their original ids and timestamps; `archived_at` records the
+    move. Board ordering is dropped, as archived tasks are not on the board.
+    """
+    __tablename__ = 'archived_team_tasks'
+    __table_args__ = (
+        db.Index('ix_archived_team_tasks_team_updated', 'team_id', 'updated_at', 'id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False)
+    title = db.Column(db.String(255), nullable=False)
+    description = db.Column(db.Text, nullable=True)
+    status = db.Column(db.String(20), nullable=False)
+    assigned_user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    sub_task_total = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    sub_task_done = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f'<ArchivedTeamTask {self.title}>'
+
+
+class ArchivedSubTask(db.Model):
+    """Sub-task archived together with its team task."""
+    __tablename__ = 'archived_sub_tasks'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    team_task_id = db.Column(db.Integer, db.ForeignKey('archived_team_tasks.id'), nullable=False, index=True)
+    title = db.Column(db.String(255), nullable=False)
+    status = db.Column(db.String(20), nullable=False)
+    responsible_user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+
+    def __repr__(self):
+        return f'<ArchivedSubTask {self.title}>'
+
+
+ARCHIVED_TEAM_TASK_SERIALIZER = ModelSerializer(ArchivedTeamTask, exclude=('sub_task_total', 'sub_task_done'))
+ARCHIVED_SUB_TASK_SERIALIZER = ModelSerializer(ArchivedSubTask)
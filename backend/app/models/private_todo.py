@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
 from enum import Enum
+from app.utils.serializers import ModelSerializer
 from . import db
+from .search import search_gin_index
 
 
 class TodoStatus(str, Enum):
@@ -12,6 +14,11 @@ class TodoStatus(str, Enum):
 class PrivateTodo(db.Model):
     """Private todo items visible only to the owner."""
     __tablename__ = 'private_todos'
+    __table_args__ = (
+        db.Index('ix_private_todos_owner_created', 'owner_user_id', 'created_at', 'id'),
+        db.Index('ix_private_todos_owner_status_created', 'owner_user_id', 'status', 'created_at', 'id'),
+        search_gin_index('private_todos'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     owner_user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
@@ -30,16 +37,10 @@ class PrivateTodo(db.Model):
     owner = db.relationship('User', back_populates='private_todos')
 
     def to_dict(self):
-        return {
-            'id': self.id,
-            'owner_user_id': self.owner_user_id,
-            'title': self.title,
-            'description': self.description,
-            'status': self.status,
-            'due_date': self.due_date.isoformat() if self.due_date else None,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return PRIVATE_TODO_SERIALIZER.from_object(self)
 
     def __repr__(self):
         return f'<PrivateTodo {self.title}>'
+
+
+PRIVATE_TODO_SERIALIZER = ModelSerializer(PrivateTodo)
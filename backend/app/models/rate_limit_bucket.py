@@ -0,0 +1,17 @@
+from . import db
+
+
+class RateLimitBucket(db.Model):
+    """Token bucket shared by all workers (see DatabaseRateLimitBackend).
+
+    Times are epoch seconds rather than DateTime so the refill can be
+    computed in a single portable UPDATE.
+    """
+    __tablename__ = 'rate_limit_buckets'
+
+    key = db.Column(db.String(255), primary_key=True)
+    tokens = db.Column(db.Float, nullable=False)
+    updated_at = db.Column(db.Float, nullable=False, index=True)
+
+    def __repr__(self):
+        return f'<RateLimitBucket {self.key}>'
@@ -0,0 +1,16 @@
+from . import db
+
+
+class RecentWriter(db.Model):
+    """Caller whose reads stay on the primary until expires_at (see ReplicaRouter).
+
+    Kept in the primary database so every worker sees the marker. Times are
+    epoch seconds, like RateLimitBucket.
+    """
+    __tablename__ = 'recent_writers'
+
+    key = db.Column(db.String(255), primary_key=True)
+    expires_at = db.Column(db.Float, nullable=False, index=True)
+
+    def __repr__(self):
+        return f'<RecentWriter {self.key}>'
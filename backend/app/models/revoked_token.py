@@ -0,0 +1,15 @@
+from datetime import datetime, timezone
+from . import db
+
+
+class RevokedToken(db.Model):
+    """JWT that was revoked before its expiry (e.g. on logout)."""
+    __tablename__ = 'revoked_tokens'
+
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(64), unique=True, nullable=False, index=True)
+    expires_at = db.Column(db.DateTime, nullable=True, index=True)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f'<RevokedToken {self.jti}>'
@@ -0,0 +1,91 @@
+"""Full-text search indexes.
+
+PostgreSQL: a GIN index over a 'simple' tsvector expression per table. The
+search service queries the same expressions, so they must stay in sync
+with SEARCH_DOCUMENTS.
+
+SQLite: one FTS5 table, search_index, kept in sync by triggers. Each row
+carries a scope token ('team<id>' or 'user<id>'), so the MATCH itself
+restricts results to the caller's team and todos instead of filtering
+after ranking. Rowids encode the entity: id * 4 + KIND_CODES[kind].
+
+Both are created with the tables by create_all (tests, local dev) and by
+the migrations.
+"""
+from sqlalchemy import DDL, event
+from . import db
+
+SEARCH_INDEX_TABLE = 'search_index'
+
+KIND_CODES = {'team_task': 1, 'sub_task': 2, 'private_todo': 3}
+
+SEARCH_DOCUMENTS = {
+    'team_tasks': "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))",
+    'sub_tasks': "to_tsvector('simple', coalesce(title, ''))",
+    'private_todos': "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))",
+}
+
+SQLITE_SEARCH_DDL = (
+    f"""CREATE VIRTUAL TABLE {SEARCH_INDEX_TABLE} USING fts5(
+        kind UNINDEXED, entity_id UNINDEXED, parent_id UNINDEXED, scope, title, body,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )""",
+    # Team tasks
+    f"""CREATE TRIGGER team_tasks_search_ai AFTER INSERT ON team_tasks BEGIN
+        INSERT INTO {SEARCH_INDEX_TABLE} (rowid, kind, entity_id, parent_id, scope, title, body)
+        VALUES (NEW.id * 4 + 1, 'team_task', NEW.id, NULL, 'team' || NEW.team_id, NEW.title, NEW.description);
+    END""",
+    f"""CREATE TRIGGER team_tasks_search_au AFTER UPDATE OF title, description, team_id ON team_tasks BEGIN
+        UPDATE {SEARCH_INDEX_TABLE} SET scope = 'team' || NEW.team_id, title = NEW.title, body = NEW.description
+        WHERE rowid = NEW.id * 4 + 1;
+    END""",
+    f"""CREATE TRIGGER team_tasks_search_ad AFTER DELETE ON team_tasks BEGIN
+        DELETE FROM {SEARCH_INDEX_TABLE} WHERE rowid = OLD.id * 4 + 1;
+    END""",
+    # Sub-tasks, scoped by their task's team
+    f"""CREATE TRIGGER sub_tasks_search_ai AFTER INSERT ON sub_tasks BEGIN
+        INSERT INTO {SEARCH_INDEX_TABLE} (rowid, kind, entity_id, parent_id, scope, title, body)
+        VALUES (NEW.id * 4 + 2, 'sub_task', NEW.id, NEW.team_task_id,
+                'team' || (SELECT team_id FROM team_tasks WHERE id = NEW.team_task_id), NEW.title, NULL);
+    END""",
+    f"""CREATE TRIGGER sub_tasks_search_au AFTER UPDATE OF title, team_task_id ON sub_tasks BEGIN
+        UPDATE {SEARCH_INDEX_TABLE} SET title = NEW.title, parent_id = NEW.team_task_id,
+            scope = 'team' || (SELECT team_id FROM team_tasks WHERE id = NEW.team_task_id)
+        WHERE rowid = NEW.id * 4 + 2;
+    END""",
+    f"""CREATE TRIGGER sub_tasks_search_ad AFTER DELETE ON sub_tasks BEGIN
+        DELETE FROM {SEARCH_INDEX_TABLE} WHERE rowid = OLD.id * 4 + 2;
+    END""",
+    # Private todos, scoped by owner
+    f"""CREATE TRIGGER private_todos_search_ai AFTER INSERT ON private_todos BEGIN
+        INSERT INTO {SEARCH_INDEX_TABLE} (rowid, kind, entity_id, parent_id, scope, title, body)
+        VALUES (NEW.id * 4 + 3, 'private_todo', NEW.id, NULL, 'user' || NEW.owner_user_id, NEW.title, NEW.description);
+    END""",
+    f"""CREATE TRIGGER private_todos_search_au AFTER UPDATE OF title, description, owner_user_id ON private_todos BEGIN
+        UPDATE {SEARCH_INDEX_TABLE} SET scope = 'user' || NEW.owner_user_id, title = NEW.title, body = NEW.description
+        WHERE rowid = NEW.id * 4 + 3;
+    END""",
+    f"""CREATE TRIGGER private_todos_search_ad AFTER DELETE ON private_todos BEGIN
+        DELETE FROM {SEARCH_INDEX_TABLE} WHERE rowid = OLD.id * 4 + 3;
+    END""",
+)
+
+
+def search_gin_index(table_name: str) -> db.Index:
+    """GIN index over a table's search document, created on PostgreSQL only."""
+    return db.Index(
+        f'ix_{table_name}_search', db.text(SEARCH_DOCUMENTS[table_name]), postgresql_using='gin'
+    ).ddl_if(dialect='postgresql')
+
+
+def include_in_migrations(name, type_, parent_names) -> bool:
+    """Alembic include_name hook: ignore the FTS5 table and its shadow tables."""
+    return not (type_ == 'table' and name.startswith(SEARCH_INDEX_TABLE))
+
+
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(db.metadata, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+event.listen(
+    db.metadata, 'before_drop',
+    DDL(f'DROP TABLE IF EXISTS {SEARCH_INDEX_TABLE}').execute_if(dialect='sqlite')
+)
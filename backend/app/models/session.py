@@ -0,0 +1,34 @@
+from contextlib import contextmanager
+from flask import g, has_app_context
+from flask_sqlalchemy.session import Session
+
+
+class RoutingSession(Session):
+    """Session that sends a request's reads to the replica bind chosen for it.
+
+    app.services.replicas.ReplicaRouter stores the bind key of a replica in
+    `g.db_replica` for read-only requests. Statements that would use the
+    primary engine then go to that replica instead, except while flushing,
+    so anything that writes still reaches the primary. Models with their
+    own bind key are unaffected.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        if bind is not None or self._flushing or not has_app_context():
+            return engine
+        replica = g.get('db_replica')
+        if replica is None or engine is not self._db.engines.get(None):
+            return engine
+        return self._db.engines[replica]
+
+
+@contextmanager
+def use_primary():
+    """Read from the primary inside the block, for results that must not lag behind writes."""
+    replica = g.pop('db_replica', None) if has_app_context() else None
+    try:
+        yield
+    finally:
+        if replica is not None:
+            g.db_replica = replica
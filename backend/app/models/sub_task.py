@@ -1,6 +1,9 @@
 from datetime import datetime, timezone
 from enum import Enum
+from app.utils.serializers import ModelSerializer
 from . import db
+from .search import search_gin_index
+from .user import USER_SUMMARY_SERIALIZER
 
 
 class SubTaskStatus(str, Enum):
@@ -13,6 +16,11 @@ class SubTaskStatus(str, Enum):
 class SubTask(db.Model):
     """Sub-task belonging to a team task."""
     __tablename__ = 'sub_tasks'
+    __table_args__ = (
+        db.Index('ix_sub_tasks_updated', 'updated_at'),
+        search_gin_index('sub_tasks'),
+        {'sqlite_autoincrement': True},
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     team_task_id = db.Column(db.Integer, db.ForeignKey('team_tasks.id'), nullable=False, index=True)
@@ -31,22 +39,13 @@ class SubTask(db.Model):
     responsible_user = db.relationship('User', back_populates='responsible_subtasks', foreign_keys=[responsible_user_id])
 
     def to_dict(self, include_responsible_user: bool = True):
-        result = {
-            'id': self.id,
-            'team_task_id': self.team_task_id,
-            'title': self.title,
-            'status': self.status,
-            'responsible_user_id': self.responsible_user_id,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        result = SUB_TASK_SERIALIZER.from_object(self)
         if include_responsible_user and self.responsible_user:
-            result['responsible_user'] = {
-                'id': self.responsible_user.id,
-                'name': self.responsible_user.name,
-                'email': self.responsible_user.email
-            }
+            result['responsible_user'] = USER_SUMMARY_SERIALIZER.from_object(self.responsible_user)
         return result
 
     def __repr__(self):
         return f'<SubTask {self.title}>'
+
+
+SUB_TASK_SERIALIZER = ModelSerializer(SubTask)
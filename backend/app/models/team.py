@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from app.utils.serializers import ModelSerializer
 from . import db
 
 
@@ -20,12 +21,10 @@ class Team(db.Model):
     tasks = db.relationship('TeamTask', back_populates='team', lazy='dynamic', cascade='all, delete-orphan')
 
     def to_dict(self):
-        return {
-            'id': self.id,
-            'name': self.name,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return TEAM_SERIALIZER.from_object(self)
 
     def __repr__(self):
         return f'<Team {self.name}>'
+
+
+TEAM_SERIALIZER = ModelSerializer(Team)
@@ -1,6 +1,12 @@
 from datetime import datetime, timezone
 from enum import Enum
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, func, select, update
+from app.utils.ranking import rank_after
+from app.utils.serializers import ModelSerializer
 from . import db
+from .search import search_gin_index
+from .user import USER_SUMMARY_SERIALIZER
 
 
 class TaskStatus(str, Enum):
@@ -10,9 +16,22 @@ class TaskStatus(str, Enum):
     DONE = 'DONE'
 
 
+RANK_MAX_LENGTH = 255
+
+
 class TeamTask(db.Model):
     """Team task visible to all team members."""
     __tablename__ = 'team_tasks'
+    __table_args__ = (
+        db.Index('ix_team_tasks_team_created', 'team_id', 'created_at', 'id'),
+        db.Index('ix_team_tasks_team_status_created', 'team_id', 'status', 'created_at', 'id'),
+        db.Index('ix_team_tasks_team_assignee_created', 'team_id', 'assigned_user_id', 'created_at', 'id'),
+        db.Index('ix_team_tasks_team_updated', 'team_id', 'updated_at'),
+        db.Index('ix_team_tasks_team_status_position', 'team_id', 'status', 'position', 'id'),
+        search_gin_index('team_tasks'),
+        # Never reuse ids on SQLite: deleted and archived tasks keep theirs in tombstones and the archive
+        {'sqlite_autoincrement': True},
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False, index=True)
@@ -20,6 +39,17 @@ class TeamTask(db.Model):
     description = db.Column(db.Text, nullable=True)
     status = db.Column(db.String(20), nullable=False, default=TaskStatus.TODO.value)
     assigned_user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    # Lexicographic rank within the status column (see app.utils.ranking); byte
+    # order on PostgreSQL so it sorts the same as in Python. New tasks are
+    # appended to their column on flush.
+    position = db.Column(
+        db.String(RANK_MAX_LENGTH).with_variant(db.String(RANK_MAX_LENGTH, collation='C'), 'postgresql'),
+        nullable=False,
+        server_default=''
+    )
+    # Denormalized sub-task counts, maintained by the sub-task write paths
+    sub_task_total = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    sub_task_done = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(
         db.DateTime,
@@ -32,36 +62,68 @@ class TeamTask(db.Model):
     assigned_user = db.relationship('User', back_populates='assigned_tasks', foreign_keys=[assigned_user_id])
     sub_tasks = db.relationship('SubTask', back_populates='team_task', lazy='dynamic', cascade='all, delete-orphan')
 
+    @staticmethod
+    def calculate_progress(status: str, total: int, done: int) -> int:
+        """Calculate progress from sub-task counts."""
+        if total == 0:
+            return 100 if status == TaskStatus.DONE.value else 0
+        return int((done / total) * 100)
+
     @property
     def progress(self) -> int:
         """Calculate progress based on completed sub-tasks."""
-        total = self.sub_tasks.count()
-        if total == 0:
-            return 100 if self.status == TaskStatus.DONE.value else 0
-        done = self.sub_tasks.filter_by(status=TaskStatus.DONE.value).count()
-        return int((done / total) * 100)
+        return self.calculate_progress(self.status, self.sub_task_total or 0, self.sub_task_done or 0)
+
+    @classmethod
+    def adjust_sub_task_counters(cls, task_id: int, total: int = 0, done: int = 0):
+        """Atomically adjust a task's sub-task counters in the current transaction."""
+        if not total and not done:
+            return
+        db.session.execute(
+            update(cls).where(cls.id == task_id).values(
+                sub_task_total=cls.sub_task_total + total,
+                sub_task_done=cls.sub_task_done + done
+            )
+        )
 
     def to_dict(self, include_sub_tasks: bool = False, include_assigned_user: bool = False):
-        result = {
-            'id': self.id,
-            'team_id': self.team_id,
-            'title': self.title,
-            'description': self.description,
-            'status': self.status,
-            'assigned_user_id': self.assigned_user_id,
-            'progress': self.progress,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        result = TEAM_TASK_SERIALIZER.from_object(self)
+        result['progress'] = self.progress
         if include_assigned_user and self.assigned_user:
-            result['assigned_user'] = {
-                'id': self.assigned_user.id,
-                'name': self.assigned_user.name,
-                'email': self.assigned_user.email
-            }
+            result['assigned_user'] = USER_SUMMARY_SERIALIZER.from_object(self.assigned_user)
         if include_sub_tasks:
             result['sub_tasks'] = [st.to_dict() for st in self.sub_tasks.all()]
         return result
 
     def __repr__(self):
         return f'<TeamTask {self.title}>'
+
+
+@event.listens_for(Session, 'before_flush')
+def assign_positions(session, flush_context, instances):
+    """Append tasks to the end of their column when created or moved to
+    another status without an explicit position."""
+    tails = {}
+    for task in list(session.new) + list(session.dirty):
+        if not isinstance(task, TeamTask):
+            continue
+        if task in session.new:
+            if task.position is not None:
+                continue
+        else:
+            state = db.inspect(task)
+            if not state.attrs.status.history.has_changes() or state.attrs.position.history.has_changes():
+                continue
+
+        key = (task.team_id, task.status or TaskStatus.TODO.value)
+        if key not in tails:
+            tails[key] = session.execute(
+                select(func.max(TeamTask.position)).where(
+                    TeamTask.team_id == key[0],
+                    TeamTask.status == key[1]
+                )
+            ).scalar()
+        tails[key] = task.position = rank_after(tails[key])
+
+
+TEAM_TASK_SERIALIZER = ModelSerializer(TeamTask, exclude=('sub_task_total', 'sub_task_done'))
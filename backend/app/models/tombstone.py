@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Iterable, Optional
+from . import db
+
+
+class EntityType(str, Enum):
+    TEAM_TASK = 'team_task'
+    SUB_TASK = 'sub_task'
+
+
+class Tombstone(db.Model):
+    """Record of a deleted row, so delta-sync clients can drop it from their mirror."""
+    __tablename__ = 'tombstones'
+    __table_args__ = (
+        db.Index('ix_tombstones_team_deleted', 'team_id', 'deleted_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    entity_type = db.Column(db.String(20), nullable=False)
+    entity_id = db.Column(db.Integer, nullable=False)
+    parent_id = db.Column(db.Integer, nullable=True)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False)
+    deleted_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    @classmethod
+    def record(cls, team_id: int, entity_type: EntityType, entity_ids: Iterable[int],
+               parent_id: Optional[int] = None):
+        """Add tombstones for deleted rows to the current session."""
+        db.session.add_all([
+            cls(team_id=team_id, entity_type=entity_type.value, entity_id=entity_id, parent_id=parent_id)
+            for entity_id in entity_ids
+        ])
+
+    def __repr__(self):
+        return f'<Tombstone {self.entity_type} {self.entity_id}>'
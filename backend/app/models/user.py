@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from enum import Enum
-import bcrypt
+from flask import current_app
+from app.utils.serializers import ModelSerializer
 from . import db
 
 
@@ -34,30 +35,30 @@ class User(db.Model):
 
     def set_password(self, password: str):
         """Hash and set the user's password."""
-        salt = bcrypt.gensalt()
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        self.password_hash = current_app.extensions['password_hasher'].hash(password)
 
     def check_password(self, password: str) -> bool:
         """Verify password against stored hash."""
-        return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+        return current_app.extensions['password_hasher'].verify(password, self.password_hash)
+
+    def password_needs_rehash(self) -> bool:
+        """Check if the stored hash uses a different bcrypt cost than configured."""
+        return current_app.extensions['password_hasher'].needs_rehash(self.password_hash)
 
     def is_admin(self) -> bool:
         """Check if user has admin role."""
         return self.role == UserRole.ADMIN.value
 
     def to_dict(self, include_team: bool = False):
-        result = {
-            'id': self.id,
-            'name': self.name,
-            'email': self.email,
-            'role': self.role,
-            'team_id': self.team_id,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        result = USER_SERIALIZER.from_object(self)
         if include_team and self.team:
             result['team'] = self.team.to_dict()
         return result
 
     def __repr__(self):
         return f'<User {self.email}>'
+
+
+USER_SERIALIZER = ModelSerializer(User, exclude=('password_hash',))
+# Compact form embedded in tasks and sub-tasks
+USER_SUMMARY_SERIALIZER = ModelSerializer(User, fields=('id', 'name', 'email'))
@@ -1,19 +1,15 @@
-from flask import request
+from flask import current_app, request
 from flask_jwt_extended import (
     create_access_token,
     jwt_required,
-    get_jwt_identity,
     get_jwt
 )
 from app.models import db, User, Team
 from app.utils.responses import success_response, error_response
 from app.utils.validators import validate_email, validate_password, validate_name
+from app.utils.decorators import get_current_user_or_error
 from . import auth_bp
 
-# Store for revoked tokens (in production, use Redis or database)
-revoked_tokens = set()
-
-
 @auth_bp.route('/register', methods=['POST'])
 def register():
     """Register a new user."""
@@ -92,6 +88,11 @@ def login():
     if not user or not user.check_password(password):
         return error_response('Invalid email or password', 401)
 
+    # Transparently upgrade hashes made with a different bcrypt cost
+    if user.password_needs_rehash():
+        user.set_password(password)
+        db.session.commit()
+
     access_token = create_access_token(identity=str(user.id))
 
     return success_response({
@@ -104,8 +105,8 @@ def login():
 @jwt_required()
 def logout():
     """Logout user by revoking their token."""
-    jti = get_jwt()['jti']
-    revoked_tokens.add(jti)
+    jwt_payload = get_jwt()
+    current_app.extensions['token_blocklist'].revoke(jwt_payload['jti'], jwt_payload.get('exp'))
     return success_response(message='Logout successful')
 
 
@@ -113,14 +114,12 @@ def logout():
 @jwt_required()
 def get_current_user():
     """Get current authenticated user."""
-    user_id = get_jwt_identity()
-    user = User.query.get(int(user_id))
-    if not user:
-        return error_response('User not found', 404)
+    user, error = get_current_user_or_error()
+    if error:
+        return error
     return success_response(user.to_dict(include_team=True))
 
 
 def is_token_revoked(jwt_header, jwt_payload):
     """Check if token is revoked."""
-    jti = jwt_payload['jti']
-    return jti in revoked_tokens
+    return current_app.extensions['token_blocklist'].is_revoked(jwt_payload['jti'], jwt_payload.get('exp'))
@@ -0,0 +1,19 @@
+import logging
+from sqlalchemy.exc import SQLAlchemyError
+from app.services.database import check_database, pool_status
+from app.models import db
+from app.utils.responses import success_response, error_response
+from . import health_bp
+
+logger = logging.getLogger('taskish.health')
+
+
+@health_bp.route('/db', methods=['GET'])
+def database_health():
+    """Check database connectivity and report connection pool usage."""
+    try:
+        status = check_database()
+    except SQLAlchemyError:
+        logger.exception('Database health check failed')
+        return error_response('Database unavailable', 503, pool_status(db.engine))
+    return success_response(status)
@@ -1,76 +1,99 @@
 import logging
-import os
-from flask import request
+from flask import current_app, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime
+from sqlalchemy import func
 from app.models import db, User, PrivateTodo
-from app.models.private_todo import TodoStatus
-from app.utils.responses import success_response, error_response
+from app.models.private_todo import TodoStatus, PRIVATE_TODO_SERIALIZER
+from app.utils.responses import (
+    success_response, error_response, not_modified, wants_stream, stream_success_response,
+    download_response
+)
 from app.utils.validators import validate_title, validate_status
+from app.utils.log import log_context
+from app.utils.pagination import keyset_order, keyset_paginate, parse_page_args, parse_timestamp
+from app.services import transfer
+from app.services.transfer import EXPORT_FORMATS, ImportFormatError
 from . import private_todos_bp
 
-# Set up logging for todo creation
-log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
-os.makedirs(log_dir, exist_ok=True)
-log_file = os.path.join(log_dir, 'todo_creation.log')
-
-todo_logger = logging.getLogger('todo_creation')
-todo_logger.setLevel(logging.DEBUG)
-file_handler = logging.FileHandler(log_file)
-file_handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(formatter)
-todo_logger.addHandler(file_handler)
+logger = logging.getLogger('taskish.private_todos')
 
 
 @private_todos_bp.route('', methods=['GET'])
 @jwt_required()
 def get_private_todos():
-    """Get all private todos for the current user."""
+    """Get a page of private todos for the current user.
+
+    Supports keyset pagination (limit, cursor) and status and updated_since
+    filters. With stream=1 every matching todo is streamed in one
+    unpaginated response instead.
+    """
     user_id = int(get_jwt_identity())
-    todos = PrivateTodo.query.filter_by(owner_user_id=user_id).order_by(PrivateTodo.created_at.desc()).all()
-    return success_response([todo.to_dict() for todo in todos])
+
+    limit, cursor, msg = parse_page_args(request.args)
+    if msg:
+        return error_response(msg, 400)
+
+    query = db.session.query(*PRIVATE_TODO_SERIALIZER.columns).filter(PrivateTodo.owner_user_id == user_id)
+
+    status = request.args.get('status')
+    if status:
+        valid_statuses = [s.value for s in TodoStatus]
+        valid, msg = validate_status(status, valid_statuses)
+        if not valid:
+            return error_response(msg, 400)
+        query = query.filter(PrivateTodo.status == status)
+
+    updated_since = request.args.get('updated_since')
+    if updated_since:
+        try:
+            query = query.filter(PrivateTodo.updated_at >= parse_timestamp(updated_since))
+        except ValueError:
+            return error_response('Invalid updated_since format', 400)
+
+    version = db.session.query(
+        func.count(PrivateTodo.id),
+        func.max(PrivateTodo.updated_at)
+    ).filter(PrivateTodo.owner_user_id == user_id).one()
+    cached = not_modified('todos', user_id, *version)
+    if cached:
+        return cached
+
+    keyset = [PrivateTodo.created_at, PrivateTodo.id]
+    if wants_stream(request.args):
+        batch_size = current_app.config['STREAM_BATCH_SIZE']
+        rows = query.order_by(*keyset_order(keyset)).yield_per(batch_size)
+        return stream_success_response(rows, PRIVATE_TODO_SERIALIZER.from_row)
+
+    try:
+        todos, next_cursor = keyset_paginate(query, keyset, limit, cursor)
+    except ValueError as e:
+        return error_response(str(e), 400)
+
+    return success_response([PRIVATE_TODO_SERIALIZER.from_row(row) for row in todos], meta={'next_cursor': next_cursor, 'limit': limit})
 
 
 @private_todos_bp.route('', methods=['POST'])
 @jwt_required()
 def create_private_todo():
     """Create a new private todo."""
-    todo_logger.info("="*50)
-    todo_logger.info("CREATE_PRIVATE_TODO called")
-    todo_logger.info(f"Request method: {request.method}")
-    todo_logger.info(f"Request URL: {request.url}")
-    todo_logger.info(f"Request headers: {dict(request.headers)}")
-
     try:
         user_id = int(get_jwt_identity())
-        todo_logger.info(f"User ID from JWT: {user_id}")
 
         data = request.get_json()
-        todo_logger.info(f"Request JSON data: {data}")
-        todo_logger.info(f"Request raw data: {request.data}")
-
         if not data:
-            todo_logger.error("No request body provided")
             return error_response('Request body is required', 400)
 
         # Validate title
-        title_value = data.get('title', '')
-        todo_logger.info(f"Title value: '{title_value}'")
-        valid, msg = validate_title(title_value)
-        todo_logger.info(f"Title validation: valid={valid}, msg={msg}")
+        valid, msg = validate_title(data.get('title', ''))
         if not valid:
-            todo_logger.error(f"Title validation failed: {msg}")
             return error_response(msg, 400)
 
         # Validate status if provided
         status = data.get('status', TodoStatus.TODO.value)
-        todo_logger.info(f"Status value: '{status}'")
         valid_statuses = [s.value for s in TodoStatus]
         valid, msg = validate_status(status, valid_statuses)
-        todo_logger.info(f"Status validation: valid={valid}, msg={msg}")
         if not valid:
-            todo_logger.error(f"Status validation failed: {msg}")
             return error_response(msg, 400)
 
         # Parse due date if provided
@@ -78,13 +101,9 @@ def create_private_todo():
         if data.get('due_date'):
             try:
                 due_date = datetime.fromisoformat(data['due_date'].replace('Z', '+00:00'))
-                todo_logger.info(f"Parsed due_date: {due_date}")
-            except ValueError as e:
-                todo_logger.error(f"Invalid due_date format: {e}")
+            except ValueError:
                 return error_response('Invalid due_date format', 400)
 
-        todo_logger.info(f"Creating PrivateTodo with: owner_user_id={user_id}, title={data['title']}, description={data.get('description')}, status={status}, due_date={due_date}")
-
         todo = PrivateTodo(
             owner_user_id=user_id,
             title=data['title'],
@@ -93,26 +112,52 @@ def create_private_todo():
             due_date=due_date
         )
 
-        todo_logger.info(f"Todo object created: {todo}")
-
         db.session.add(todo)
-        todo_logger.info("Todo added to session")
-
         db.session.commit()
-        todo_logger.info(f"Todo committed to database, id={todo.id}")
+        log_context(user_id=user_id, todo_id=todo.id)
 
-        result = todo.to_dict()
-        todo_logger.info(f"Todo dict result: {result}")
-        todo_logger.info("CREATE_PRIVATE_TODO completed successfully")
-
-        return success_response(result, 'Todo created successfully', 201)
+        return success_response(todo.to_dict(), 'Todo created successfully', 201)
 
     except Exception as e:
-        todo_logger.exception(f"Exception in create_private_todo: {str(e)}")
+        logger.exception('create_private_todo failed')
         db.session.rollback()
         return error_response(f'Internal error: {str(e)}', 500)
 
 
+@private_todos_bp.route('/export', methods=['GET'])
+@jwt_required()
+def export_private_todos():
+    """Download the current user's todos as NDJSON (default) or CSV (?format=csv)."""
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in EXPORT_FORMATS:
+        return error_response(f"format must be one of: {', '.join(EXPORT_FORMATS)}", 400)
+
+    chunks = transfer.export_private_todos(
+        int(get_jwt_identity()), fmt, current_app.config['STREAM_BATCH_SIZE']
+    )
+    return download_response(chunks, f'private-todos.{fmt}', EXPORT_FORMATS[fmt])
+
+
+@private_todos_bp.route('/import', methods=['POST'])
+@jwt_required()
+def import_private_todos():
+    """Bulk import todos from an NDJSON or CSV export, skipping and reporting invalid lines."""
+    user_id = int(get_jwt_identity())
+    try:
+        stream, fmt = transfer.open_upload(request)
+        result = transfer.import_private_todos(
+            stream, fmt, user_id,
+            current_app.config['IMPORT_CHUNK_SIZE'], current_app.config['IMPORT_MAX_ERRORS']
+        )
+    except ImportFormatError as e:
+        db.session.rollback()
+        return error_response(str(e), 400)
+
+    log_context(user_id=user_id)
+    logger.info('Imported %d todos, skipped %d', result['created']['private_todos'], result['skipped'])
+    return success_response(result, 'Import finished')
+
+
 @private_todos_bp.route('/<int:todo_id>', methods=['GET'])
 @jwt_required()
 def get_private_todo(todo_id):
@@ -0,0 +1,34 @@
+from flask import request
+from flask_jwt_extended import jwt_required
+from app.services.search import search
+from app.utils.decorators import get_current_user_or_error
+from app.utils.pagination import parse_page_args
+from app.utils.responses import success_response, error_response
+from . import search_bp
+
+
+@search_bp.route('', methods=['GET'])
+@jwt_required()
+def search_items():
+    """Search the current user's team tasks, sub-tasks and private todos.
+
+    Takes q plus keyset pagination (limit, cursor); results are ranked best match first.
+    """
+    user, error = get_current_user_or_error()
+    if error:
+        return error
+
+    q = request.args.get('q', '').strip()
+    if not q:
+        return error_response('q is required', 400)
+
+    limit, cursor, msg = parse_page_args(request.args)
+    if msg:
+        return error_response(msg, 400)
+
+    try:
+        results, next_cursor = search(q, user.team_id, user.id, limit, cursor)
+    except ValueError as e:
+        return error_response(str(e), 400)
+
+    return success_response(results, meta={'next_cursor': next_cursor, 'limit': limit})
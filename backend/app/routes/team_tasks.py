@@ -1,37 +1,39 @@
 import logging
-import os
-from datetime import datetime
-from flask import request
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from app.models import db, User, TeamTask, SubTask
+from datetime import timedelta
+from flask import Response, current_app, request
+from flask_jwt_extended import jwt_required
+from app.models import db, User, TeamTask, SubTask, Tombstone
 from app.models.team_task import TaskStatus
 from app.models.sub_task import SubTaskStatus
-from app.utils.responses import success_response, error_response
-from app.utils.decorators import admin_required
+from app.models.tombstone import EntityType
+from app.utils.responses import (
+    success_response, error_response, not_modified, wants_stream, stream_success_response,
+    download_response
+)
+from app.utils.decorators import admin_required, get_current_user_or_error
 from app.utils.validators import validate_title, validate_status
+from app.utils.log import log_context
+from app.utils.pagination import parse_page_args, parse_timestamp
+from app.services.board import (
+    BOARD_SORTS, load_board, board_version, task_version,
+    stream_board, serialize_board_row, stream_sub_tasks, serialize_sub_task_row
+)
+from app.services.batch import parse_batch, apply_task_batch, apply_sub_task_batch
+from app.services.sync import load_changes, tombstone_cutoff
+from app.services.events import publish_event
+from app.services.ordering import MoveConflict, move_task
+from app.services import transfer
+from app.services.archive import load_archive
+from app.services.transfer import EXPORT_FORMATS, ImportFormatError
 from . import team_tasks_bp
 
-# Set up logging for task creation
-log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
-os.makedirs(log_dir, exist_ok=True)
-log_file = os.path.join(log_dir, 'task_creation.log')
+logger = logging.getLogger('taskish.team_tasks')
 
-task_logger = logging.getLogger('task_creation')
-task_logger.setLevel(logging.DEBUG)
-file_handler = logging.FileHandler(log_file)
-file_handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(formatter)
-task_logger.addHandler(file_handler)
 
-
-def get_current_user_or_error():
-    """Helper to get current user and return error if not found."""
-    user_id = int(get_jwt_identity())
-    user = User.query.get(user_id)
-    if not user:
-        return None, error_response('User not found', 404)
-    return user, None
+def done_delta(old_status, new_status):
+    """Change in a task's done sub-task count when a sub-task's status changes."""
+    done = SubTaskStatus.DONE.value
+    return int(new_status == done) - int(old_status == done)
 
 
 def check_team_access(user, task):
@@ -46,7 +48,13 @@ def check_team_access(user, task):
 @team_tasks_bp.route('', methods=['GET'])
 @jwt_required()
 def get_team_tasks():
-    """Get all team tasks for the current user's team."""
+    """Get a page of team tasks for the current user's team.
+
+    Supports keyset pagination (limit, cursor), status, assigned_user_id
+    and updated_since filters, and sort=created (newest first, default) or
+    sort=position (board order). With stream=1 every matching task is
+    streamed in one unpaginated response instead.
+    """
     user, error = get_current_user_or_error()
     if error:
         return error
@@ -54,8 +62,54 @@ def get_team_tasks():
     if not user.team_id:
         return error_response('User is not in a team', 400)
 
-    tasks = TeamTask.query.filter_by(team_id=user.team_id).order_by(TeamTask.created_at.desc()).all()
-    return success_response([task.to_dict(include_assigned_user=True) for task in tasks])
+    limit, cursor, msg = parse_page_args(request.args)
+    if msg:
+        return error_response(msg, 400)
+
+    status = request.args.get('status')
+    if status:
+        valid_statuses = [s.value for s in TaskStatus]
+        valid, msg = validate_status(status, valid_statuses)
+        if not valid:
+            return error_response(msg, 400)
+
+    assigned_user_id = request.args.get('assigned_user_id')
+    if assigned_user_id is not None:
+        try:
+            assigned_user_id = int(assigned_user_id)
+        except ValueError:
+            return error_response('assigned_user_id must be an integer', 400)
+
+    updated_since = request.args.get('updated_since')
+    if updated_since:
+        try:
+            updated_since = parse_timestamp(updated_since)
+        except ValueError:
+            return error_response('Invalid updated_since format', 400)
+
+    sort = request.args.get('sort', 'created')
+    if sort not in BOARD_SORTS:
+        return error_response(f"sort must be one of: {', '.join(BOARD_SORTS)}", 400)
+
+    cached = not_modified(*board_version(user.team_id))
+    if cached:
+        return cached
+
+    filters = {
+        'status': status,
+        'assigned_user_id': assigned_user_id,
+        'updated_since': updated_since or None,
+    }
+    if wants_stream(request.args):
+        rows = stream_board(user.team_id, current_app.config['STREAM_BATCH_SIZE'], sort=sort, **filters)
+        return stream_success_response(rows, serialize_board_row)
+
+    try:
+        tasks, next_cursor = load_board(user.team_id, limit, cursor=cursor, sort=sort, **filters)
+    except ValueError as e:
+        return error_response(str(e), 400)
+
+    return success_response(tasks, meta={'next_cursor': next_cursor, 'limit': limit})
 
 
 @team_tasks_bp.route('', methods=['POST'])
@@ -63,61 +117,34 @@ def get_team_tasks():
 @admin_required
 def create_team_task():
     """Create a new team task (Admin only)."""
-    task_logger.info("="*50)
-    task_logger.info("CREATE_TEAM_TASK called")
-    task_logger.info(f"Request method: {request.method}")
-    task_logger.info(f"Request URL: {request.url}")
-    task_logger.info(f"Request headers: {dict(request.headers)}")
-
     try:
         user, error = get_current_user_or_error()
-        task_logger.info(f"User lookup result: user={user}, error={error}")
         if error:
-            task_logger.error(f"User lookup failed, returning error: {error}")
             return error
 
-        task_logger.info(f"Current user: id={user.id}, email={user.email}, role={user.role}, team_id={user.team_id}")
-
         data = request.get_json()
-        task_logger.info(f"Request JSON data: {data}")
-        task_logger.info(f"Request raw data: {request.data}")
-
         if not data:
-            task_logger.error("No request body provided")
             return error_response('Request body is required', 400)
 
         # Validate title
-        title_value = data.get('title', '')
-        task_logger.info(f"Title value: '{title_value}'")
-        valid, msg = validate_title(title_value)
-        task_logger.info(f"Title validation: valid={valid}, msg={msg}")
+        valid, msg = validate_title(data.get('title', ''))
         if not valid:
-            task_logger.error(f"Title validation failed: {msg}")
             return error_response(msg, 400)
 
         # Validate status if provided
         status = data.get('status', TaskStatus.TODO.value)
-        task_logger.info(f"Status value: '{status}'")
         valid_statuses = [s.value for s in TaskStatus]
-        task_logger.info(f"Valid statuses: {valid_statuses}")
         valid, msg = validate_status(status, valid_statuses)
-        task_logger.info(f"Status validation: valid={valid}, msg={msg}")
         if not valid:
-            task_logger.error(f"Status validation failed: {msg}")
             return error_response(msg, 400)
 
         # Validate assigned user if provided
         assigned_user_id = data.get('assigned_user_id')
-        task_logger.info(f"Assigned user ID: {assigned_user_id}")
         if assigned_user_id:
             assigned_user = User.query.get(assigned_user_id)
-            task_logger.info(f"Assigned user lookup: {assigned_user}")
             if not assigned_user or assigned_user.team_id != user.team_id:
-                task_logger.error(f"Invalid assigned user: assigned_user={assigned_user}, user.team_id={user.team_id}")
                 return error_response('Invalid assigned user', 400)
 
-        task_logger.info(f"Creating TeamTask with: team_id={user.team_id}, title={data['title']}, description={data.get('description')}, status={status}, assigned_user_id={assigned_user_id}")
-
         task = TeamTask(
             team_id=user.team_id,
             title=data['title'],
@@ -126,26 +153,225 @@ def create_team_task():
             assigned_user_id=assigned_user_id
         )
 
-        task_logger.info(f"Task object created: {task}")
-
+        log_context(user_id=user.id, team_id=user.team_id)
         db.session.add(task)
-        task_logger.info("Task added to session")
-
         db.session.commit()
-        task_logger.info(f"Task committed to database, id={task.id}")
+        log_context(task_id=task.id)
 
         result = task.to_dict(include_assigned_user=True)
-        task_logger.info(f"Task dict result: {result}")
-        task_logger.info("CREATE_TEAM_TASK completed successfully")
-
+        publish_event(task.team_id, 'task.created', result)
         return success_response(result, 'Task created successfully', 201)
 
     except Exception as e:
-        task_logger.exception(f"Exception in create_team_task: {str(e)}")
+        logger.exception('create_team_task failed')
         db.session.rollback()
         return error_response(f'Internal error: {str(e)}', 500)
 
 
+@team_tasks_bp.route('/changes', methods=['GET'])
+@jwt_required()
+def get_team_task_changes():
+    """Get tasks and sub-tasks changed or deleted since a watermark.
+
+    Clients keep a local mirror by passing the watermark from the previous
+    response as `since`. Changes from the SYNC_OVERLAP_SECONDS before the
+    watermark are sent again, so none committed late are missed. Returns
+    410 if the watermark is older than the tombstone retention window and a
+    full resync is needed.
+    """
+    user, error = get_current_user_or_error()
+    if error:
+        return error
+
+    if not user.team_id:
+        return error_response('User is not in a team', 400)
+
+    overlap = timedelta(seconds=current_app.config['SYNC_OVERLAP_SECONDS'])
+    since = request.args.get('since')
+    if since:
+        try:
+            since = parse_timestamp(since)
+        except ValueError:
+            return error_response('Invalid since format', 400)
+        if since - overlap < tombstone_cutoff(current_app.config['TOMBSTONE_RETENTION_DAYS']):
+            return error_response('Watermark too old, full resync required', 410)
+
+    return success_response(load_changes(user.team_id, since or None, overlap))
+
+
+@team_tasks_bp.route('/stats', methods=['GET'])
+@jwt_required()
+def get_team_task_stats():
+    """Get per-status counts, overall progress and per-member workload for the board.
+
+    Computed with aggregate queries and cached per team until the next
+    board event, so dashboards do not need to download the board.
+    """
+    user, error = get_current_user_or_error()
+    if error:
+        return error
+
+    if not user.team_id:
+        return error_response('User is not in a team', 400)
+
+    return success_response(current_app.extensions['stats_cache'].get(user.team_id))
+
+
+@team_tasks_bp.route('/stream', methods=['GET'])
+@jwt_required(locations=['headers', 'query_string'])
+def stream_team_tasks():
+    """Stream live board events for the user's team as Server-Sent Events.
+
+    EventSource cannot send headers, so the token may also be passed as
+    ?jwt=<token>. Each connection holds a worker thread, so run gunicorn
+    with a threaded or async worker class when streams are enabled.
+    """
+    user, error = get_current_user_or_error()
+    if error:
+        return error
+
+    if not user.team_id:
+        return error_response('User is not in a team', 400)
+
+    broker = current_app.extensions['event_broker']
+    heartbeat = current_app.config['SSE_HEARTBEAT_SECONDS']
+    dumps = current_app.json.dumps
+    subscription = broker.subscribe(user.team_id)
+
+    def generate():
+        try:
+            yield f'retry: {heartbeat * 1000}\n\n'
+            while True:
+                event = subscription.get(timeout=heartbeat)
+                if subscription.overflowed:
+                    yield 'event: resync\ndata: {}\n\n'
+                    return
+                if event is None:
+                    yield ': heartbeat\n\n'
+                    continue
+                yield f"id: {event['id']}\nevent: {event['type']}\ndata: {dumps(event['data'])}\n\n"
+        finally:
+            broker.unsubscribe(subscription)
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
+@team_tasks_bp.route('/batch', methods=['POST'])
+@jwt_required()
+@admin_required
+def batch_team_tasks():
+    """Create, update and delete team tasks in one transaction (Admin only).
+
+    Body: {"create": [...], "update": [{"id": ..., ...}], "delete": [ids]}.
+    The whole batch is rejected if any item is invalid.
+    """
+    user, error = get_current_user_or_error()
+    if error:
+        return error
+
+    batch, msg = parse_batch(request.get_json(silent=True), current_app.config['BATCH_MAX_ITEMS'])
+    if msg:
+        return error_response(msg, 400)
+
+    team_id = user.team_id
+    results, errors = apply_task_batch(team_id, batch)
+    if errors:
+        return error_response('Validation failed', 400, errors)
+
+    for task in results['created']:
+        publish_event(team_id, 'task.created', task)
+    for task in results['updated']:
+        publish_event(team_id, 'task.updated', task)
+    for task_id in results['deleted']:
+        publish_event(team_id, 'task.deleted', {'id': task_id})
+
+    return success_response(results, 'Batch applied successfully')
+
+
+@team_tasks_bp.route('/export', methods=['GET'])
+@jwt_required()
+def export_team_tasks():
+    """Download the team's tasks with their sub-tasks as NDJSON (default) or CSV (?format=csv)."""
+    user, error = get_current_user_or_error()
+    if error:
+        return error
+
+    if not user.team_id:
+        return error_response('User is not in a team', 400)
+
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in EXPORT_FORMATS:
+        return error_response(f"format must be one of: {', '.join(EXPORT_FORMATS)}", 400)
+
+    chunks = transfer.export_team_tasks(user.team_id, fmt, current_app.config['STREAM_BATCH_SIZE'])
+    return download_response(chunks, f'team-tasks.{fmt}', EXPORT_FORMATS[fmt])
+
+
+@team_tasks_bp.route('/import', methods=['POST'])
+@jwt_required()
+@admin_required
+def import_team_tasks():
+    """Bulk import tasks and sub-tasks from an NDJSON or CSV export (Admin only).
+
+    The file is read and inserted in chunks of IMPORT_CHUNK_SIZE rows, each
+    committed on its own; invalid records are skipped and reported by line.
+    Imported tasks are appended to their status columns.
+    """
+    user, error = get_current_user_or_error()
+    if error:
+        return error
+
+    if not user.team_id:
+        return error_response('User is not in a team', 400)
+
+    try:
+        stream, fmt = transfer.open_upload(request)
+        result = transfer.import_team_tasks(
+            stream, fmt, user.team_id,
+            current_app.config['IMPORT_CHUNK_SIZE'], current_app.config['IMPORT_MAX_ERRORS']
+        )
+    except ImportFormatError as e:
+        db.session.rollback()
+        return error_response(str(e), 400)
+
+    if result['created']['team_tasks']:
+        publish_event(user.team_id, 'tasks.imported', result['created'])
+    logger.info('Imported %d tasks and %d sub-tasks, skipped %d',
+                result['created']['team_tasks'], result['created']['sub_tasks'], result['skipped'])
+    return success_response(result, 'Import finished')
+
+
+@team_tasks_bp.route('/archive', methods=['GET'])
+@jwt_required()
+def get_archived_team_tasks():
+    """Get a page of the team's archived tasks, with their sub-tasks.
+
+    Archived tasks are DONE tasks moved off the board by the archiving job;
+    they are read-only. Keyset paginated (limit, cursor), most recently
+    updated first.
+    """
+    user, error = get_current_user_or_error()
+    if error:
+        return error
+
+    if not user.team_id:
+        return error_response('User is not in a team', 400)
+
+    limit, cursor, msg = parse_page_args(request.args)
+    if msg:
+        return error_response(msg, 400)
+
+    try:
+        tasks, next_cursor = load_archive(user.team_id, limit, cursor=cursor)
+    except ValueError as e:
+        return error_response(str(e), 400)
+
+    return success_response(tasks, meta={'next_cursor': next_cursor, 'limit': limit})
+
+
 @team_tasks_bp.route('/<int:task_id>', methods=['GET'])
 @jwt_required()
 def get_team_task(task_id):
@@ -162,6 +388,10 @@ def get_team_task(task_id):
     if error:
         return error
 
+    cached = not_modified(*task_version(task))
+    if cached:
+        return cached
+
     return success_response(task.to_dict(include_sub_tasks=True, include_assigned_user=True))
 
 
@@ -211,7 +441,9 @@ def update_team_task(task_id):
 
     db.session.commit()
 
-    return success_response(task.to_dict(include_assigned_user=True), 'Task updated successfully')
+    result = task.to_dict(include_assigned_user=True)
+    publish_event(task.team_id, 'task.updated', result)
+    return success_response(result, 'Task updated successfully')
 
 
 @team_tasks_bp.route('/<int:task_id>/status', methods=['PATCH'])
@@ -246,7 +478,64 @@ def update_team_task_status(task_id):
     task.status = data['status']
     db.session.commit()
 
-    return success_response(task.to_dict(include_assigned_user=True), 'Status updated successfully')
+    result = task.to_dict(include_assigned_user=True)
+    publish_event(task.team_id, 'task.status_changed', result)
+    return success_response(result, 'Status updated successfully')
+
+
+@team_tasks_bp.route('/<int:task_id>/move', methods=['PATCH'])
+@jwt_required()
+def move_team_task(task_id):
+    """Move a task within or between board columns (assigned user or admin).
+
+    Body: status, plus optional after_id and/or before_id naming the tasks
+    it should sit between; with neither it goes to the end of the column.
+    Only the moved task's row is written.
+    """
+    user, error = get_current_user_or_error()
+    if error:
+        return error
+
+    task = TeamTask.query.get(task_id)
+    if not task:
+        return error_response('Task not found', 404)
+
+    error = check_team_access(user, task)
+    if error:
+        return error
+
+    if not user.is_admin() and task.assigned_user_id != user.id:
+        return error_response('Only the assigned user or admin can move a task', 403)
+
+    data = request.get_json()
+    if not data:
+        return error_response('Request body is required', 400)
+
+    status = data.get('status', task.status)
+    valid_statuses = [s.value for s in TaskStatus]
+    valid, msg = validate_status(status, valid_statuses)
+    if not valid:
+        return error_response(msg, 400)
+
+    for field in ('before_id', 'after_id'):
+        if data.get(field) is not None and not isinstance(data[field], int):
+            return error_response(f'{field} must be an integer', 400)
+
+    try:
+        move_task(task, status, before_id=data.get('before_id'), after_id=data.get('after_id'))
+    except MoveConflict as e:
+        db.session.rollback()
+        current_app.extensions['rank_rebalancer'].schedule(task.team_id, status)
+        return error_response(str(e), 409)
+    except ValueError as e:
+        db.session.rollback()
+        return error_response(str(e), 400)
+    db.session.commit()
+    current_app.extensions['rank_rebalancer'].check(task.team_id, task.status, task.position)
+
+    result = task.to_dict(include_assigned_user=True)
+    publish_event(task.team_id, 'task.moved', result)
+    return success_response(result, 'Task moved successfully')
 
 
 @team_tasks_bp.route('/<int:task_id>/assign', methods=['PATCH'])
@@ -279,7 +568,9 @@ def assign_team_task(task_id):
     task.assigned_user_id = assigned_user_id
     db.session.commit()
 
-    return success_response(task.to_dict(include_assigned_user=True), 'Task assigned successfully')
+    result = task.to_dict(include_assigned_user=True)
+    publish_event(task.team_id, 'task.assigned', result)
+    return success_response(result, 'Task assigned successfully')
 
 
 @team_tasks_bp.route('/<int:task_id>', methods=['DELETE'])
@@ -299,9 +590,14 @@ def delete_team_task(task_id):
     if error:
         return error
 
+    sub_task_ids = [st_id for (st_id,) in db.session.query(SubTask.id).filter_by(team_task_id=task.id)]
+    team_id = task.team_id
+    Tombstone.record(team_id, EntityType.TEAM_TASK, [task.id])
+    Tombstone.record(team_id, EntityType.SUB_TASK, sub_task_ids, parent_id=task.id)
     db.session.delete(task)
     db.session.commit()
 
+    publish_event(team_id, 'task.deleted', {'id': task_id})
     return success_response(message='Task deleted successfully')
 
 
@@ -310,7 +606,7 @@ def delete_team_task(task_id):
 @team_tasks_bp.route('/<int:task_id>/sub-tasks', methods=['GET'])
 @jwt_required()
 def get_sub_tasks(task_id):
-    """Get all sub-tasks for a team task."""
+    """Get all sub-tasks for a team task (stream=1 streams them)."""
     user, error = get_current_user_or_error()
     if error:
         return error
@@ -323,6 +619,14 @@ def get_sub_tasks(task_id):
     if error:
         return error
 
+    cached = not_modified(*task_version(task))
+    if cached:
+        return cached
+
+    if wants_stream(request.args):
+        rows = stream_sub_tasks(task.id, current_app.config['STREAM_BATCH_SIZE'])
+        return stream_success_response(rows, serialize_sub_task_row)
+
     sub_tasks = SubTask.query.filter_by(team_task_id=task_id).order_by(SubTask.created_at.asc()).all()
     return success_response([st.to_dict() for st in sub_tasks])
 
@@ -375,9 +679,48 @@ def create_sub_task(task_id):
     )
 
     db.session.add(sub_task)
+    TeamTask.adjust_sub_task_counters(task_id, 1, int(status == SubTaskStatus.DONE.value))
     db.session.commit()
 
-    return success_response(sub_task.to_dict(), 'Sub-task created successfully', 201)
+    result = sub_task.to_dict()
+    publish_event(task.team_id, 'sub_task.created', result)
+    return success_response(result, 'Sub-task created successfully', 201)
+
+
+@team_tasks_bp.route('/<int:task_id>/sub-tasks/batch', methods=['POST'])
+@jwt_required()
+@admin_required
+def batch_sub_tasks(task_id):
+    """Create, update and delete sub-tasks of a task in one transaction (Admin only)."""
+    user, error = get_current_user_or_error()
+    if error:
+        return error
+
+    task = TeamTask.query.get(task_id)
+    if not task:
+        return error_response('Task not found', 404)
+
+    error = check_team_access(user, task)
+    if error:
+        return error
+
+    batch, msg = parse_batch(request.get_json(silent=True), current_app.config['BATCH_MAX_ITEMS'])
+    if msg:
+        return error_response(msg, 400)
+
+    team_id = task.team_id
+    results, errors = apply_sub_task_batch(task, batch)
+    if errors:
+        return error_response('Validation failed', 400, errors)
+
+    for sub_task in results['created']:
+        publish_event(team_id, 'sub_task.created', sub_task)
+    for sub_task in results['updated']:
+        publish_event(team_id, 'sub_task.updated', sub_task)
+    for sub_task_id in results['deleted']:
+        publish_event(team_id, 'sub_task.deleted', {'id': sub_task_id, 'team_task_id': task_id})
+
+    return success_response(results, 'Batch applied successfully')
 
 
 @team_tasks_bp.route('/<int:task_id>/sub-tasks/<int:sub_task_id>', methods=['PUT'])
@@ -416,6 +759,7 @@ def update_sub_task(task_id, sub_task_id):
         valid, msg = validate_status(data['status'], valid_statuses)
         if not valid:
             return error_response(msg, 400)
+        TeamTask.adjust_sub_task_counters(task_id, done=done_delta(sub_task.status, data['status']))
         sub_task.status = data['status']
 
     if 'responsible_user_id' in data:
@@ -427,7 +771,9 @@ def update_sub_task(task_id, sub_task_id):
 
     db.session.commit()
 
-    return success_response(sub_task.to_dict(), 'Sub-task updated successfully')
+    result = sub_task.to_dict()
+    publish_event(task.team_id, 'sub_task.updated', result)
+    return success_response(result, 'Sub-task updated successfully')
 
 
 @team_tasks_bp.route('/<int:task_id>/sub-tasks/<int:sub_task_id>/status', methods=['PATCH'])
@@ -463,10 +809,13 @@ def update_sub_task_status(task_id, sub_task_id):
     if not valid:
         return error_response(msg, 400)
 
+    TeamTask.adjust_sub_task_counters(task_id, done=done_delta(sub_task.status, data['status']))
     sub_task.status = data['status']
     db.session.commit()
 
-    return success_response(sub_task.to_dict(), 'Status updated successfully')
+    result = sub_task.to_dict()
+    publish_event(task.team_id, 'sub_task.status_changed', result)
+    return success_response(result, 'Status updated successfully')
 
 
 @team_tasks_bp.route('/<int:task_id>/sub-tasks/<int:sub_task_id>', methods=['DELETE'])
@@ -490,7 +839,11 @@ def delete_sub_task(task_id, sub_task_id):
     if not sub_task or sub_task.team_task_id != task_id:
         return error_response('Sub-task not found', 404)
 
+    team_id = task.team_id
+    Tombstone.record(team_id, EntityType.SUB_TASK, [sub_task.id], parent_id=task.id)
+    TeamTask.adjust_sub_task_counters(task_id, -1, -int(sub_task.status == SubTaskStatus.DONE.value))
     db.session.delete(sub_task)
     db.session.commit()
 
+    publish_event(team_id, 'sub_task.deleted', {'id': sub_task_id, 'team_task_id': task_id})
     return success_response(message='Sub-task deleted successfully')
@@ -1,6 +1,7 @@
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 from app.models import User, Team
 from app.utils.responses import success_response, error_response
+from app.utils.decorators import get_current_user_or_error
 from . import users_bp
 
 
@@ -8,11 +9,9 @@ from . import users_bp
 @jwt_required()
 def get_team_users(team_id):
     """Get all users in a team (for assignment dropdowns)."""
-    user_id = get_jwt_identity()
-    current_user = User.query.get(user_id)
-
-    if not current_user:
-        return error_response('User not found', 404)
+    current_user, error = get_current_user_or_error()
+    if error:
+        return error
 
     # Check if user belongs to the team
     if current_user.team_id != team_id:
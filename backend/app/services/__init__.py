@@ -0,0 +1,3 @@
+from .board import load_board, repair_sub_task_counters
+
+__all__ = ['load_board', 'repair_sub_task_counters']
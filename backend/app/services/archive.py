@@ -0,0 +1,203 @@
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import DateTime, delete, insert, literal, select
+from app.models import db, TeamTask, SubTask, Tombstone, ArchivedTeamTask, ArchivedSubTask
+from app.models.archive import ARCHIVED_TEAM_TASK_SERIALIZER, ARCHIVED_SUB_TASK_SERIALIZER
+from app.models.team_task import TaskStatus
+from app.models.tombstone import EntityType
+from app.services.events import publish_event
+from app.utils.pagination import keyset_paginate
+
+logger = logging.getLogger('taskish.archive')
+
+ARCHIVE_KEYSET = (ArchivedTeamTask.updated_at, ArchivedTeamTask.id)
+
+_TASK_COLUMNS = [c.key for c in ArchivedTeamTask.__table__.columns if c.key != 'archived_at']
+_SUB_TASK_COLUMNS = [c.key for c in ArchivedSubTask.__table__.columns]
+
+
+def archive_cutoff(after_days: int) -> datetime:
+    """Tasks finished and untouched since before this are archived."""
+    return datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=after_days)
+
+
+def _archivable(cutoff: datetime):
+    return (TeamTask.status == TaskStatus.DONE.value, TeamTask.updated_at < cutoff)
+
+
+def _archive_batch(task_ids: List[int], cutoff: datetime, now: datetime) -> Tuple[Dict[int, List[int]], int]:
+    """Move one batch of tasks and their sub-tasks in the current transaction.
+
+    The DONE/age condition is checked again while copying, so a task
+    reopened since it was selected stays on the board. Returns the moved
+    task ids per team and the number of sub-tasks moved.
+    """
+    task_source = select(
+        *[getattr(TeamTask, c) for c in _TASK_COLUMNS], literal(now, DateTime)
+    ).where(TeamTask.id.in_(task_ids), *_archivable(cutoff))
+    db.session.execute(insert(ArchivedTeamTask).from_select(_TASK_COLUMNS + ['archived_at'], task_source))
+    moved = db.session.execute(
+        select(ArchivedTeamTask.team_id, ArchivedTeamTask.id).where(
+            ArchivedTeamTask.id.in_(task_ids), ArchivedTeamTask.archived_at == now
+        )
+    ).all()
+    if not moved:
+        return {}, 0
+
+    moved_ids = [task_id for _, task_id in moved]
+    sub_tasks = db.session.execute(
+        select(SubTask.id, SubTask.team_task_id).where(SubTask.team_task_id.in_(moved_ids))
+    ).all()
+    db.session.execute(insert(ArchivedSubTask).from_select(_SUB_TASK_COLUMNS, select(
+        *[getattr(SubTask, c) for c in _SUB_TASK_COLUMNS]
+    ).where(SubTask.team_task_id.in_(moved_ids))))
+
+    by_team = defaultdict(list)
+    for team_id, task_id in moved:
+        by_team[team_id].append(task_id)
+    team_of = {task_id: team_id for team_id, task_id in moved}
+    tombstones = [
+        {'team_id': team_id, 'entity_type': EntityType.TEAM_TASK.value, 'entity_id': task_id,
+         'parent_id': None, 'deleted_at': now}
+        for team_id, task_id in moved
+    ] + [
+        {'team_id': team_of[task_id], 'entity_type': EntityType.SUB_TASK.value, 'entity_id': sub_task_id,
+         'parent_id': task_id, 'deleted_at': now}
+        for sub_task_id, task_id in sub_tasks
+    ]
+    db.session.execute(insert(Tombstone), tombstones)
+
+    db.session.execute(delete(SubTask).where(SubTask.team_task_id.in_(moved_ids)))
+    db.session.execute(delete(TeamTask).where(TeamTask.id.in_(moved_ids)))
+    return by_team, len(sub_tasks)
+
+
+def archive_done_tasks(after_days: int, batch_size: int) -> Tuple[int, int]:
+    """Move DONE tasks not updated for `after_days` days, with their sub-tasks, into the archive.
+
+    Works through team_tasks in id order, one committed transaction per
+    batch of tasks, so locks are short and an interrupted run keeps what it
+    already moved. Archived rows get tombstones so delta-sync clients drop
+    them. Returns (tasks archived, sub-tasks archived).
+    """
+    cutoff = archive_cutoff(after_days)
+    tasks = sub_tasks = 0
+    last_id = 0
+    while True:
+        query = db.session.query(TeamTask.id).filter(
+            TeamTask.id > last_id, *_archivable(cutoff)
+        ).order_by(TeamTask.id).limit(batch_size)
+        if db.engine.dialect.name == 'postgresql':
+            # Leave rows being edited right now for the next run
+            query = query.with_for_update(skip_locked=True)
+        task_ids = [task_id for (task_id,) in query]
+        if not task_ids:
+            break
+        last_id = task_ids[-1]
+
+        try:
+            by_team, moved_sub_tasks = _archive_batch(task_ids, cutoff, datetime.now(timezone.utc).replace(tzinfo=None))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        for team_id, ids in by_team.items():
+            tasks += len(ids)
+            publish_event(team_id, 'tasks.archived', {'ids': ids})
+        sub_tasks += moved_sub_tasks
+    return tasks, sub_tasks
+
+
+def load_archive(team_id: int, limit: int, cursor: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+    """Return a page of a team's archived tasks, most recently finished first, with their sub-tasks."""
+    query = db.session.query(*ARCHIVED_TEAM_TASK_SERIALIZER.columns,
+                             ArchivedTeamTask.sub_task_total, ArchivedTeamTask.sub_task_done).filter(
+        ArchivedTeamTask.team_id == team_id
+    )
+    rows, next_cursor = keyset_paginate(query, ARCHIVE_KEYSET, limit, cursor)
+
+    sub_tasks = defaultdict(list)
+    if rows:
+        sub_rows = db.session.query(*ARCHIVED_SUB_TASK_SERIALIZER.columns).filter(
+            ArchivedSubTask.team_task_id.in_([row.id for row in rows])
+        ).order_by(ArchivedSubTask.id)
+        for row in sub_rows:
+            sub_tasks[row.team_task_id].append(ARCHIVED_SUB_TASK_SERIALIZER.from_row(row))
+
+    tasks = []
+    for row in rows:
+        task = ARCHIVED_TEAM_TASK_SERIALIZER.from_row(row)
+        task['progress'] = TeamTask.calculate_progress(row.status, row.sub_task_total, row.sub_task_done)
+        task['sub_tasks'] = sub_tasks[row.id]
+        tasks.append(task)
+    return tasks, next_cursor
+
+
+class TaskArchiver:
+    """Runs archive_done_tasks every ARCHIVE_INTERVAL seconds on a background thread.
+
+    Off by default (ARCHIVE_INTERVAL=0); `flask archive-tasks` from cron
+    does the same and is preferable with several workers. The thread is
+    started by a worker's first request rather than in create_app, so with
+    gunicorn's preload_app it runs in each worker instead of the master,
+    and CLI commands never start it. Workers running it at the same time
+    is safe, just wasteful. With EVENT_BACKEND=local the tasks.archived
+    events only reach clients of the worker that moved the tasks.
+    """
+
+    def __init__(self, app=None):
+        self._stop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.stop()
+        self.app = app
+        self.interval = app.config['ARCHIVE_INTERVAL']
+        app.extensions['task_archiver'] = self
+
+        if self.interval > 0 and app.config['ARCHIVE_AFTER_DAYS'] > 0:
+            app.before_request(self._ensure_thread)
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            # Threads do not survive fork, so a forked worker starts its own
+            if self._thread is None or not self._thread.is_alive():
+                self._stop = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._loop, args=(self.interval, self._stop), name='task-archiver', daemon=True
+                )
+                self._thread.start()
+
+    def stop(self):
+        """Stop the archiving thread, if running."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def run(self) -> Tuple[int, int]:
+        with self.app.app_context():
+            try:
+                tasks, sub_tasks = archive_done_tasks(
+                    self.app.config['ARCHIVE_AFTER_DAYS'], self.app.config['ARCHIVE_BATCH_SIZE']
+                )
+                logger.info('Archived %d tasks and %d sub-tasks', tasks, sub_tasks)
+                return tasks, sub_tasks
+            finally:
+                db.session.remove()
+
+    def _loop(self, interval, stop):
+        while not stop.wait(interval):
+            try:
+                self.run()
+            except Exception:
+                logger.exception('Archiving tasks failed')
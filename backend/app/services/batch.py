@@ -0,0 +1,242 @@
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import joinedload
+from app.models import db, User, TeamTask, SubTask, Tombstone
+from app.models.team_task import TaskStatus
+from app.models.sub_task import SubTaskStatus
+from app.models.tombstone import EntityType
+from app.utils.validators import is_id, validate_title, validate_status
+
+TASK_STATUSES = [s.value for s in TaskStatus]
+SUB_TASK_STATUSES = [s.value for s in SubTaskStatus]
+
+
+def parse_batch(data, max_items: int) -> Tuple[Optional[dict], Optional[str]]:
+    """Split a batch body into create/update/delete lists.
+
+    Returns (batch, error_message).
+    """
+    if not isinstance(data, dict):
+        return None, 'Request body is required'
+
+    batch = {}
+    for op in ('create', 'update', 'delete'):
+        items = data.get(op, [])
+        if not isinstance(items, list):
+            return None, f'{op} must be a list'
+        batch[op] = items
+
+    total = sum(len(items) for items in batch.values())
+    if total == 0:
+        return None, 'Batch is empty'
+    if total > max_items:
+        return None, f'Batch must contain at most {max_items} items'
+    return batch, None
+
+
+def _validate_fields(item, statuses: List[str], user_field: str, partial: bool) -> Dict[str, str]:
+    errors = {}
+    if not partial or 'title' in item:
+        valid, msg = validate_title(item.get('title', ''))
+        if not valid:
+            errors['title'] = msg
+    if 'status' in item:
+        valid, msg = validate_status(item['status'], statuses)
+        if not valid:
+            errors['status'] = msg
+    if item.get(user_field) is not None and not is_id(item[user_field]):
+        errors[user_field] = f'{user_field} must be an integer'
+    return errors
+
+
+def _validate_batch(batch, statuses: List[str], user_field: str, existing_ids) -> Dict[str, str]:
+    """Validate every item, returning errors keyed like 'create[0].title'."""
+    errors = {}
+
+    for i, item in enumerate(batch['create']):
+        if not isinstance(item, dict):
+            errors[f'create[{i}]'] = 'Item must be an object'
+            continue
+        for field, msg in _validate_fields(item, statuses, user_field, partial=False).items():
+            errors[f'create[{i}].{field}'] = msg
+
+    for i, item in enumerate(batch['update']):
+        if not isinstance(item, dict) or not is_id(item.get('id')):
+            errors[f'update[{i}].id'] = 'id is required'
+            continue
+        if item['id'] not in existing_ids:
+            errors[f'update[{i}].id'] = 'Not found'
+        for field, msg in _validate_fields(item, statuses, user_field, partial=True).items():
+            errors[f'update[{i}].{field}'] = msg
+
+    updated_ids = set(_ids(batch['update']))
+    for i, item_id in enumerate(batch['delete']):
+        if not is_id(item_id):
+            errors[f'delete[{i}]'] = 'Item must be an id'
+        elif item_id not in existing_ids:
+            errors[f'delete[{i}]'] = 'Not found'
+        elif item_id in updated_ids:
+            errors[f'delete[{i}]'] = 'Cannot update and delete the same item'
+
+    return errors
+
+
+def _check_users(batch, user_field: str, team_id: int, errors: Dict[str, str]):
+    """Check every referenced user belongs to the team with a single IN query."""
+    referenced = {
+        item[user_field]
+        for op in ('create', 'update')
+        for item in batch[op]
+        if isinstance(item, dict) and is_id(item.get(user_field))
+    }
+    if not referenced:
+        return
+
+    valid_ids = {
+        user_id for (user_id,) in db.session.query(User.id).filter(
+            User.id.in_(referenced),
+            User.team_id == team_id
+        )
+    }
+    for op in ('create', 'update'):
+        for i, item in enumerate(batch[op]):
+            if isinstance(item, dict) and is_id(item.get(user_field)) \
+                    and item[user_field] not in valid_ids:
+                errors[f'{op}[{i}].{user_field}'] = f'Invalid {user_field.replace("_id", "").replace("_", " ")}'
+
+
+def _ids(items) -> List[int]:
+    return [item['id'] for item in items if isinstance(item, dict) and is_id(item.get('id'))]
+
+
+def _commit_and_reload(model, objects, user_relationship):
+    """Commit, then refresh the given objects with their user in one query.
+
+    The commit expires them; loading them back from the database gives the
+    naive UTC timestamps the other endpoints return, rather than the
+    tz-aware Python defaults set before the flush, without a refresh query
+    per object.
+    """
+    db.session.flush()
+    ids = [obj.id for obj in objects]
+    db.session.commit()
+    if ids:
+        model.query.options(joinedload(user_relationship)).filter(model.id.in_(ids)).all()
+
+
+def apply_task_batch(team_id: int, batch: dict) -> Tuple[Optional[dict], Dict[str, str]]:
+    """Validate and apply a batch of team task changes in one transaction.
+
+    Returns (results, errors); nothing is written if any item is invalid.
+    """
+    wanted = set(_ids(batch['update'])) | {i for i in batch['delete'] if is_id(i)}
+    tasks = {}
+    if wanted:
+        tasks = {
+            task.id: task for task in TeamTask.query.filter(
+                TeamTask.id.in_(wanted),
+                TeamTask.team_id == team_id
+            )
+        }
+
+    errors = _validate_batch(batch, TASK_STATUSES, 'assigned_user_id', tasks.keys())
+    _check_users(batch, 'assigned_user_id', team_id, errors)
+    if errors:
+        return None, errors
+
+    created = [
+        TeamTask(
+            team_id=team_id,
+            title=item['title'],
+            description=item.get('description'),
+            status=item.get('status', TaskStatus.TODO.value),
+            assigned_user_id=item.get('assigned_user_id')
+        )
+        for item in batch['create']
+    ]
+    db.session.add_all(created)
+
+    updated = []
+    for item in batch['update']:
+        task = tasks[item['id']]
+        for field in ('title', 'description', 'status', 'assigned_user_id'):
+            if field in item:
+                setattr(task, field, item[field])
+        updated.append(task)
+
+    deleted = list(dict.fromkeys(batch['delete']))
+    if deleted:
+        for sub_task_id, task_id in db.session.query(SubTask.id, SubTask.team_task_id).filter(
+                SubTask.team_task_id.in_(deleted)):
+            Tombstone.record(team_id, EntityType.SUB_TASK, [sub_task_id], parent_id=task_id)
+        Tombstone.record(team_id, EntityType.TEAM_TASK, deleted)
+        SubTask.query.filter(SubTask.team_task_id.in_(deleted)).delete(synchronize_session=False)
+        TeamTask.query.filter(TeamTask.id.in_(deleted)).delete(synchronize_session=False)
+
+    _commit_and_reload(TeamTask, created + updated, TeamTask.assigned_user)
+    return {
+        'created': [task.to_dict(include_assigned_user=True) for task in created],
+        'updated': [task.to_dict(include_assigned_user=True) for task in updated],
+        'deleted': deleted
+    }, {}
+
+
+def apply_sub_task_batch(task: TeamTask, batch: dict) -> Tuple[Optional[dict], Dict[str, str]]:
+    """Validate and apply a batch of sub-task changes for one task in one transaction.
+
+    Returns (results, errors); nothing is written if any item is invalid.
+    """
+    wanted = set(_ids(batch['update'])) | {i for i in batch['delete'] if is_id(i)}
+    sub_tasks = {}
+    if wanted:
+        sub_tasks = {
+            sub_task.id: sub_task for sub_task in SubTask.query.filter(
+                SubTask.id.in_(wanted),
+                SubTask.team_task_id == task.id
+            )
+        }
+
+    errors = _validate_batch(batch, SUB_TASK_STATUSES, 'responsible_user_id', sub_tasks.keys())
+    _check_users(batch, 'responsible_user_id', task.team_id, errors)
+    if errors:
+        return None, errors
+
+    created = [
+        SubTask(
+            team_task_id=task.id,
+            title=item['title'],
+            status=item.get('status', SubTaskStatus.TODO.value),
+            responsible_user_id=item.get('responsible_user_id')
+        )
+        for item in batch['create']
+    ]
+    db.session.add_all(created)
+
+    done = SubTaskStatus.DONE.value
+    total_delta = len(created)
+    done_delta = sum(1 for sub_task in created if sub_task.status == done)
+
+    updated = []
+    for item in batch['update']:
+        sub_task = sub_tasks[item['id']]
+        was_done = sub_task.status == done
+        for field in ('title', 'status', 'responsible_user_id'):
+            if field in item:
+                setattr(sub_task, field, item[field])
+        done_delta += int(sub_task.status == done) - int(was_done)
+        updated.append(sub_task)
+
+    deleted = list(dict.fromkeys(batch['delete']))
+    if deleted:
+        total_delta -= len(deleted)
+        done_delta -= sum(1 for sub_task_id in deleted if sub_tasks[sub_task_id].status == done)
+        Tombstone.record(task.team_id, EntityType.SUB_TASK, deleted, parent_id=task.id)
+        SubTask.query.filter(SubTask.id.in_(deleted)).delete(synchronize_session=False)
+
+    TeamTask.adjust_sub_task_counters(task.id, total_delta, done_delta)
+
+    _commit_and_reload(SubTask, created + updated, SubTask.responsible_user)
+    return {
+        'created': [sub_task.to_dict() for sub_task in created],
+        'updated': [sub_task.to_dict() for sub_task in updated],
+        'deleted': deleted
+    }, {}
@@ -0,0 +1,167 @@
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import func, or_, select, update
+from app.models import db, User, TeamTask, SubTask
+from app.models.team_task import TEAM_TASK_SERIALIZER
+from app.models.sub_task import SubTaskStatus, SUB_TASK_SERIALIZER
+from app.utils.metrics import timed
+from app.utils.pagination import keyset_order, keyset_paginate
+
+
+def repair_sub_task_counters() -> int:
+    """Recompute every task's sub-task counters in bulk. Returns the number of tasks fixed.
+
+    A single UPDATE with correlated GROUP BY-style subqueries rewrites only the
+    rows whose stored counters have drifted from the sub_tasks table.
+    """
+    total = select(func.count(SubTask.id)).where(
+        SubTask.team_task_id == TeamTask.id
+    ).scalar_subquery()
+    done = select(func.count(SubTask.id)).where(
+        SubTask.team_task_id == TeamTask.id,
+        SubTask.status == SubTaskStatus.DONE.value
+    ).scalar_subquery()
+
+    result = db.session.execute(
+        update(TeamTask).where(or_(
+            TeamTask.sub_task_total != total,
+            TeamTask.sub_task_done != done
+        )).values(
+            sub_task_total=total,
+            sub_task_done=done
+        ).execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return result.rowcount
+
+
+def board_version(team_id: int) -> Tuple:
+    """Return a cheap version stamp for a team's board, for use as an ETag.
+
+    Row counts catch deletions and max(updated_at) catches inserts and
+    updates, for both tasks and sub-tasks (which drive task progress).
+    """
+    team_tasks = select(TeamTask.id).where(TeamTask.team_id == team_id)
+    row = db.session.query(
+        select(func.count(TeamTask.id)).where(TeamTask.team_id == team_id).scalar_subquery(),
+        select(func.max(TeamTask.updated_at)).where(TeamTask.team_id == team_id).scalar_subquery(),
+        select(func.count(SubTask.id)).where(SubTask.team_task_id.in_(team_tasks)).scalar_subquery(),
+        select(func.max(SubTask.updated_at)).where(SubTask.team_task_id.in_(team_tasks)).scalar_subquery()
+    ).one()
+    return ('board', team_id) + tuple(row)
+
+
+def task_version(task: TeamTask) -> Tuple:
+    """Return a cheap version stamp for a task and its sub-tasks."""
+    row = db.session.query(
+        func.count(SubTask.id),
+        func.max(SubTask.updated_at)
+    ).filter(SubTask.team_task_id == task.id).one()
+    return ('task', task.id, task.updated_at) + tuple(row)
+
+
+BOARD_COLUMNS = TEAM_TASK_SERIALIZER.columns + (
+    TeamTask.sub_task_total,
+    TeamTask.sub_task_done,
+    User.id.label('assigned_user__id'),
+    User.name.label('assigned_user__name'),
+    User.email.label('assigned_user__email'),
+)
+_TASK_FIELD_COUNT = len(TEAM_TASK_SERIALIZER.fields)
+
+
+def serialize_board_row(row) -> dict:
+    """Serialize a Row selected with BOARD_COLUMNS, matching TeamTask.to_dict(include_assigned_user=True)."""
+    result = TEAM_TASK_SERIALIZER.from_row(row[:_TASK_FIELD_COUNT])
+    total, done, user_id, user_name, user_email = row[_TASK_FIELD_COUNT:]
+    result['progress'] = TeamTask.calculate_progress(result['status'], total, done)
+    if user_id is not None:
+        result['assigned_user'] = {'id': user_id, 'name': user_name, 'email': user_email}
+    return result
+
+
+# Keyset columns and direction for each board sort order
+BOARD_SORTS = {
+    'created': ((TeamTask.created_at, TeamTask.id), True),
+    'position': ((TeamTask.status, TeamTask.position, TeamTask.id), False),
+}
+
+
+def board_query(
+    team_id: int,
+    status: Optional[str] = None,
+    assigned_user_id: Optional[int] = None,
+    updated_since: Optional[datetime] = None
+):
+    """Select BOARD_COLUMNS for a team's tasks, with optional filters and no ordering."""
+    query = db.session.query(*BOARD_COLUMNS).outerjoin(
+        User, User.id == TeamTask.assigned_user_id
+    ).filter(TeamTask.team_id == team_id)
+
+    if status:
+        query = query.filter(TeamTask.status == status)
+    if assigned_user_id is not None:
+        query = query.filter(TeamTask.assigned_user_id == assigned_user_id)
+    if updated_since is not None:
+        query = query.filter(TeamTask.updated_at >= updated_since)
+    return query
+
+
+def load_board(
+    team_id: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    sort: str = 'created',
+    **filters
+) -> Tuple[List[dict], Optional[str]]:
+    """Load and serialize one page of a team's board in a single query.
+
+    Tasks and their assigned users are fetched as bare column tuples in one
+    joined query, progress is read from the denormalized sub-task counters,
+    and rows are serialized directly without building ORM instances.
+    sort='created' lists newest first; sort='position' lists columns in
+    status order, each in board order, as one scan of the position index.
+    Returns (tasks, next_cursor).
+    """
+    keyset, descending = BOARD_SORTS[sort]
+    tasks, next_cursor = keyset_paginate(board_query(team_id, **filters), keyset, limit, cursor, descending)
+    with timed('serialize'):
+        return [serialize_board_row(row) for row in tasks], next_cursor
+
+
+def stream_board(team_id: int, batch_size: int, sort: str = 'created', **filters) -> Iterable:
+    """Return every board row in sort order, fetched batch_size rows at a time.
+
+    Serialize the rows with serialize_board_row as they are consumed.
+    """
+    keyset, descending = BOARD_SORTS[sort]
+    return board_query(team_id, **filters).order_by(*keyset_order(keyset, descending)).yield_per(batch_size)
+
+
+SUB_TASK_COLUMNS = SUB_TASK_SERIALIZER.columns + (
+    User.id.label('responsible_user__id'),
+    User.name.label('responsible_user__name'),
+    User.email.label('responsible_user__email'),
+)
+_SUB_TASK_FIELD_COUNT = len(SUB_TASK_SERIALIZER.fields)
+
+
+def serialize_sub_task_row(row) -> dict:
+    """Serialize a Row selected with SUB_TASK_COLUMNS, matching SubTask.to_dict()."""
+    result = SUB_TASK_SERIALIZER.from_row(row[:_SUB_TASK_FIELD_COUNT])
+    user_id, user_name, user_email = row[_SUB_TASK_FIELD_COUNT:]
+    if user_id is not None:
+        result['responsible_user'] = {'id': user_id, 'name': user_name, 'email': user_email}
+    return result
+
+
+def stream_sub_tasks(task_id: int, batch_size: int) -> Iterable:
+    """Return a task's sub-task rows oldest first, fetched batch_size rows at a time.
+
+    Serialize the rows with serialize_sub_task_row as they are consumed.
+    """
+    return db.session.query(*SUB_TASK_COLUMNS).outerjoin(
+        User, User.id == SubTask.responsible_user_id
+    ).filter(SubTask.team_task_id == task_id).order_by(
+        SubTask.created_at.asc(), SubTask.id.asc()
+    ).yield_per(batch_size)
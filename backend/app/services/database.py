@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from sqlalchemy import event, text
+from app.models import db
+
+logger = logging.getLogger('taskish.database')
+
+
+def pool_status(engine) -> dict:
+    """Return live connection pool statistics for an engine."""
+    pool = engine.pool
+    status = {'pool': type(pool).__name__}
+    # Only QueuePool-style pools track sizes; SQLite's StaticPool does not.
+    for key, method in (
+        ('size', 'size'),
+        ('checked_in', 'checkedin'),
+        ('checked_out', 'checkedout'),
+        ('overflow', 'overflow'),
+    ):
+        if hasattr(pool, method):
+            status[key] = getattr(pool, method)()
+    return status
+
+
+def check_database() -> dict:
+    """Round-trip a trivial query and report latency plus pool stats."""
+    started = time.perf_counter()
+    with db.engine.connect() as conn:
+        conn.execute(text('SELECT 1'))
+    return {
+        'dialect': db.engine.dialect.name,
+        'latency_ms': round((time.perf_counter() - started) * 1000, 2),
+        **pool_status(db.engine),
+    }
+
+
+def dispose_engines(app) -> None:
+    """Drop pooled connections inherited from a parent process.
+
+    Call in each worker after fork (gunicorn post_fork with preload_app).
+    close=False leaves the parent's sockets untouched while giving the
+    child a fresh, empty pool.
+    """
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+class SQLiteProfile:
+    """Opt-in tuning for file-backed SQLite databases (SQLITE_WAL=true).
+
+    Every new connection switches to WAL so readers keep reading a
+    snapshot while a writer commits, relaxes fsync to once per checkpoint
+    (synchronous=NORMAL, still safe against application crashes), enlarges
+    the page cache and memory map, and waits for locks instead of failing
+    immediately with "database is locked". A background thread runs
+    passive WAL checkpoints so the -wal file does not grow without bound
+    between automatic checkpoints. Like TaskArchiver's, the thread is
+    started by a worker's first request rather than in create_app, so with
+    gunicorn's preload_app it runs in the workers and CLI commands never
+    start it.
+    """
+
+    def __init__(self, app=None):
+        self._stop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.stop()
+        app.extensions['sqlite_profile'] = self
+        if not app.config['SQLITE_WAL']:
+            return
+
+        with app.app_context():
+            engines = [
+                engine for engine in db.engines.values()
+                if engine.dialect.name == 'sqlite' and engine.url.database not in (None, '', ':memory:')
+            ]
+        if not engines:
+            return
+
+        pragmas = (
+            'PRAGMA journal_mode=WAL',
+            f"PRAGMA synchronous={app.config['SQLITE_SYNCHRONOUS']}",
+            f"PRAGMA mmap_size={app.config['SQLITE_MMAP_SIZE']}",
+            f"PRAGMA cache_size={app.config['SQLITE_CACHE_SIZE']}",
+            f"PRAGMA busy_timeout={app.config['SQLITE_BUSY_TIMEOUT_MS']}",
+        )
+
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
+        for engine in engines:
+            event.listen(engine, 'connect', set_pragmas)
+
+        self.engines = engines
+        self.interval = app.config['SQLITE_CHECKPOINT_INTERVAL']
+        if self.interval > 0:
+            app.before_request(self._ensure_thread)
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            # Threads do not survive fork, so a forked worker starts its own
+            if self._thread is None or not self._thread.is_alive():
+                self._stop = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._checkpoint_loop, args=(self.engines, self.interval, self._stop),
+                    name='sqlite-checkpoint', daemon=True
+                )
+                self._thread.start()
+
+    def stop(self):
+        """Stop the checkpoint thread, if running."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    @staticmethod
+    def checkpoint(engine) -> tuple:
+        """Run a passive WAL checkpoint; returns (busy, log_frames, checkpointed_frames)."""
+        with engine.connect() as conn:
+            return tuple(conn.exec_driver_sql('PRAGMA wal_checkpoint(PASSIVE)').one())
+
+    def _checkpoint_loop(self, engines, interval, stop):
+        while not stop.wait(interval):
+            for engine in engines:
+                try:
+                    busy, frames, done = self.checkpoint(engine)
+                    logger.debug('WAL checkpoint %s: %s/%s frames', engine.url.database, done, frames)
+                except Exception:
+                    logger.exception('WAL checkpoint failed for %s', engine.url.database)
@@ -0,0 +1,185 @@
+import itertools
+import json
+import logging
+import queue
+import select
+import threading
+from collections import defaultdict
+from typing import Callable, Optional
+from flask import current_app
+from sqlalchemy import text
+
+logger = logging.getLogger('taskish.events')
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_PAYLOAD = 7900
+
+
+class Subscription:
+    """A single stream client's bounded event buffer."""
+
+    def __init__(self, team_id: int, maxsize: int):
+        self.team_id = team_id
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def push(self, event: dict):
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            # The client is too slow; it will be told to resync and disconnected
+            self.overflowed = True
+
+    def get(self, timeout: float) -> Optional[dict]:
+        """Wait up to timeout seconds for the next event."""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class LocalFanout:
+    """Delivers events to subscribers in this process only."""
+
+    def start(self, app, deliver: Callable[[int, dict], None]):
+        self.deliver = deliver
+
+    def listen(self):
+        pass
+
+    def publish(self, team_id: int, event: dict):
+        self.deliver(team_id, event)
+
+
+class PostgresFanout:
+    """Fans events out to every worker through PostgreSQL LISTEN/NOTIFY.
+
+    Each process keeps one listening connection on a daemon thread and
+    delivers notifications to its local subscribers. The thread is started
+    by the worker's first request or subscriber rather than in create_app,
+    so with gunicorn's preload_app every worker listens, including ones
+    that only serve streams and never publish.
+    """
+    channel = 'taskish_events'
+
+    def start(self, app, deliver: Callable[[int, dict], None]):
+        self.deliver = deliver
+        self.dsn = app.config['EVENT_DATABASE_URL'] or app.config['SQLALCHEMY_DATABASE_URI']
+        self._thread = None
+        self._lock = threading.Lock()
+        app.before_request(self.listen)
+
+    def listen(self):
+        """Start this process's listening thread, if not already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            # Threads do not survive fork, so a forked worker starts its own
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._listen, name='event-listener', daemon=True)
+                self._thread.start()
+
+    def _listen(self):
+        import psycopg2
+
+        while True:
+            try:
+                conn = psycopg2.connect(self.dsn)
+                conn.set_session(autocommit=True)
+                conn.cursor().execute(f'LISTEN {self.channel}')
+                while True:
+                    if select.select([conn], [], [], 30) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        message = json.loads(notify.payload)
+                        self.deliver(message['team_id'], message['event'])
+            except Exception:
+                logger.exception('Event listener connection lost, reconnecting')
+                threading.Event().wait(1)
+
+    def publish(self, team_id: int, event: dict):
+        self.listen()
+        payload = current_app.json.dumps({'team_id': team_id, 'event': event})
+        if len(payload) > MAX_NOTIFY_PAYLOAD:
+            # Too large for NOTIFY: send the event without its data so
+            # clients refetch the row instead.
+            event = {k: v for k, v in event.items() if k != 'data'}
+            payload = current_app.json.dumps({'team_id': team_id, 'event': event})
+
+        from app.models import db
+        with db.engine.connect() as conn:
+            conn.execute(text('SELECT pg_notify(:channel, :payload)'),
+                         {'channel': self.channel, 'payload': payload})
+            conn.commit()
+
+
+BACKENDS = {
+    'local': LocalFanout,
+    'postgres': PostgresFanout,
+}
+
+
+class EventBroker:
+    """In-process pub/sub for board events, scoped per team.
+
+    Publishing goes through the configured fan-out backend, which delivers
+    to the subscribers of every process. Each subscriber has a bounded
+    buffer of SSE_CLIENT_BUFFER events so a slow client cannot grow memory.
+    Listeners added with add_listener see every delivered event, e.g. to
+    invalidate per-team caches in every process.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.buffer_size = app.config['SSE_CLIENT_BUFFER']
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._listeners = []
+        self.backend = BACKENDS[app.config['EVENT_BACKEND']]()
+        self.backend.start(app, self._deliver)
+        app.extensions['event_broker'] = self
+
+    def add_listener(self, listener: Callable[[int, dict], None]):
+        """Call listener(team_id, event) for every event delivered to this process."""
+        self._listeners.append(listener)
+
+    def subscribe(self, team_id: int) -> Subscription:
+        self.backend.listen()
+        subscription = Subscription(team_id, self.buffer_size)
+        with self._lock:
+            self._subscribers[team_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.team_id)
+            if subscribers:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.team_id]
+
+    def publish(self, team_id: int, event_type: str, data: dict):
+        self.backend.publish(team_id, {'type': event_type, 'data': data})
+
+    def _deliver(self, team_id: int, event: dict):
+        for listener in self._listeners:
+            try:
+                listener(team_id, event)
+            except Exception:
+                logger.exception('Event listener failed')
+        event = dict(event, id=next(self._ids))
+        with self._lock:
+            subscribers = list(self._subscribers.get(team_id, ()))
+        for subscription in subscribers:
+            subscription.push(event)
+
+
+def publish_event(team_id: int, event_type: str, data: dict):
+    """Publish a board event to the team's stream subscribers."""
+    current_app.extensions['event_broker'].publish(team_id, event_type, data)
@@ -0,0 +1,169 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from sqlalchemy import func, tuple_, update
+from app.models import db, TeamTask
+from app.models.team_task import RANK_MAX_LENGTH
+from app.services.events import publish_event
+from app.utils.ranking import rank_after, rank_between, spaced_ranks
+
+logger = logging.getLogger('taskish.ordering')
+
+
+class MoveConflict(ValueError):
+    """Raised when the requested neighbours share a rank; retry after a rebalance."""
+
+
+def _column(team_id: int, status: str, exclude_id: int):
+    return db.session.query(TeamTask.position, TeamTask.id).filter(
+        TeamTask.team_id == team_id,
+        TeamTask.status == status,
+        TeamTask.id != exclude_id
+    )
+
+
+def _neighbour(team_id: int, status: str, task_id: int, exclude_id: int, field: str) -> Tuple[str, int]:
+    row = _column(team_id, status, exclude_id).filter(TeamTask.id == task_id).first()
+    if row is None:
+        raise ValueError(f'{field} must be another task in the target column')
+    return row
+
+
+def _target_rank(task: TeamTask, status: str, before_id: Optional[int], after_id: Optional[int]) -> str:
+    """Rank placing the task after `after_id` and before `before_id` in the status column.
+
+    A missing side is filled in with the adjacent task in the column, using
+    the (position, id) index; with neither given the task goes to the end.
+    """
+    key = tuple_(TeamTask.position, TeamTask.id)
+    lower = upper = None
+    if after_id is not None:
+        lower = _neighbour(task.team_id, status, after_id, task.id, 'after_id')
+    if before_id is not None:
+        upper = _neighbour(task.team_id, status, before_id, task.id, 'before_id')
+
+    if lower is not None and upper is None:
+        upper = _column(task.team_id, status, task.id).filter(key > tuple(lower)).order_by(
+            TeamTask.position, TeamTask.id
+        ).first()
+    elif upper is not None and lower is None:
+        lower = _column(task.team_id, status, task.id).filter(key < tuple(upper)).order_by(
+            TeamTask.position.desc(), TeamTask.id.desc()
+        ).first()
+    elif lower is None:
+        lower = _column(task.team_id, status, task.id).order_by(
+            TeamTask.position.desc(), TeamTask.id.desc()
+        ).first()
+
+    lower_rank = lower.position if lower is not None else None
+    if upper is None:
+        return rank_after(lower_rank)
+    if lower_rank is not None and lower_rank == upper.position:
+        raise MoveConflict('Tasks share a position; reload the board and retry')
+    if lower_rank is not None and lower_rank > upper.position:
+        raise ValueError('after_id must come before before_id')
+    return rank_between(lower_rank, upper.position)
+
+
+def move_task(task: TeamTask, status: str, before_id: Optional[int] = None,
+              after_id: Optional[int] = None):
+    """Move a task into a status column between two neighbours, rewriting only its own row.
+
+    Raises ValueError for neighbours outside the column or out of order,
+    and MoveConflict when the neighbours' ranks are equal. The caller commits.
+    """
+    position = _target_rank(task, status, before_id, after_id)
+    if len(position) > RANK_MAX_LENGTH:
+        # Too many moves into one gap before the background rebalance ran
+        rebalance_column(task.team_id, status, commit=False)
+        position = _target_rank(task, status, before_id, after_id)
+    task.status = status
+    task.position = position
+
+
+def rebalance_column(team_id: int, status: str, commit: bool = True) -> int:
+    """Rewrite a column's ranks as short, evenly spaced ones, keeping their order.
+
+    Returns the number of tasks renumbered. Rows are locked on PostgreSQL,
+    but a task moved into the column while it is being renumbered can end
+    up out of place; it is never lost and the next move puts it back.
+    """
+    query = db.session.query(TeamTask.id).filter(
+        TeamTask.team_id == team_id,
+        TeamTask.status == status
+    ).order_by(TeamTask.position, TeamTask.id)
+    if db.engine.dialect.name == 'postgresql':
+        query = query.with_for_update()
+
+    ids = [task_id for (task_id,) in query]
+    if ids:
+        db.session.execute(update(TeamTask), [
+            {'id': task_id, 'position': position}
+            for task_id, position in zip(ids, spaced_ranks(len(ids)))
+        ])
+    if commit:
+        db.session.commit()
+        publish_event(team_id, 'tasks.reordered', {'status': status})
+    return len(ids)
+
+
+def long_rank_columns(max_length: int) -> List[Tuple[int, str]]:
+    """Return (team_id, status) for every column holding a rank longer than max_length."""
+    return db.session.query(TeamTask.team_id, TeamTask.status).group_by(
+        TeamTask.team_id, TeamTask.status
+    ).having(func.max(func.length(TeamTask.position)) > max_length).all()
+
+
+class RankRebalancer:
+    """Renumbers board columns in the background once their ranks get long.
+
+    Repeated moves into the same gap add a rank digit about every five
+    moves. When a move produces a rank longer than RANK_REBALANCE_LENGTH
+    its column is queued for rebalance_column on a single worker thread;
+    a column is queued at most once at a time. 0 disables this, leaving
+    `flask rebalance-ranks` as the only way to renumber.
+    """
+
+    def __init__(self, app=None):
+        self._executor = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+        self.app = app
+        self.max_length = app.config['RANK_REBALANCE_LENGTH']
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rank-rebalance')
+        self._pending = set()
+        self._lock = threading.Lock()
+        app.extensions['rank_rebalancer'] = self
+
+    def check(self, team_id: int, status: str, position: str) -> Optional[Future]:
+        """Queue the column for renumbering if `position` is over the length limit."""
+        if self.max_length and len(position) > self.max_length:
+            return self.schedule(team_id, status)
+        return None
+
+    def schedule(self, team_id: int, status: str) -> Optional[Future]:
+        key = (team_id, status)
+        with self._lock:
+            if key in self._pending:
+                return None
+            self._pending.add(key)
+        return self._executor.submit(self._run, key)
+
+    def _run(self, key):
+        try:
+            with self.app.app_context():
+                try:
+                    count = rebalance_column(*key)
+                    logger.info('Rebalanced %d tasks in team %d column %s', count, *key)
+                except Exception:
+                    db.session.rollback()
+                    logger.exception('Rebalancing team %d column %s failed', *key)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
@@ -0,0 +1,66 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import bcrypt
+
+
+class HasherBusyError(Exception):
+    """Raised when the password hashing queue is full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__('Password hashing queue is full')
+        self.retry_after = retry_after
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated, bounded thread pool.
+
+    bcrypt releases the GIL, so hashing on the pool keeps at most
+    PASSWORD_HASH_WORKERS cores busy per process while request threads for
+    cheap endpoints keep running. At most PASSWORD_HASH_QUEUE_SIZE further
+    jobs may wait; beyond that HasherBusyError is raised immediately so the
+    caller can shed load instead of queueing behind a login burst.
+    """
+
+    def __init__(self, app=None):
+        self._executor = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+        workers = app.config['PASSWORD_HASH_WORKERS'] or min(4, os.cpu_count() or 1)
+        self.rounds = app.config['BCRYPT_ROUNDS']
+        self.retry_after = app.config['PASSWORD_HASH_RETRY_AFTER']
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bcrypt')
+        self._slots = threading.BoundedSemaphore(workers + app.config['PASSWORD_HASH_QUEUE_SIZE'])
+        app.extensions['password_hasher'] = self
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusyError(self.retry_after)
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured cost."""
+        salt = bcrypt.gensalt(rounds=self.rounds)
+        return self._run(bcrypt.hashpw, password.encode('utf-8'), salt).decode('utf-8')
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        """Check a password against a stored hash."""
+        return self._run(bcrypt.checkpw, password.encode('utf-8'), password_hash.encode('utf-8'))
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Return True if the hash was made with a different cost than configured."""
+        try:
+            return int(password_hash.split('$')[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
@@ -0,0 +1,196 @@
+import math
+import re
+import threading
+import time
+from typing import NamedTuple, Optional, Tuple
+from flask import g, request
+from flask_jwt_extended import decode_token
+from sqlalchemy import case, delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from app.models import db, RateLimitBucket
+from app.utils.responses import error_response
+
+WRITE_METHODS = frozenset({'POST', 'PUT', 'PATCH', 'DELETE'})
+
+_UNITS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+_LIMIT_RE = re.compile(r'^(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)s?$')
+
+
+class Limit(NamedTuple):
+    """Bucket of `capacity` tokens that refills completely over `period` seconds."""
+    capacity: int
+    period: int
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.period
+
+
+def parse_limit(value: Optional[str]) -> Optional[Limit]:
+    """Parse '10/minute' or '100/5 minutes'. Empty, 'off' or a zero count disables the limit."""
+    value = (value or '').strip().lower()
+    if value in ('', 'off', 'none'):
+        return None
+    match = _LIMIT_RE.match(value)
+    if not match:
+        raise ValueError(f'Invalid rate limit {value!r}, expected e.g. "10/minute"')
+    count, multiplier, unit = match.groups()
+    if int(count) == 0:
+        return None
+    return Limit(int(count), int(multiplier or 1) * _UNITS[unit])
+
+
+class MemoryRateLimitBackend:
+    """Process-local buckets; each worker enforces the limit on its own."""
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, limit: Limit, now: float) -> Tuple[bool, float]:
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (limit.capacity, now))
+            tokens = min(limit.capacity, tokens + (now - updated_at) * limit.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+        return allowed, tokens
+
+    def prune(self, cutoff: float) -> int:
+        with self._lock:
+            idle = [key for key, (_, updated_at) in self._buckets.items() if updated_at <= cutoff]
+            for key in idle:
+                del self._buckets[key]
+        return len(idle)
+
+
+UPSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+class DatabaseRateLimitBackend:
+    """Buckets in the rate_limit_buckets table, shared by all workers.
+
+    A check is one upsert: the refill and the spend happen in the UPDATE,
+    which only fires while a whole token is available, so concurrent
+    requests can never overspend a bucket. An empty RETURNING means the
+    request was refused.
+    """
+
+    def consume(self, key: str, limit: Limit, now: float) -> Tuple[bool, float]:
+        table = RateLimitBucket.__table__
+        refilled = table.c.tokens + (now - table.c.updated_at) * limit.rate
+        refilled = case((refilled > limit.capacity, limit.capacity), else_=refilled)
+
+        upsert = UPSERTS[db.engine.dialect.name](table).values(
+            key=key, tokens=limit.capacity - 1, updated_at=now,
+        )
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[table.c.key],
+            set_={'tokens': refilled - 1, 'updated_at': now},
+            where=refilled >= 1,
+        ).returning(table.c.tokens)
+
+        tokens = db.session.execute(upsert).scalar()
+        allowed = tokens is not None
+        if not allowed:
+            tokens = db.session.execute(select(refilled).where(table.c.key == key)).scalar()
+        db.session.commit()
+        return allowed, tokens
+
+    def prune(self, cutoff: float) -> int:
+        deleted = db.session.execute(
+            delete(RateLimitBucket).where(RateLimitBucket.updated_at <= cutoff)
+        ).rowcount
+        db.session.commit()
+        return deleted
+
+
+BACKENDS = {
+    'memory': MemoryRateLimitBackend,
+    'database': DatabaseRateLimitBackend,
+}
+
+
+def client_key() -> str:
+    """Identify the caller: the JWT subject when a token is sent, else the client address."""
+    auth = request.headers.get('Authorization', '')
+    if auth.startswith('Bearer '):
+        try:
+            return f"user:{decode_token(auth[7:])['sub']}"
+        except Exception:
+            # Bad or expired tokens are rejected by jwt_required later;
+            # until then they count against the caller's address
+            pass
+    return f'ip:{request.remote_addr}'
+
+
+class RateLimiter:
+    """Token-bucket limits for write requests, per blueprint and per client.
+
+    Only POST/PUT/PATCH/DELETE are counted; reads are served from caches
+    and conditional GETs. A client is the JWT identity when the request
+    carries a valid access token and the remote address otherwise, so
+    login and register are limited per IP. Each blueprint has its own
+    buckets, sized by RATE_LIMITS[blueprint] or RATE_LIMIT_DEFAULT.
+
+    Responses carry RateLimit-Limit/-Remaining/-Reset/-Policy headers;
+    refused requests get 429 with Retry-After. Buckets untouched for a full
+    refill period are equivalent to new ones and are pruned at most once
+    per RATE_LIMIT_PRUNE_INTERVAL seconds.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.backend = BACKENDS[app.config['RATE_LIMIT_BACKEND']]()
+        self.default = parse_limit(app.config['RATE_LIMIT_DEFAULT'])
+        self.limits = {name: parse_limit(value) for name, value in app.config['RATE_LIMITS'].items()}
+        self.idle_after = max(
+            (limit.period for limit in (self.default, *self.limits.values()) if limit), default=0,
+        )
+        self.prune_interval = app.config['RATE_LIMIT_PRUNE_INTERVAL']
+        self._last_prune = time.time()
+        app.extensions['rate_limiter'] = self
+
+        if app.config['RATE_LIMIT_ENABLED']:
+            app.before_request(self._before_request)
+            app.after_request(self._after_request)
+
+    def limit_for(self, blueprint: str) -> Optional[Limit]:
+        return self.limits.get(blueprint, self.default)
+
+    def _before_request(self):
+        if request.method not in WRITE_METHODS or request.blueprint is None:
+            return None
+        limit = self.limit_for(request.blueprint)
+        if limit is None:
+            return None
+
+        now = time.time()
+        allowed, tokens = self.backend.consume(f'{request.blueprint}:{client_key()}', limit, now)
+        g.rate_limit = (limit, tokens)
+        if now - self._last_prune >= self.prune_interval:
+            self._last_prune = now
+            self.backend.prune(now - self.idle_after)
+
+        if not allowed:
+            response, status = error_response('Too many requests, please retry later', 429)
+            response.headers['Retry-After'] = str(math.ceil((1 - tokens) / limit.rate))
+            return response, status
+        return None
+
+    def _after_request(self, response):
+        state = g.pop('rate_limit', None)
+        if state is not None:
+            limit, tokens = state
+            response.headers['RateLimit-Limit'] = str(limit.capacity)
+            response.headers['RateLimit-Remaining'] = str(int(tokens))
+            response.headers['RateLimit-Reset'] = str(math.ceil((limit.capacity - tokens) / limit.rate))
+            response.headers['RateLimit-Policy'] = f'{limit.capacity};w={limit.period}'
+        return response
@@ -0,0 +1,120 @@
+import itertools
+import threading
+import time
+from flask import g, request
+from sqlalchemy import delete, select
+from app.config import REPLICA_BIND_PREFIX
+from app.models import db, RecentWriter
+from app.services.rate_limit import UPSERTS, WRITE_METHODS, client_key
+from app.utils.cache import TTLCache
+
+
+class MemoryStickyBackend:
+    """Process-local writer markers; only right for a single worker process."""
+
+    def __init__(self, app):
+        self._markers = TTLCache(app.config['DB_REPLICA_STICKY_CACHE_SIZE'])
+
+    def mark(self, key: str, expires_at: float):
+        self._markers.set(key, True, expires_at)
+
+    def is_marked(self, key: str) -> bool:
+        return self._markers.get(key, False)
+
+    def clear(self):
+        self._markers.clear()
+
+
+class DatabaseStickyBackend:
+    """Writer markers in the recent_writers table on the primary, seen by all workers.
+
+    Uses short-lived connections of its own rather than the request's
+    session, so checking a marker does not hold a primary connection for
+    the rest of a replica-routed request. Expired markers are deleted at
+    most once per DB_REPLICA_STICKY_PRUNE_INTERVAL seconds.
+    """
+
+    def __init__(self, app):
+        self.prune_interval = app.config['DB_REPLICA_STICKY_PRUNE_INTERVAL']
+        self._last_prune = time.time()
+
+    def mark(self, key: str, expires_at: float):
+        table = RecentWriter.__table__
+        upsert = UPSERTS[db.engine.dialect.name](table).values(key=key, expires_at=expires_at)
+        upsert = upsert.on_conflict_do_update(index_elements=[table.c.key], set_={'expires_at': expires_at})
+        now = time.time()
+        with db.engine.begin() as connection:
+            connection.execute(upsert)
+            if now - self._last_prune >= self.prune_interval:
+                self._last_prune = now
+                connection.execute(delete(table).where(table.c.expires_at <= now))
+
+    def is_marked(self, key: str) -> bool:
+        with db.engine.connect() as connection:
+            expires_at = connection.execute(
+                select(RecentWriter.expires_at).where(RecentWriter.key == key)
+            ).scalar()
+        return expires_at is not None and expires_at > time.time()
+
+    def clear(self):
+        with db.engine.begin() as connection:
+            connection.execute(delete(RecentWriter))
+
+
+STICKY_BACKENDS = {
+    'memory': MemoryStickyBackend,
+    'database': DatabaseStickyBackend,
+}
+
+
+class ReplicaRouter:
+    """Sends read-only requests to read replicas, round-robin.
+
+    GET requests to the DB_REPLICA_BLUEPRINTS blueprints are given the next
+    replica bind, which app.models.session.RoutingSession uses for their
+    queries. A successful write marks the caller (the JWT subject, else the
+    client address) for DB_REPLICA_STICKY_SECONDS, during which their reads
+    stay on the primary so they see their own changes. With the default
+    database backend the marker is shared by all workers; the window should
+    cover the replicas' usual lag. The authenticated user and token
+    revocations are always read from the primary. Without replica binds
+    this does nothing.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        binds = app.config.get('SQLALCHEMY_BINDS') or {}
+        self.replicas = sorted(key for key in binds if key.startswith(REPLICA_BIND_PREFIX))
+        self.blueprints = set(app.config['DB_REPLICA_BLUEPRINTS'])
+        self.sticky_seconds = app.config['DB_REPLICA_STICKY_SECONDS']
+        self.recent_writers = STICKY_BACKENDS[app.config['DB_REPLICA_STICKY_BACKEND']](app)
+        self._cycle = itertools.cycle(self.replicas)
+        self._lock = threading.Lock()
+        app.extensions['replica_router'] = self
+
+        if self.replicas:
+            app.before_request(self._before_request)
+            app.after_request(self._after_request)
+
+    def choose(self):
+        """Return the bind key of the next replica."""
+        with self._lock:
+            return next(self._cycle)
+
+    def _before_request(self):
+        # Set on every request and never cleared: streamed bodies are read
+        # after teardown, and must still come from the same replica
+        g.db_replica = None
+        if request.method not in ('GET', 'HEAD') or request.blueprint not in self.blueprints:
+            return
+        if self.sticky_seconds > 0 and self.recent_writers.is_marked(client_key()):
+            return
+        g.db_replica = self.choose()
+
+    def _after_request(self, response):
+        if request.method in WRITE_METHODS and response.status_code < 400 and self.sticky_seconds > 0:
+            self.recent_writers.mark(client_key(), time.time() + self.sticky_seconds)
+        return response
@@ -0,0 +1,98 @@
+import re
+from typing import List, Optional, Tuple
+from sqlalchemy import Float, cast, func, literal, literal_column, null, select, text, union_all
+from app.models import db, TeamTask, SubTask, PrivateTodo
+from app.models.search import SEARCH_DOCUMENTS, SEARCH_INDEX_TABLE
+from app.utils.metrics import timed
+from app.utils.pagination import keyset_paginate
+
+MAX_TERMS = 8
+# bm25 column weights in FTS5 column order: kind, entity_id, parent_id, scope, title, body
+BM25_WEIGHTS = (0.0, 0.0, 0.0, 0.0, 10.0, 1.0)
+
+_TERM = re.compile(r'\w+', re.UNICODE)
+
+
+def parse_terms(q: str) -> List[str]:
+    """Split a user query into lowercase word terms; punctuation and operators are dropped."""
+    return _TERM.findall(q.lower())[:MAX_TERMS]
+
+
+def _sqlite_query(terms: List[str], team_id: Optional[int], user_id: int):
+    scopes = [f'scope : user{user_id}']
+    if team_id is not None:
+        scopes.append(f'scope : team{team_id}')
+    # Every term must match title or body; the last one as a prefix for search-as-you-type
+    words = [f'{{title body}} : "{term}"' for term in terms]
+    words[-1] += ' *'
+    match = f"({' OR '.join(scopes)}) AND {' AND '.join(words)}"
+
+    index = literal_column(SEARCH_INDEX_TABLE)
+    rank = func.bm25(index, *BM25_WEIGHTS)
+    return select(
+        literal_column('kind').label('kind'),
+        literal_column('entity_id').label('id'),
+        literal_column('parent_id').label('parent_id'),
+        literal_column('title').label('title'),
+        rank.label('rank'),
+    ).select_from(text(SEARCH_INDEX_TABLE)).where(
+        text(f'{SEARCH_INDEX_TABLE} MATCH :match').bindparams(match=match)
+    )
+
+
+def _postgresql_query(terms: List[str], team_id: Optional[int], user_id: int):
+    query = func.to_tsquery('simple', ' & '.join(terms[:-1] + [f'{terms[-1]}:*']))
+
+    def ranked(model, kind, parent_id, *criteria):
+        document = literal_column(SEARCH_DOCUMENTS[model.__tablename__])
+        return select(
+            literal(kind).label('kind'),
+            model.id.label('id'),
+            parent_id.label('parent_id'),
+            model.title.label('title'),
+            # ts_rank returns real; widen it so cursor values round-trip exactly
+            cast(-func.ts_rank(document, query), Float).label('rank'),
+        ).where(document.op('@@')(query), *criteria)
+
+    selects = [ranked(PrivateTodo, 'private_todo', null(), PrivateTodo.owner_user_id == user_id)]
+    if team_id is not None:
+        selects.append(ranked(TeamTask, 'team_task', null(), TeamTask.team_id == team_id))
+        selects.append(ranked(
+            SubTask, 'sub_task', SubTask.team_task_id,
+            SubTask.team_task_id.in_(select(TeamTask.id).where(TeamTask.team_id == team_id))
+        ))
+    return union_all(*selects)
+
+
+def search(q: str, team_id: Optional[int], user_id: int, limit: int,
+           cursor: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+    """Full-text search over the team's tasks and sub-tasks and the user's own todos.
+
+    Results are ordered best match first (rank ascending; bm25 and negated
+    ts_rank both put better matches lower), with kind and id as tie
+    breakers, and paginated with the usual keyset cursor. Returns
+    (results, next_cursor).
+    """
+    terms = parse_terms(q)
+    if not terms:
+        return [], None
+
+    if db.engine.dialect.name == 'postgresql':
+        statement = _postgresql_query(terms, team_id, user_id)
+    else:
+        statement = _sqlite_query(terms, team_id, user_id)
+    ranked = statement.subquery('ranked')
+
+    rows, next_cursor = keyset_paginate(
+        db.session.query(ranked), [ranked.c.rank, ranked.c.kind, ranked.c.id], limit, cursor, descending=False
+    )
+    with timed('serialize'):
+        return [
+            {
+                'type': row.kind,
+                'id': row.id,
+                'title': row.title,
+                'team_task_id': row.parent_id,
+            }
+            for row in rows
+        ], next_cursor
@@ -0,0 +1,126 @@
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from flask import current_app
+from sqlalchemy import insert
+from app.models import db, User, Team, PrivateTodo, TeamTask, SubTask
+from app.models.private_todo import TodoStatus
+from app.models.sub_task import SubTaskStatus
+from app.models.team_task import TaskStatus
+from app.models.user import UserRole
+from app.utils.ranking import spaced_ranks
+
+# Rows per INSERT statement; keeps parameter lists and memory bounded
+CHUNK_SIZE = 5000
+
+
+def seed_email(team_index: int, user_index: int) -> str:
+    """Deterministic login for seeded users; user 0 of each team is its admin."""
+    return f'user{team_index}-{user_index}@bench.taskish'
+
+
+def _insert(model, rows: list, returning: bool = True) -> list:
+    """Bulk insert rows in chunks, returning primary keys in input order."""
+    ids = []
+    for start in range(0, len(rows), CHUNK_SIZE):
+        chunk = rows[start:start + CHUNK_SIZE]
+        if returning:
+            stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+            ids.extend(db.session.scalars(stmt, chunk).all())
+        else:
+            db.session.execute(insert(model), chunk)
+    return ids
+
+
+def seed_data(teams: int, users_per_team: int, tasks_per_team: int, sub_tasks_per_task: int,
+              todos_per_user: int, password: str, seed: int = 0) -> dict:
+    """Bulk-insert synthetic teams, users, tasks, sub-tasks and todos.
+
+    Rows go through Core executemany inserts rather than the unit of
+    work, and the password is hashed once and shared by every seeded user,
+    so seeding tens of thousands of rows takes seconds. The same seed
+    always produces the same data. Returns the number of rows per table.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    password_hash = current_app.extensions['password_hasher'].hash(password)
+
+    def created_at():
+        return now - timedelta(seconds=rng.randrange(90 * 24 * 3600))
+
+    team_ids = _insert(Team, [{'name': f'Bench Team {t}'} for t in range(teams)])
+
+    user_rows = [
+        {
+            'name': f'Bench User {t}-{u}',
+            'email': seed_email(t, u),
+            'password_hash': password_hash,
+            'role': UserRole.ADMIN.value if u == 0 else UserRole.MEMBER.value,
+            'team_id': team_id,
+        }
+        for t, team_id in enumerate(team_ids)
+        for u in range(users_per_team)
+    ]
+    user_ids = _insert(User, user_rows)
+    team_users = [user_ids[t * users_per_team:(t + 1) * users_per_team] for t in range(teams)]
+
+    task_rows, sub_task_statuses = [], []
+    for team_id, members in zip(team_ids, team_users):
+        for i in range(tasks_per_team):
+            statuses = [rng.choice(list(SubTaskStatus)).value for _ in range(sub_tasks_per_task)]
+            sub_task_statuses.append(statuses)
+            timestamp = created_at()
+            task_rows.append({
+                'team_id': team_id,
+                'title': f'Task {i}',
+                'description': f'Synthetic task {i} for benchmarking',
+                'status': rng.choice(list(TaskStatus)).value,
+                'assigned_user_id': rng.choice(members) if members and rng.random() < 0.8 else None,
+                'sub_task_total': len(statuses),
+                'sub_task_done': statuses.count(SubTaskStatus.DONE.value),
+                'created_at': timestamp,
+                'updated_at': timestamp,
+            })
+    # Rank each board column in creation order, as if tasks were appended one by one
+    columns = defaultdict(list)
+    for row in task_rows:
+        columns[row['team_id'], row['status']].append(row)
+    for rows in columns.values():
+        rows.sort(key=lambda row: row['created_at'])
+        for row, position in zip(rows, spaced_ranks(len(rows))):
+            row['position'] = position
+    task_ids = _insert(TeamTask, task_rows)
+
+    members_by_team = dict(zip(team_ids, team_users))
+    sub_task_rows = [
+        {
+            'team_task_id': task_id,
+            'title': f'Sub-task {j}',
+            'status': status,
+            'responsible_user_id': rng.choice(members_by_team[row['team_id']]) if members_by_team[row['team_id']] else None,
+        }
+        for task_id, row, statuses in zip(task_ids, task_rows, sub_task_statuses)
+        for j, status in enumerate(statuses)
+    ]
+    _insert(SubTask, sub_task_rows, returning=False)
+
+    todo_rows = [
+        {
+            'owner_user_id': user_id,
+            'title': f'Todo {i}',
+            'status': rng.choice(list(TodoStatus)).value,
+            'created_at': created_at(),
+        }
+        for user_id in user_ids
+        for i in range(todos_per_user)
+    ]
+    _insert(PrivateTodo, todo_rows, returning=False)
+
+    db.session.commit()
+    return {
+        'teams': len(team_ids),
+        'users': len(user_ids),
+        'team_tasks': len(task_ids),
+        'sub_tasks': len(sub_task_rows),
+        'private_todos': len(todo_rows),
+    }
@@ -0,0 +1,107 @@
+import time
+from sqlalchemy import case, func
+from app.models import db, User, TeamTask, SubTask
+from app.models.session import use_primary
+from app.models.sub_task import SubTaskStatus
+from app.models.team_task import TaskStatus
+from app.services.board import board_version
+from app.utils.cache import TTLCache
+
+
+def _task_progress():
+    """SQL expression for TeamTask.calculate_progress."""
+    return case(
+        (TeamTask.sub_task_total > 0, TeamTask.sub_task_done * 100 / TeamTask.sub_task_total),
+        (TeamTask.status == TaskStatus.DONE.value, 100),
+        else_=0,
+    )
+
+
+def compute_team_stats(team_id: int) -> dict:
+    """Aggregate a team's board with GROUP BY queries instead of loading tasks.
+
+    Returns per-status task counts, overall progress (the mean of task
+    progress as shown on each card), and per-member workload of open
+    tasks and open sub-tasks.
+    """
+    by_status = {status.value: 0 for status in TaskStatus}
+    progress_sum = 0
+    status_rows = db.session.query(
+        TeamTask.status, func.count(TeamTask.id), func.sum(_task_progress())
+    ).filter(TeamTask.team_id == team_id).group_by(TeamTask.status)
+    for status, count, task_progress in status_rows:
+        by_status[status] = count
+        progress_sum += task_progress or 0
+    total = sum(by_status.values())
+
+    open_tasks = dict(
+        db.session.query(TeamTask.assigned_user_id, func.count(TeamTask.id)).filter(
+            TeamTask.team_id == team_id, TeamTask.status != TaskStatus.DONE.value
+        ).group_by(TeamTask.assigned_user_id).all()
+    )
+    open_sub_tasks = dict(
+        db.session.query(SubTask.responsible_user_id, func.count(SubTask.id)).join(
+            TeamTask, TeamTask.id == SubTask.team_task_id
+        ).filter(
+            TeamTask.team_id == team_id, SubTask.status != SubTaskStatus.DONE.value
+        ).group_by(SubTask.responsible_user_id).all()
+    )
+    members = db.session.query(User.id, User.name).filter(User.team_id == team_id).order_by(User.name, User.id)
+
+    return {
+        'total_tasks': total,
+        'by_status': by_status,
+        'progress': int(progress_sum / total) if total else 0,
+        'workload': [
+            {
+                'user_id': user_id,
+                'name': name,
+                'open_tasks': open_tasks.get(user_id, 0),
+                'open_sub_tasks': open_sub_tasks.get(user_id, 0),
+            }
+            for user_id, name in members
+        ],
+        'unassigned': {
+            'open_tasks': open_tasks.get(None, 0),
+            'open_sub_tasks': open_sub_tasks.get(None, 0),
+        },
+    }
+
+
+class StatsCache:
+    """Per-team cache of compute_team_stats results.
+
+    Entries are stamped with the team's board_version and recomputed when
+    it changes, so a mutation handled by another worker process is seen
+    without waiting for its event; checking the stamp is one indexed
+    query instead of the GROUP BY aggregates. Board events drop entries
+    early, and entries expire after STATS_CACHE_TTL seconds as a backstop
+    for changes the stamp misses (e.g. a member renamed or leaving the team).
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.cache = TTLCache(app.config['STATS_CACHE_SIZE'])
+        self.ttl = app.config['STATS_CACHE_TTL']
+        app.extensions['event_broker'].add_listener(self._on_event)
+        app.extensions['stats_cache'] = self
+
+    def get(self, team_id: int) -> dict:
+        # Compared against the primary, so never stale from a lagging replica
+        with use_primary():
+            version = board_version(team_id)
+            entry = self.cache.get(team_id)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+            stats = compute_team_stats(team_id)
+        self.cache.set(team_id, (version, stats), time.time() + self.ttl)
+        return stats
+
+    def invalidate(self, team_id: int):
+        self.cache.delete(team_id)
+
+    def _on_event(self, team_id: int, event: dict):
+        self.invalidate(team_id)
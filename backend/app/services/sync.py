@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import or_, select
+from sqlalchemy.orm import joinedload
+from app.models import db, TeamTask, SubTask, Tombstone
+from app.models.tombstone import EntityType
+
+
+def tombstone_cutoff(retention_days: int) -> datetime:
+    """Oldest watermark that can still be served from the tombstone log."""
+    return datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=retention_days)
+
+
+def load_changes(team_id: int, since: Optional[datetime], overlap: timedelta = timedelta(0)) -> dict:
+    """Return tasks, sub-tasks and deletions for a team changed after a watermark.
+
+    Tasks whose sub-tasks changed or were deleted are included too, since
+    their progress changed. The returned watermark is the newest timestamp
+    seen, or the given one if nothing changed; without a watermark the
+    whole board is returned for an initial sync.
+
+    Timestamps are taken when a row is written, not when it commits, so a
+    slow transaction can commit a row stamped before a watermark already
+    handed out. Changes are therefore re-read from `overlap` before the
+    watermark; clients apply them idempotently, keyed by (id, updated_at).
+    """
+    team_task_ids = select(TeamTask.id).where(TeamTask.team_id == team_id)
+
+    sub_query = SubTask.query.options(
+        joinedload(SubTask.responsible_user)
+    ).filter(SubTask.team_task_id.in_(team_task_ids))
+    task_query = TeamTask.query.options(
+        joinedload(TeamTask.assigned_user)
+    ).filter(TeamTask.team_id == team_id)
+    tombstones = []
+
+    if since is not None:
+        start = since - overlap
+        sub_query = sub_query.filter(SubTask.updated_at > start)
+        tombstones = Tombstone.query.filter(
+            Tombstone.team_id == team_id,
+            Tombstone.deleted_at > start
+        ).order_by(Tombstone.deleted_at).all()
+
+    sub_tasks = sub_query.order_by(SubTask.updated_at).all()
+
+    if since is not None:
+        touched = {st.team_task_id for st in sub_tasks}
+        touched.update(
+            t.parent_id for t in tombstones
+            if t.entity_type == EntityType.SUB_TASK.value and t.parent_id is not None
+        )
+        task_query = task_query.filter(or_(
+            TeamTask.updated_at > start,
+            TeamTask.id.in_(touched)
+        ))
+
+    tasks = task_query.order_by(TeamTask.updated_at).all()
+
+    stamps = [t.updated_at for t in tasks]
+    stamps += [st.updated_at for st in sub_tasks]
+    stamps += [t.deleted_at for t in tombstones]
+    stamps = [s for s in stamps if s is not None and (since is None or s > since)]
+    watermark = max(stamps) if stamps else since
+
+    return {
+        'tasks': [t.to_dict(include_assigned_user=True) for t in tasks],
+        'sub_tasks': [st.to_dict() for st in sub_tasks],
+        'deleted': {
+            'team_tasks': [t.entity_id for t in tombstones if t.entity_type == EntityType.TEAM_TASK.value],
+            'sub_tasks': [t.entity_id for t in tombstones if t.entity_type == EntityType.SUB_TASK.value],
+        },
+        'watermark': watermark.isoformat() if watermark else None
+    }
+
+
+def prune_tombstones(retention_days: int) -> int:
+    """Delete tombstones older than the retention window. Returns the number removed."""
+    deleted = Tombstone.query.filter(
+        Tombstone.deleted_at < tombstone_cutoff(retention_days)
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
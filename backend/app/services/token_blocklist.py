@@ -0,0 +1,113 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from app.models import db, RevokedToken
+from app.models.session import use_primary
+from app.utils.cache import TTLCache
+
+
+class MemoryBlocklistBackend:
+    """Process-local backend; only suitable for tests and single-worker setups."""
+
+    def __init__(self):
+        self._tokens = {}
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, expires_at: Optional[float]):
+        with self._lock:
+            self._tokens[jti] = expires_at
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._tokens
+
+    def prune(self, now: float) -> int:
+        with self._lock:
+            expired = [jti for jti, exp in self._tokens.items() if exp is not None and exp <= now]
+            for jti in expired:
+                del self._tokens[jti]
+        return len(expired)
+
+
+class DatabaseBlocklistBackend:
+    """Backend storing revoked JTIs in the revoked_tokens table, shared by all workers."""
+
+    def revoke(self, jti: str, expires_at: Optional[float]):
+        expires = None
+        if expires_at is not None:
+            expires = datetime.fromtimestamp(expires_at, timezone.utc).replace(tzinfo=None)
+        db.session.add(RevokedToken(jti=jti, expires_at=expires))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Already revoked by a concurrent request
+            db.session.rollback()
+
+    def is_revoked(self, jti: str) -> bool:
+        # A logout must apply at once, even to requests routed to a replica
+        with use_primary():
+            return db.session.query(RevokedToken.id).filter_by(jti=jti).first() is not None
+
+    def prune(self, now: float) -> int:
+        cutoff = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None)
+        deleted = RevokedToken.query.filter(RevokedToken.expires_at <= cutoff).delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
+
+
+BACKENDS = {
+    'memory': MemoryBlocklistBackend,
+    'database': DatabaseBlocklistBackend,
+}
+
+
+class TokenBlocklist:
+    """Revoked-token store with an in-memory LRU/TTL front cache.
+
+    Revoked JTIs are cached until the token's own expiry, so replays of a
+    revoked token never reach the backend. Lookups for live tokens can be
+    cached for TOKEN_BLOCKLIST_NEGATIVE_TTL seconds; the default of 0 always
+    consults the shared backend, so a logout in one worker applies in all.
+    Expired entries are pruned from the backend at most once per
+    TOKEN_BLOCKLIST_PRUNE_INTERVAL seconds, piggybacking on revocations.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.backend = BACKENDS[app.config['TOKEN_BLOCKLIST_BACKEND']]()
+        self.cache = TTLCache(app.config['TOKEN_BLOCKLIST_CACHE_SIZE'])
+        self.negative_ttl = app.config['TOKEN_BLOCKLIST_NEGATIVE_TTL']
+        self.prune_interval = app.config['TOKEN_BLOCKLIST_PRUNE_INTERVAL']
+        self._last_prune = time.time()
+        app.extensions['token_blocklist'] = self
+
+    def revoke(self, jti: str, expires_at: Optional[float] = None):
+        """Revoke a token until expires_at (epoch seconds)."""
+        self.backend.revoke(jti, expires_at)
+        self.cache.set(jti, True, expires_at)
+
+        now = time.time()
+        if now - self._last_prune >= self.prune_interval:
+            self._last_prune = now
+            self.prune(now)
+
+    def is_revoked(self, jti: str, expires_at: Optional[float] = None) -> bool:
+        """Check whether a token has been revoked."""
+        cached = self.cache.get(jti)
+        if cached is not None:
+            return cached
+
+        revoked = self.backend.is_revoked(jti)
+        if revoked:
+            self.cache.set(jti, True, expires_at)
+        elif self.negative_ttl > 0:
+            self.cache.set(jti, False, time.time() + self.negative_ttl)
+        return revoked
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete entries whose token has already expired. Returns the number removed."""
+        return self.backend.prune(now if now is not None else time.time())
@@ -0,0 +1,516 @@
+"""Bulk export and import of team tasks (with sub-tasks) and private todos.
+
+Exports stream NDJSON or CSV straight from yield_per queries. Imports read
+the upload line by line, validate each record with the same validators as
+the REST endpoints, and insert valid records in chunked transactions of
+multi-row INSERTs. Invalid records are skipped and reported by line
+number. Memory is bounded by the chunk size.
+
+Team task CSV files are flat: a row with record=task is followed by the
+record=sub_task rows whose parent_id is that task's id. NDJSON files hold
+one task per line with its sub-tasks nested under "sub_tasks".
+"""
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from flask import current_app
+from sqlalchemy import func, insert, select
+from app.models import db, User, TeamTask, SubTask, PrivateTodo
+from app.models.team_task import TaskStatus, TEAM_TASK_SERIALIZER
+from app.models.sub_task import SubTaskStatus, SUB_TASK_SERIALIZER
+from app.models.private_todo import TodoStatus, PRIVATE_TODO_SERIALIZER
+from app.utils.pagination import parse_timestamp
+from app.utils.ranking import rank_after
+from app.utils.validators import is_id, validate_title, validate_status
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+TASK_CSV_FIELDS = ('record', 'id', 'parent_id', 'title', 'description', 'status', 'user_id',
+                   'position', 'created_at', 'updated_at')
+TODO_CSV_FIELDS = PRIVATE_TODO_SERIALIZER.fields
+
+TASK_STATUSES = [s.value for s in TaskStatus]
+SUB_TASK_STATUSES = [s.value for s in SubTaskStatus]
+TODO_STATUSES = [s.value for s in TodoStatus]
+
+
+# Spreadsheets run cells starting with these as formulas; exports prefix them with '
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class ImportFormatError(ValueError):
+    """Raised when an upload cannot be read at all (encoding, CSV header)."""
+
+
+# Export
+
+def _csv_escape(value):
+    """Quote text a spreadsheet would otherwise evaluate as a formula."""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_unescape(value):
+    """Undo _csv_escape, so exported files import back unchanged."""
+    if isinstance(value, str) and value.startswith("'") and value[1:].startswith(CSV_FORMULA_PREFIXES):
+        return value[1:]
+    return value
+
+
+class _CSVBuffer:
+    """csv.writer into a reusable buffer that is drained in batches."""
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator='\n')
+
+    def write(self, values: Iterable):
+        self._writer.writerow([
+            '' if v is None else v.isoformat() if isinstance(v, datetime) else _csv_escape(v) for v in values
+        ])
+
+    def drain(self) -> str:
+        value = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return value
+
+
+def _with_sub_tasks(tasks: Iterable, sub_tasks: Iterable) -> Iterator[Tuple[object, List]]:
+    """Pair task rows with their sub-task rows; both streams are ordered by task id."""
+    sub_tasks = iter(sub_tasks)
+    pending = next(sub_tasks, None)
+    for task in tasks:
+        children = []
+        while pending is not None and pending.team_task_id <= task.id:
+            if pending.team_task_id == task.id:
+                children.append(pending)
+            pending = next(sub_tasks, None)
+        yield task, children
+
+
+def export_team_tasks(team_id: int, fmt: str, batch_size: int) -> Iterator[str]:
+    """Yield a team's tasks and sub-tasks as NDJSON or CSV text, batch_size tasks at a time."""
+    tasks = db.session.query(*TEAM_TASK_SERIALIZER.columns).filter(
+        TeamTask.team_id == team_id
+    ).order_by(TeamTask.id).yield_per(batch_size)
+    sub_tasks = db.session.query(*SUB_TASK_SERIALIZER.columns).join(
+        TeamTask, TeamTask.id == SubTask.team_task_id
+    ).filter(TeamTask.team_id == team_id).order_by(SubTask.team_task_id, SubTask.id).yield_per(batch_size)
+    rows = _with_sub_tasks(tasks, sub_tasks)
+
+    if fmt == 'csv':
+        out = _CSVBuffer()
+        out.write(TASK_CSV_FIELDS)
+        for count, (task, children) in enumerate(rows, 1):
+            out.write(('task', task.id, None, task.title, task.description, task.status,
+                       task.assigned_user_id, task.position, task.created_at, task.updated_at))
+            for sub in children:
+                out.write(('sub_task', sub.id, sub.team_task_id, sub.title, None, sub.status,
+                           sub.responsible_user_id, None, sub.created_at, sub.updated_at))
+            if count % batch_size == 0:
+                yield out.drain()
+        yield out.drain()
+        return
+
+    dumps = current_app.json.dumps
+    lines = []
+    for task, children in rows:
+        record = TEAM_TASK_SERIALIZER.from_row(task)
+        record['sub_tasks'] = [SUB_TASK_SERIALIZER.from_row(sub) for sub in children]
+        lines.append(dumps(record) + '\n')
+        if len(lines) >= batch_size:
+            yield ''.join(lines)
+            lines = []
+    yield ''.join(lines)
+
+
+def export_private_todos(user_id: int, fmt: str, batch_size: int) -> Iterator[str]:
+    """Yield a user's private todos as NDJSON or CSV text, batch_size todos at a time."""
+    todos = db.session.query(*PRIVATE_TODO_SERIALIZER.columns).filter(
+        PrivateTodo.owner_user_id == user_id
+    ).order_by(PrivateTodo.id).yield_per(batch_size)
+
+    if fmt == 'csv':
+        out = _CSVBuffer()
+        out.write(TODO_CSV_FIELDS)
+        for count, todo in enumerate(todos, 1):
+            out.write(todo)
+            if count % batch_size == 0:
+                yield out.drain()
+        yield out.drain()
+        return
+
+    dumps = current_app.json.dumps
+    lines = []
+    for todo in todos:
+        lines.append(dumps(PRIVATE_TODO_SERIALIZER.from_row(todo)) + '\n')
+        if len(lines) >= batch_size:
+            yield ''.join(lines)
+            lines = []
+    yield ''.join(lines)
+
+
+# Reading uploads
+
+def open_upload(req) -> Tuple[io.TextIOWrapper, str]:
+    """Return a text stream over an import request's file and its format.
+
+    The file is either a multipart field named "file" or the raw request
+    body. The format comes from ?format=, then the file extension, then the
+    content type, defaulting to NDJSON. Raises ImportFormatError.
+    """
+    upload = req.files.get('file') if req.mimetype == 'multipart/form-data' else None
+    if upload is not None:
+        stream, filename, mimetype = upload.stream, upload.filename or '', upload.mimetype
+    else:
+        stream, filename, mimetype = req.stream, '', req.mimetype
+
+    fmt = req.args.get('format')
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else None
+    if not fmt:
+        fmt = extension if extension in EXPORT_FORMATS else 'csv' if mimetype == 'text/csv' else 'ndjson'
+    if fmt not in EXPORT_FORMATS:
+        raise ImportFormatError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+
+    if not isinstance(stream, io.BufferedIOBase):
+        stream = io.BufferedReader(stream)
+    return io.TextIOWrapper(stream, encoding='utf-8-sig', newline=''), fmt
+
+
+def _lines(stream) -> Iterator[str]:
+    try:
+        yield from stream
+    except UnicodeDecodeError:
+        raise ImportFormatError('File must be UTF-8 encoded')
+
+
+def _read_ndjson(stream) -> Iterator[Tuple[int, object, Optional[dict]]]:
+    """Yield (line, record, errors) for each non-blank line."""
+    for line_no, line in enumerate(_lines(stream), 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line), None
+        except ValueError:
+            yield line_no, None, {'line': 'Invalid JSON'}
+
+
+def _csv_reader(stream, required: Iterable[str]) -> csv.DictReader:
+    reader = csv.DictReader(_lines(stream))
+    try:
+        fields = reader.fieldnames or ()
+    except csv.Error as e:
+        raise ImportFormatError(f'Invalid CSV: {e}')
+    missing = [field for field in required if field not in fields]
+    if missing:
+        raise ImportFormatError(f"CSV header is missing: {', '.join(missing)}")
+    return reader
+
+
+def _csv_rows(reader: csv.DictReader) -> Iterator[Tuple[int, Dict[str, str]]]:
+    line_no = reader.line_num
+    try:
+        for row in reader:
+            yield line_no + 1, {key: _csv_unescape(value) for key, value in row.items()}
+            line_no = reader.line_num
+    except csv.Error as e:
+        raise ImportFormatError(f'Invalid CSV near line {reader.line_num}: {e}')
+
+
+def _csv_int(value: Optional[str]):
+    """Blank is None; other values are ints where possible, left for validation otherwise."""
+    value = (value or '').strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _read_task_csv(stream) -> Iterator[Tuple[int, object, Optional[dict]]]:
+    """Group task rows and the sub-task rows that follow them into NDJSON-shaped records."""
+    reader = _csv_reader(stream, ('title',))
+    current = None  # (line, record, id in the file)
+    for line_no, row in _csv_rows(reader):
+        record_type = (row.get('record') or 'task').strip()
+        if record_type == 'sub_task':
+            if current is None or (row.get('parent_id') or '').strip() != current[2]:
+                yield line_no, None, {'parent_id': 'Sub-task rows must directly follow their task row'}
+                continue
+            current[1]['sub_tasks'].append({
+                'title': row.get('title') or '',
+                'status': row.get('status') or SubTaskStatus.TODO.value,
+                'responsible_user_id': _csv_int(row.get('user_id')),
+            })
+        elif record_type == 'task':
+            if current is not None:
+                yield current[0], current[1], None
+            current = (line_no, {
+                'title': row.get('title') or '',
+                'description': row.get('description') or None,
+                'status': row.get('status') or TaskStatus.TODO.value,
+                'assigned_user_id': _csv_int(row.get('user_id')),
+                'sub_tasks': [],
+            }, (row.get('id') or '').strip())
+        else:
+            yield line_no, None, {'record': 'record must be task or sub_task'}
+    if current is not None:
+        yield current[0], current[1], None
+
+
+def _read_todo_csv(stream) -> Iterator[Tuple[int, object, Optional[dict]]]:
+    reader = _csv_reader(stream, ('title',))
+    for line_no, row in _csv_rows(reader):
+        yield line_no, {
+            'title': row.get('title') or '',
+            'description': row.get('description') or None,
+            'status': row.get('status') or TodoStatus.TODO.value,
+            'due_date': row.get('due_date') or None,
+        }, None
+
+
+# Validation
+
+def _validate(record: dict, statuses: List[str], user_field: Optional[str], user_ids) -> Dict[str, str]:
+    errors = {}
+    title = record.get('title', '')
+    valid, msg = validate_title(title) if isinstance(title, str) else (False, 'Title must be a string')
+    if not valid:
+        errors['title'] = msg
+    if 'status' in record:
+        valid, msg = validate_status(record['status'], statuses)
+        if not valid:
+            errors['status'] = msg
+    description = record.get('description')
+    if description is not None and not isinstance(description, str):
+        errors['description'] = 'Description must be a string'
+    if user_field and record.get(user_field) is not None:
+        if not is_id(record[user_field]):
+            errors[user_field] = f'{user_field} must be an integer'
+        elif record[user_field] not in user_ids:
+            errors[user_field] = f'Invalid {user_field.replace("_id", "").replace("_", " ")}'
+    return errors
+
+
+def _validate_task(record, member_ids) -> Dict[str, str]:
+    if not isinstance(record, dict):
+        return {'line': 'Record must be an object'}
+    errors = _validate(record, TASK_STATUSES, 'assigned_user_id', member_ids)
+    sub_tasks = record.get('sub_tasks') or []
+    if not isinstance(sub_tasks, list):
+        errors['sub_tasks'] = 'sub_tasks must be a list'
+        return errors
+    for i, sub_task in enumerate(sub_tasks):
+        if not isinstance(sub_task, dict):
+            errors[f'sub_tasks[{i}]'] = 'Sub-task must be an object'
+            continue
+        for field, msg in _validate(sub_task, SUB_TASK_STATUSES, 'responsible_user_id', member_ids).items():
+            errors[f'sub_tasks[{i}].{field}'] = msg
+    return errors
+
+
+def _validate_todo(record) -> Dict[str, str]:
+    if not isinstance(record, dict):
+        return {'line': 'Record must be an object'}
+    errors = _validate(record, TODO_STATUSES, None, ())
+    due_date = record.get('due_date')
+    if due_date is not None:
+        try:
+            record['due_date'] = parse_timestamp(due_date)
+        except (TypeError, ValueError, AttributeError):
+            errors['due_date'] = 'Invalid due_date format'
+    return errors
+
+
+# Writing
+
+def _executemany(model, rows: List[dict], returning: bool) -> List[int]:
+    """Insert rows through the driver's executemany, skipping per-row statement compilation.
+
+    INSERT ... RETURNING with ordered ids runs row by row on SQLite. The
+    first row takes the write lock and each later row gets the next rowid
+    (max(rowid) + 1, or past the AUTOINCREMENT sequence), so the inserted
+    ids are the ones up to the new maximum, in input order.
+    """
+    table = model.__table__
+    connection = db.session.connection()
+    columns = list(rows[0])
+    processors = [table.c[column].type.bind_processor(connection.dialect) for column in columns]
+    quote = connection.dialect.identifier_preparer.quote
+    connection.exec_driver_sql(
+        f"INSERT INTO {quote(table.name)} ({', '.join(quote(c) for c in columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})",
+        [
+            tuple(row[c] if p is None else p(row[c]) for c, p in zip(columns, processors))
+            for row in rows
+        ]
+    )
+    if not returning:
+        return []
+    last_id = connection.execute(select(func.max(table.c.id))).scalar()
+    return list(range(last_id - len(rows) + 1, last_id + 1))
+
+
+def _insert_returning(model, rows: List[dict], returning: bool) -> List[int]:
+    """Insert rows as batched multi-row INSERTs (insertmanyvalues), ids in input order."""
+    if returning:
+        stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+        return db.session.scalars(stmt, rows).all()
+    db.session.execute(insert(model), rows)
+    return []
+
+
+def bulk_insert(model, rows: List[dict], returning: bool = False) -> List[int]:
+    """Insert rows in as few statements as possible, returning ids in input order if asked."""
+    if not rows:
+        return []
+    if db.engine.dialect.name == 'sqlite':
+        return _executemany(model, rows, returning)
+    return _insert_returning(model, rows, returning)
+
+
+class _Importer:
+    """Validates records, buffers valid ones and flushes them in committed chunks."""
+
+    def __init__(self, chunk_size: int, max_errors: int):
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.now = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.created = {}
+        self.skipped = 0
+        self.errors = []
+        self._pending, self._pending_rows = [], 0
+
+    def run(self, records: Iterable[Tuple[int, object, Optional[dict]]]) -> dict:
+        for line_no, record, errors in records:
+            errors = errors or self.validate(record)
+            if errors:
+                self.skipped += 1
+                if len(self.errors) < self.max_errors:
+                    self.errors.append({'line': line_no, 'errors': errors})
+                continue
+            self._pending.append(record)
+            self._pending_rows += self.size(record)
+            if self._pending_rows >= self.chunk_size:
+                self._flush()
+        self._flush()
+        return {'created': self.created, 'skipped': self.skipped, 'errors': self.errors}
+
+    def _flush(self):
+        if self._pending:
+            self.write(self._pending)
+            db.session.commit()
+            self._pending, self._pending_rows = [], 0
+
+    def _count(self, key: str, n: int):
+        self.created[key] = self.created.get(key, 0) + n
+
+    def size(self, record) -> int:
+        return 1
+
+
+class _TaskImporter(_Importer):
+
+    def __init__(self, team_id: int, chunk_size: int, max_errors: int):
+        super().__init__(chunk_size, max_errors)
+        self.team_id = team_id
+        self.created = {'team_tasks': 0, 'sub_tasks': 0}
+        self.member_ids = {user_id for (user_id,) in db.session.query(User.id).filter(User.team_id == team_id)}
+        # New tasks go to the end of their column
+        self.tails = dict(db.session.query(TeamTask.status, func.max(TeamTask.position)).filter(
+            TeamTask.team_id == team_id
+        ).group_by(TeamTask.status).all())
+
+    def validate(self, record) -> Dict[str, str]:
+        return _validate_task(record, self.member_ids)
+
+    def size(self, record) -> int:
+        return 1 + len(record.get('sub_tasks') or [])
+
+    def write(self, records: List[dict]):
+        done = SubTaskStatus.DONE.value
+        task_rows = []
+        for record in records:
+            status = record.get('status', TaskStatus.TODO.value)
+            self.tails[status] = rank_after(self.tails.get(status))
+            sub_tasks = record.get('sub_tasks') or []
+            task_rows.append({
+                'team_id': self.team_id,
+                'title': record['title'],
+                'description': record.get('description'),
+                'status': status,
+                'assigned_user_id': record.get('assigned_user_id'),
+                'position': self.tails[status],
+                'sub_task_total': len(sub_tasks),
+                'sub_task_done': sum(1 for s in sub_tasks if s.get('status') == done),
+                'created_at': self.now,
+                'updated_at': self.now,
+            })
+        task_ids = bulk_insert(TeamTask, task_rows, returning=True)
+
+        sub_task_rows = [
+            {
+                'team_task_id': task_id,
+                'title': sub_task['title'],
+                'status': sub_task.get('status', SubTaskStatus.TODO.value),
+                'responsible_user_id': sub_task.get('responsible_user_id'),
+                'created_at': self.now,
+                'updated_at': self.now,
+            }
+            for task_id, record in zip(task_ids, records)
+            for sub_task in record.get('sub_tasks') or []
+        ]
+        bulk_insert(SubTask, sub_task_rows)
+        self._count('team_tasks', len(task_rows))
+        self._count('sub_tasks', len(sub_task_rows))
+
+
+class _TodoImporter(_Importer):
+
+    def __init__(self, user_id: int, chunk_size: int, max_errors: int):
+        super().__init__(chunk_size, max_errors)
+        self.user_id = user_id
+        self.created = {'private_todos': 0}
+
+    def validate(self, record) -> Dict[str, str]:
+        return _validate_todo(record)
+
+    def write(self, records: List[dict]):
+        bulk_insert(PrivateTodo, [
+            {
+                'owner_user_id': self.user_id,
+                'title': record['title'],
+                'description': record.get('description'),
+                'status': record.get('status', TodoStatus.TODO.value),
+                'due_date': record.get('due_date'),
+                'created_at': self.now,
+                'updated_at': self.now,
+            }
+            for record in records
+        ])
+        self._count('private_todos', len(records))
+
+
+def import_team_tasks(stream, fmt: str, team_id: int, chunk_size: int, max_errors: int) -> dict:
+    """Import tasks and sub-tasks from a text stream into a team's board.
+
+    Returns {'created': {...}, 'skipped': n, 'errors': [{'line', 'errors'}]},
+    listing at most max_errors errors. Raises ImportFormatError if the file
+    cannot be read; chunks committed before that point are kept.
+    """
+    records = _read_task_csv(stream) if fmt == 'csv' else _read_ndjson(stream)
+    return _TaskImporter(team_id, chunk_size, max_errors).run(records)
+
+
+def import_private_todos(stream, fmt: str, user_id: int, chunk_size: int, max_errors: int) -> dict:
+    """Import private todos from a text stream for a user; see import_team_tasks."""
+    records = _read_todo_csv(stream) if fmt == 'csv' else _read_ndjson(stream)
+    return _TodoImporter(user_id, chunk_size, max_errors).run(records)
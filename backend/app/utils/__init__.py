@@ -1,4 +1,4 @@
 from .responses import success_response, error_response
-from .decorators import admin_required
+from .decorators import admin_required, get_current_user_or_error
 
-__all__ = ['success_response', 'error_response', 'admin_required']
+__all__ = ['success_response', 'error_response', 'admin_required', 'get_current_user_or_error']
@@ -1,15 +1,25 @@
 from functools import wraps
-from flask_jwt_extended import get_jwt_identity
-from app.models import User
+from flask_jwt_extended import current_user
 from app.utils.responses import error_response
 
 
+def get_current_user_or_error():
+    """Return the authenticated user for this request.
+
+    The user is fetched by the JWT user lookup hook at most once per request
+    and cached on flask.g, so calling this repeatedly is free.
+    """
+    user = current_user
+    if not user:
+        return None, error_response('User not found', 404)
+    return user, None
+
+
 def admin_required(f):
     """Decorator to require admin role for a route."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        user_id = get_jwt_identity()
-        user = User.query.get(user_id)
+        user = current_user
         if not user or not user.is_admin():
             return error_response('Admin access required', 403)
         return f(*args, **kwargs)
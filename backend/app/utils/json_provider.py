@@ -0,0 +1,55 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _default(o: Any) -> Any:
+    if isinstance(o, date):
+        return o.isoformat()
+    if isinstance(o, (Decimal, UUID)):
+        return str(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    raise TypeError(f'Object of type {type(o).__name__} is not JSON serializable')
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """Flask's stdlib json provider, but with ISO 8601 datetimes."""
+    default = staticmethod(_default)
+    sort_keys = False
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson.
+
+    orjson encodes datetimes natively (ISO 8601, identical to
+    datetime.isoformat() for the naive UTC values we store) and writes bytes
+    straight into the response without an intermediate str.
+    """
+    mimetype = 'application/json'
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_default).decode('utf-8')
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=_default), mimetype=self.mimetype)
+
+
+def get_json_provider_class(name: str):
+    """Resolve the JSON_PROVIDER setting ('auto', 'orjson' or 'stdlib')."""
+    if name == 'stdlib' or (name == 'auto' and orjson is None):
+        return StdlibJSONProvider
+    if orjson is None:
+        raise RuntimeError('JSON_PROVIDER=orjson requires the orjson package')
+    return OrjsonProvider
@@ -0,0 +1,119 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from flask import current_app, g, request
+
+logger = logging.getLogger('taskish')
+request_logger = logging.getLogger('taskish.request')
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, merging the record's `fields`."""
+
+    def format(self, record):
+        event = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        event.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            event['exception'] = self.formatException(record.exc_info)
+        return json.dumps(event, default=str)
+
+
+def log_context(**fields):
+    """Attach fields to the current request's log event."""
+    g.setdefault('log_fields', {}).update(fields)
+
+
+def redact_headers(headers, redacted) -> dict:
+    """Return headers as a dict with sensitive values replaced."""
+    redacted = {name.lower() for name in redacted}
+    return {
+        name: '[REDACTED]' if name.lower() in redacted else value
+        for name, value in headers.items()
+    }
+
+
+def _start_listener(app):
+    """Route the taskish logger through a queue drained by a background thread."""
+    global _listener
+    if _listener is not None:
+        return
+
+    if app.config['LOG_FILE']:
+        target = logging.FileHandler(app.config['LOG_FILE'], delay=True)
+    else:
+        target = logging.StreamHandler(sys.stdout)
+    target.setFormatter(JsonFormatter())
+
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, target, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    # The listener thread does not survive fork (e.g. gunicorn preload_app)
+    os.register_at_fork(after_in_child=_restart_listener)
+
+
+def _restart_listener():
+    global _listener
+    _listener = QueueListener(_listener.queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def _before_request():
+    g.request_started = time.perf_counter()
+
+
+def _after_request(response):
+    config = current_app.config
+    # Errors are always logged; successful requests are sampled.
+    if response.status_code < 400 and random.random() >= config['LOG_SAMPLE_RATE']:
+        return response
+    if not request_logger.isEnabledFor(logging.INFO):
+        return response
+
+    started = g.get('request_started')
+    fields = {
+        'method': request.method,
+        'path': request.path,
+        'endpoint': request.endpoint,
+        'status': response.status_code,
+        'duration_ms': round((time.perf_counter() - started) * 1000, 2) if started else None,
+        'remote_addr': request.remote_addr,
+    }
+    if config['LOG_HEADERS']:
+        fields['headers'] = redact_headers(request.headers, config['LOG_REDACT_HEADERS'])
+    fields.update(g.get('log_fields', {}))
+
+    level = logging.ERROR if response.status_code >= 500 else logging.INFO
+    request_logger.log(level, 'request', extra={'fields': fields})
+    return response
+
+
+def init_logging(app):
+    """Set up structured, queue-backed request logging for the app.
+
+    Handlers run on a QueueListener thread, so request threads only enqueue
+    a record. Each request emits a single JSON event; request bodies are
+    never logged and sensitive headers are redacted.
+    """
+    logger.setLevel(app.config['LOG_LEVEL'])
+    _start_listener(app)
+    app.before_request(_before_request)
+    app.after_request(_after_request)
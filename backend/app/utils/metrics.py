@@ -0,0 +1,185 @@
+import hmac
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from app.utils.log import log_context
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _labels(names, values, extra='') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Counter:
+    """Monotonic counter with labels, rendered in Prometheus text format."""
+    type = 'counter'
+
+    def __init__(self, name: str, help: str, label_names: tuple):
+        self.name, self.help, self.label_names = name, help, label_names
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: tuple, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            yield f'{self.name}{_labels(self.label_names, labels)} {value}'
+
+
+class Histogram:
+    """Fixed-bucket histogram with labels, rendered in Prometheus text format."""
+    type = 'histogram'
+
+    def __init__(self, name: str, help: str, label_names: tuple, buckets: tuple):
+        self.name, self.help, self.label_names, self.buckets = name, help, label_names, buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def samples(self):
+        with self._lock:
+            series = sorted((labels, (list(counts), total)) for labels, (counts, total) in self._series.items())
+        for labels, (counts, total) in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += count
+                le = f'le="{bound}"'
+                yield f'{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}'
+            yield f'{self.name}_sum{_labels(self.label_names, labels)} {total}'
+            yield f'{self.name}_count{_labels(self.label_names, labels)} {cumulative}'
+
+
+@contextmanager
+def timed(phase: str = 'serialize'):
+    """Add the time spent in the block to the current request's phase timer."""
+    if not has_request_context():
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = g.setdefault('phase_timings', {})
+        timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - started
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get('query_started')
+    if started and has_request_context():
+        g.db_time = g.get('db_time', 0.0) + time.perf_counter() - started.pop()
+        g.db_queries = g.get('db_queries', 0) + 1
+
+
+class RequestMetrics:
+    """Per-request query count, DB time, serialization time and total time.
+
+    SQLAlchemy cursor events accumulate query count and DB time on flask.g;
+    timed() accumulates serialization time. After each request the numbers
+    are sent as a Server-Timing header, added to the request log event and
+    folded into per-endpoint histograms exposed at /metrics in Prometheus
+    text format. Metrics are per process; under gunicorn each worker
+    reports its own.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        from app.models import db
+
+        labels = ('endpoint', 'method')
+        self.requests = Counter('taskish_requests_total', 'Requests handled.', labels + ('status',))
+        self.duration = Histogram('taskish_request_duration_seconds', 'Total request time.', labels, LATENCY_BUCKETS)
+        self.db_duration = Histogram('taskish_request_db_duration_seconds', 'Time spent in SQL per request.',
+                                     labels, LATENCY_BUCKETS)
+        self.serialize_duration = Histogram('taskish_request_serialize_duration_seconds',
+                                            'Time spent serializing per request.', labels, LATENCY_BUCKETS)
+        self.queries = Histogram('taskish_request_queries', 'SQL statements per request.', labels, QUERY_BUCKETS)
+        self.server_timing = app.config['SERVER_TIMING']
+        self.token = app.config['METRICS_TOKEN']
+        app.extensions['request_metrics'] = self
+
+        if not app.config['METRICS_ENABLED']:
+            return
+        with app.app_context():
+            for engine in db.engines.values():
+                if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+                    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+                    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.add_url_rule('/metrics', 'metrics', self.export)
+
+    def _before_request(self):
+        g.metrics_started = time.perf_counter()
+        g.db_time = 0.0
+        g.db_queries = 0
+        g.phase_timings = {}
+
+    def _after_request(self, response):
+        if request.endpoint == 'metrics':
+            return response
+        total = time.perf_counter() - g.metrics_started
+        db_time = g.get('db_time', 0.0)
+        queries = g.get('db_queries', 0)
+        serialize = g.get('phase_timings', {}).get('serialize', 0.0)
+
+        labels = (request.endpoint or 'unmatched', request.method)
+        self.requests.inc(labels + (str(response.status_code),))
+        self.duration.observe(labels, total)
+        self.db_duration.observe(labels, db_time)
+        self.serialize_duration.observe(labels, serialize)
+        self.queries.observe(labels, queries)
+
+        log_context(db_queries=queries, db_ms=round(db_time * 1000, 2), serialize_ms=round(serialize * 1000, 2))
+        if self.server_timing:
+            response.headers['Server-Timing'] = (
+                f'db;dur={db_time * 1000:.2f};desc="{queries} queries", '
+                f'serialize;dur={serialize * 1000:.2f}, '
+                f'app;dur={max(total - db_time - serialize, 0) * 1000:.2f}, '
+                f'total;dur={total * 1000:.2f}'
+            )
+        return response
+
+    def export(self):
+        """Render all metrics in Prometheus text exposition format."""
+        if self.token and not hmac.compare_digest(
+                request.headers.get('Authorization', ''), f'Bearer {self.token}'):
+            return 'Unauthorized\n', 401, {'Content-Type': PROMETHEUS_CONTENT_TYPE, 'WWW-Authenticate': 'Bearer'}
+        lines = []
+        for metric in (self.requests, self.duration, self.db_duration, self.serialize_duration, self.queries):
+            lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n', 200, {'Content-Type': PROMETHEUS_CONTENT_TYPE}
@@ -0,0 +1,71 @@
+"""Lexicographic ranks for ordering items by a string column.
+
+A rank is a base-36 fraction written as its digits after the point, so
+ranks compare correctly as plain strings ('' is 0, 'i' is 0.5, 'i8' is a
+bit more). There is always another rank between two distinct ranks, so an
+item can be moved by rewriting only its own rank. Ranks never end in '0',
+which keeps room below every rank.
+"""
+from typing import List, Optional
+
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+BASE = len(DIGITS)
+# Appends step by one unit in the RANK_WIDTH-th digit, so ranks stay this
+# short for about 36**6 appends
+RANK_WIDTH = 6
+
+
+def _midpoint(a: str, b: Optional[str]) -> str:
+    if b is not None:
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else '0') == b[n]:
+            n += 1
+        if n:
+            return b[:n] + _midpoint(a[n:], b[n:])
+
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else BASE
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b) // 2]
+    if b is not None and len(b) > 1:
+        return b[0]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """Return a rank sorting after `before` and before `after` (None = open end)."""
+    before = before or ''
+    if after is not None and before >= after:
+        raise ValueError(f'No rank between {before!r} and {after!r}')
+    return _midpoint(before, after)
+
+
+def rank_after(rank: Optional[str]) -> str:
+    """Return a short rank sorting after `rank`, for appending to the end of a list."""
+    if not rank:
+        return DIGITS[BASE // 2]
+    digits = [DIGITS.index(c) for c in rank[:RANK_WIDTH].ljust(RANK_WIDTH, '0')]
+    for i in reversed(range(RANK_WIDTH)):
+        if digits[i] < BASE - 1:
+            digits[i] += 1
+            return ''.join(DIGITS[d] for d in digits[:i + 1]).rstrip('0')
+        digits[i] = 0
+    # Past 'zzzzzz': fall back to bisecting towards the end
+    return rank_between(rank, None)
+
+
+def spaced_ranks(count: int) -> List[str]:
+    """Return `count` ascending ranks spread evenly, for (re)numbering a whole list."""
+    width = 1
+    while BASE ** width < (count + 1) * BASE:
+        width += 1
+    step = BASE ** width // (count + 1)
+
+    ranks = []
+    for i in range(1, count + 1):
+        value, digits = i * step, []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        ranks.append(''.join(reversed(digits)).rstrip('0'))
+    return ranks
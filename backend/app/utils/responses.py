@@ -1,15 +1,99 @@
-from flask import jsonify
-from typing import Any, Optional
+import hashlib
+from flask import current_app, g, jsonify, request, stream_with_context
+from typing import Any, Callable, Iterable, Optional
+from app.utils.metrics import timed
 
 
-def success_response(data: Any = None, message: Optional[str] = None, status_code: int = 200):
+def compute_etag(*parts: Any) -> str:
+    """Build a strong ETag value from cheap version stamps (ids, counts, timestamps)."""
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+
+def not_modified(*parts: Any):
+    """Return a 304 response if the client already has this version, else None.
+
+    Call this with a version stamp before loading and serializing a resource;
+    the ETag is remembered so success_response sends it with the full body.
+    """
+    etag = compute_etag(*parts)
+    g.etag = etag
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+    return None
+
+
+def success_response(data: Any = None, message: Optional[str] = None, status_code: int = 200,
+                     meta: Optional[dict] = None):
     """Create a standardized success response."""
     response = {'success': True}
     if data is not None:
         response['data'] = data
     if message:
         response['message'] = message
-    return jsonify(response), status_code
+    if meta:
+        response['meta'] = meta
+    with timed('serialize'):
+        response = jsonify(response)
+    response.status_code = status_code
+
+    # Conditional GET: use the route's version stamp if it set one, otherwise
+    # fall back to hashing the body so every endpoint supports If-None-Match.
+    if request.method in ('GET', 'HEAD') and status_code == 200:
+        if g.get('etag'):
+            response.set_etag(g.etag)
+        else:
+            response.add_etag()
+        response.headers['Cache-Control'] = 'private, no-cache'
+        response.make_conditional(request)
+    return response, response.status_code
+
+
+def wants_stream(args) -> bool:
+    """Whether the client asked for a streamed list (?stream=1)."""
+    return args.get('stream', '').lower() in ('1', 'true')
+
+
+def stream_success_response(rows: Iterable, serialize: Callable[[Any], Any]):
+    """Stream a success_response envelope around a list without holding it in memory.
+
+    Pass a lazily fetched iterable such as a Query with yield_per(); rows
+    are serialized and written out STREAM_BATCH_SIZE at a time, so memory
+    stays flat however long the list is. The body is the same
+    {"success": true, "data": [...]} document success_response produces.
+    Headers go out before the first row is read, so an error part-way
+    through can only cut the body short (which clients see as invalid JSON).
+    """
+    dumps = current_app.json.dumps
+    batch_size = current_app.config['STREAM_BATCH_SIZE']
+
+    def generate():
+        yield '{"success": true, "data": ['
+        separator, batch = '', []
+        for row in rows:
+            batch.append(dumps(serialize(row)))
+            if len(batch) >= batch_size:
+                yield separator + ','.join(batch)
+                separator, batch = ',', []
+        if batch:
+            yield separator + ','.join(batch)
+        yield ']}'
+
+    response = current_app.response_class(stream_with_context(generate()), mimetype='application/json')
+    if g.get('etag'):
+        response.set_etag(g.etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def download_response(chunks: Iterable[str], filename: str, mimetype: str):
+    """Stream text chunks as a file attachment."""
+    response = current_app.response_class(stream_with_context(chunks), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response.headers['Cache-Control'] = 'private, no-store'
+    return response
 
 
 def error_response(message: str, status_code: int = 400, errors: Optional[dict] = None):
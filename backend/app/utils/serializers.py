@@ -0,0 +1,37 @@
+from operator import attrgetter
+from typing import Iterable, Optional, Sequence
+
+
+class ModelSerializer:
+    """Column-driven serializer compiled once per model.
+
+    The field list and attribute getter are built up front, so serializing
+    an instance is one attrgetter call and a dict(zip()). The same field
+    order can be used to select bare columns and serialize the resulting
+    Row tuples without loading ORM instances at all. Datetimes are left as
+    is for the JSON provider to encode.
+    """
+
+    def __init__(self, model, fields: Optional[Sequence[str]] = None, exclude: Iterable[str] = ()):
+        if fields is None:
+            exclude = set(exclude)
+            fields = [c.key for c in model.__table__.columns if c.key not in exclude]
+        self.model = model
+        self.fields = tuple(fields)
+        self._getter = attrgetter(*self.fields)
+
+    @property
+    def columns(self) -> tuple:
+        """Model columns in field order, for use in select()."""
+        return tuple(getattr(self.model, field) for field in self.fields)
+
+    def from_object(self, obj) -> dict:
+        """Serialize a model instance."""
+        values = self._getter(obj)
+        if len(self.fields) == 1:
+            values = (values,)
+        return dict(zip(self.fields, values))
+
+    def from_row(self, row: Sequence) -> dict:
+        """Serialize a tuple of values selected in `columns` order."""
+        return dict(zip(self.fields, row))
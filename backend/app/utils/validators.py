@@ -2,6 +2,11 @@ import re
 from typing import Tuple, Optional
 
 
+def is_id(value) -> bool:
+    """Check a JSON value is an integer id; JSON true/false are not ids."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
 def validate_email(email: str) -> Tuple[bool, Optional[str]]:
     """Validate email format."""
     if not email:
@@ -0,0 +1,103 @@
+"""Microbenchmark: board serialization, legacy vs compiled serializers.
+
+Compares the original per-field to_dict() with isoformat() plus stdlib json
+(sort_keys, as Flask's default provider did) against the compiled
+ModelSerializer row path plus the configured JSON provider.
+
+    python benchmarks/bench_serialization.py --tasks 2000 --repeat 20
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from app.models import db, User, Team, TeamTask  # noqa: E402
+from app.services.board import load_board  # noqa: E402
+from app.utils.json_provider import StdlibJSONProvider, OrjsonProvider, orjson  # noqa: E402
+
+
+def legacy_to_dict(task):
+    result = {
+        'id': task.id,
+        'team_id': task.team_id,
+        'title': task.title,
+        'description': task.description,
+        'status': task.status,
+        'assigned_user_id': task.assigned_user_id,
+        'created_at': task.created_at.isoformat() if task.created_at else None,
+        'updated_at': task.updated_at.isoformat() if task.updated_at else None,
+        'progress': task.progress,
+    }
+    if task.assigned_user:
+        result['assigned_user'] = {
+            'id': task.assigned_user.id,
+            'name': task.assigned_user.name,
+            'email': task.assigned_user.email,
+        }
+    return result
+
+
+def seed(n):
+    team = Team(name='Bench')
+    db.session.add(team)
+    db.session.flush()
+    user = User(name='Bench User', email='bench@example.com', team_id=team.id, password_hash='x')
+    db.session.add(user)
+    db.session.flush()
+    db.session.add_all(
+        TeamTask(team_id=team.id, title=f'Task {i}', description='x' * 80,
+                 assigned_user_id=user.id if i % 2 else None)
+        for i in range(n)
+    )
+    db.session.commit()
+    return team.id
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        team_id = seed(args.tasks)
+
+        def legacy():
+            db.session.expire_all()
+            tasks = TeamTask.query.filter_by(team_id=team_id).order_by(
+                TeamTask.created_at.desc(), TeamTask.id.desc()).limit(args.tasks).all()
+            json.dumps([legacy_to_dict(t) for t in tasks], sort_keys=True)
+
+        providers = {'stdlib': StdlibJSONProvider(app)}
+        if orjson is not None:
+            providers['orjson'] = OrjsonProvider(app)
+
+        results = {'legacy': timed(legacy, args.repeat)}
+        for name, provider in providers.items():
+            def compiled(provider=provider):
+                board, _ = load_board(team_id, args.tasks)
+                provider.dumps(board)
+            results[f'rows+{name}'] = timed(compiled, args.repeat)
+
+        baseline = results['legacy']
+        for name, seconds in results.items():
+            print(f'{name:>14}: {seconds * 1000:8.2f} ms  ({baseline / seconds:4.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Startup benchmark: import time, create_app() and time to first request.
+
+Each run is a fresh interpreter against a throwaway SQLite file, which is
+what a gunicorn worker pays on boot. Medians are written to
+benchmarks/results/startup.json under --label so results can be compared
+across changes.
+
+    python benchmarks/bench_startup.py --runs 15 --label after
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_FILE = os.path.join(BACKEND_DIR, 'benchmarks', 'results', 'startup.json')
+
+PROBE = '''
+import json, time
+started = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app('development')
+created = time.perf_counter()
+response = app.test_client().get('/api/health/db')
+assert response.status_code == 200, response.status_code
+served = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - started) * 1000,
+    'create_app_ms': (created - imported) * 1000,
+    'first_request_ms': (served - created) * 1000,
+}))
+'''
+
+
+def run_once(env):
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE], cwd=BACKEND_DIR, env=env,
+        check=True, capture_output=True, text=True
+    ).stdout
+    sample = json.loads(output.strip().splitlines()[-1])
+    sample['process_ms'] = (time.perf_counter() - started) * 1000
+    return sample
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=15)
+    parser.add_argument('--label', default='current')
+    parser.add_argument('--no-save', action='store_true')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f'sqlite:///{tmp}/startup.db', LOG_LEVEL='WARNING')
+        run_once(env)  # warm the filesystem cache and any bytecode
+        samples = [run_once(env) for _ in range(args.runs)]
+
+    result = {
+        key: round(statistics.median(sample[key] for sample in samples), 2)
+        for key in ('import_ms', 'create_app_ms', 'first_request_ms', 'process_ms')
+    }
+    result.update(runs=args.runs, python=platform.python_version())
+    for key, value in result.items():
+        print(f'{key:>18}: {value}')
+
+    if not args.no_save:
+        results = {}
+        if os.path.exists(RESULTS_FILE):
+            with open(RESULTS_FILE) as f:
+                results = json.load(f)
+        results[args.label] = result
+        os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+        with open(RESULTS_FILE, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
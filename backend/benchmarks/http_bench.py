@@ -0,0 +1,258 @@
+"""HTTP benchmark: scripted workloads against the real API endpoints.
+
+Seed a database first, then run the workloads against a running server or
+an in-process threaded server on the same database:
+
+    export DATABASE_URL=sqlite:///bench.db FLASK_APP=run.py
+    flask bootstrap-db && flask seed-bench
+    python benchmarks/http_bench.py --label baseline
+    RATE_LIMIT_ENABLED=false gunicorn -c gunicorn.conf.py run:app &
+    python benchmarks/http_bench.py --base-url http://127.0.0.1:8000 --label gunicorn \\
+        --compare benchmarks/results/http-baseline.json
+
+Workloads:
+  board   GET the team board as a member
+  drag    PATCH a task's status as the team admin (board drag and drop)
+  detail  GET a single task
+  login   POST credentials (bcrypt bound)
+
+Each workload sends --requests requests from --concurrency threads, each
+with its own keep-alive connection, and reports p50/p95/p99 latency and
+throughput. Results are written to benchmarks/results/http-<label>.json.
+"""
+import argparse
+import http.client
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BACKEND_DIR, 'benchmarks', 'results')
+sys.path.insert(0, BACKEND_DIR)
+# The login and drag workloads would otherwise measure the rate limiter's 429s
+os.environ.setdefault('RATE_LIMIT_ENABLED', 'false')
+
+from app.services.seed import seed_email  # noqa: E402
+
+STATUSES = ('TODO', 'IN_PROGRESS', 'BLOCKED', 'DONE')
+METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'throughput_rps')
+
+
+class Client:
+    """Minimal JSON client over one persistent http.client connection."""
+
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection_class(parts.hostname, parts.port, timeout=60)
+        self.prefix = parts.path.rstrip('/')
+
+    def request(self, method, path, body=None, token=None):
+        headers = {'Accept': 'application/json'}
+        if body is not None:
+            body = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        try:
+            self.connection.request(method, self.prefix + path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            payload = response.read()
+        except (http.client.HTTPException, OSError):
+            # Server dropped the keep-alive connection; retry once on a new one
+            self.connection.close()
+            self.connection.request(method, self.prefix + path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            payload = response.read()
+        return response.status, payload
+
+    def json(self, method, path, body=None, token=None):
+        status, payload = self.request(method, path, body, token)
+        if status >= 400:
+            raise RuntimeError(f'{method} {path} failed with {status}: {payload[:200]!r}')
+        return json.loads(payload)['data']
+
+
+def login(client, email, password):
+    return client.json('POST', '/api/auth/login', {'email': email, 'password': password})['access_token']
+
+
+def prepare(base_url, teams, users_per_team, password):
+    """Log in as each team's admin and one member and collect task ids."""
+    client = Client(base_url)
+    context = {'teams': [], 'password': password, 'users_per_team': users_per_team}
+    for t in range(teams):
+        admin = login(client, seed_email(t, 0), password)
+        member = login(client, seed_email(t, min(1, users_per_team - 1)), password)
+        tasks = client.json('GET', '/api/team-tasks?limit=500', token=member)
+        if not tasks:
+            raise RuntimeError(f'Team {t} has no tasks; run flask seed-bench first')
+        context['teams'].append({'admin': admin, 'member': member, 'task_ids': [task['id'] for task in tasks]})
+    return context
+
+
+def board(rng, context):
+    team = rng.choice(context['teams'])
+    return 'GET', '/api/team-tasks', None, team['member']
+
+
+def drag(rng, context):
+    team = rng.choice(context['teams'])
+    task_id = rng.choice(team['task_ids'])
+    return 'PATCH', f'/api/team-tasks/{task_id}/status', {'status': rng.choice(STATUSES)}, team['admin']
+
+
+def detail(rng, context):
+    team = rng.choice(context['teams'])
+    return 'GET', f"/api/team-tasks/{rng.choice(team['task_ids'])}", None, team['member']
+
+
+def login_burst(rng, context):
+    email = seed_email(rng.randrange(len(context['teams'])), rng.randrange(context['users_per_team']))
+    return 'POST', '/api/auth/login', {'email': email, 'password': context['password']}, None
+
+
+WORKLOADS = {'board': board, 'drag': drag, 'detail': detail, 'login': login_burst}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def run_workload(base_url, workload, context, requests, concurrency, seed):
+    remaining = iter(range(requests))
+    lock = threading.Lock()
+    latencies, statuses = [], {}
+
+    def worker(index):
+        client = Client(base_url)
+        rng = random.Random(seed * 1000 + index)
+        local_latencies, local_statuses = [], {}
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    break
+            method, path, body, token = workload(rng, context)
+            started = time.perf_counter()
+            status, _ = client.request(method, path, body, token)
+            local_latencies.append((time.perf_counter() - started) * 1000)
+            local_statuses[status] = local_statuses.get(status, 0) + 1
+        with lock:
+            latencies.extend(local_latencies)
+            for status, count in local_statuses.items():
+                statuses[status] = statuses.get(status, 0) + count
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': sum(count for status, count in statuses.items() if status >= 400),
+        'status_codes': {str(status): count for status, count in sorted(statuses.items())},
+        'duration_s': round(elapsed, 3),
+        'throughput_rps': round(len(latencies) / elapsed, 1),
+        'mean_ms': round(sum(latencies) / len(latencies), 2),
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'max_ms': round(latencies[-1], 2),
+    }
+
+
+def start_local_server():
+    """Serve the app from this process on an ephemeral port, without access logs."""
+    from werkzeug.serving import make_server
+    from app import create_app
+
+    app = create_app()
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    logging.getLogger('taskish.request').setLevel(logging.WARNING)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_port}'
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)['workloads']
+    print(f'\nChange vs {baseline_path} (latency: lower is better, throughput: higher is better)')
+    for name, metrics in results.items():
+        if name not in baseline:
+            continue
+        changes = []
+        for metric in METRICS:
+            before, after = baseline[name][metric], metrics[metric]
+            changes.append(f'{metric} {(after - before) / before * 100:+.1f}%' if before else f'{metric} n/a')
+        print(f'  {name:>7}: ' + ', '.join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', help='Server to benchmark (default: start one in-process)')
+    parser.add_argument('--workloads', default=','.join(WORKLOADS), help='Comma-separated workloads to run')
+    parser.add_argument('--requests', type=int, default=500, help='Requests per workload')
+    parser.add_argument('--login-requests', type=int, default=50, help='Requests for the login workload')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--teams', type=int, default=10, help='Seeded teams to spread load across')
+    parser.add_argument('--users-per-team', type=int, default=20)
+    parser.add_argument('--password', default='benchmark')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--label', default='current')
+    parser.add_argument('--compare', help='Previous results file to compare against')
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server, base_url = start_local_server()
+
+    try:
+        context = prepare(base_url, args.teams, args.users_per_team, args.password)
+        results = {}
+        for name in args.workloads.split(','):
+            requests = args.login_requests if name == 'login' else args.requests
+            results[name] = run_workload(base_url, WORKLOADS[name], context, requests, args.concurrency, args.seed)
+            metrics = results[name]
+            print(f"{name:>7}: {metrics['requests']} req, {metrics['errors']} errors, "
+                  f"{metrics['throughput_rps']} req/s, p50 {metrics['p50_ms']} ms, "
+                  f"p95 {metrics['p95_ms']} ms, p99 {metrics['p99_ms']} ms")
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    output = {
+        'label': args.label,
+        'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'base_url': args.base_url or 'in-process',
+        'concurrency': args.concurrency,
+        'python': platform.python_version(),
+        'workloads': results,
+    }
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f'http-{args.label}.json')
+    with open(path, 'w') as f:
+        json.dump(output, f, indent=2)
+        f.write('\n')
+    print(f'Saved {path}')
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
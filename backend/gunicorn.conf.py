@@ -0,0 +1,21 @@
+import os
+
+# gunicorn settings; command-line flags still take precedence. gunicorn
+# binds to 0.0.0.0:$PORT on its own when PORT is set.
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+# Load the app once in the master and fork workers from it
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+
+def post_fork(server, worker):
+    """Give each worker its own connection pool.
+
+    With preload_app the master creates the engine (and may open
+    connections) before forking; sharing those sockets across processes
+    corrupts the protocol stream, so each worker starts with an empty pool.
+    """
+    if server.cfg.preload_app:
+        from app.services.database import dispose_engines
+        dispose_engines(server.app.wsgi())
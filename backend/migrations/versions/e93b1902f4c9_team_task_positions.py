@@ -0,0 +1,77 @@
+"""team task positions
+
+Revision ID: e93b1902f4c9
+Revises: 724b8339e9dc
+Create Date: 2026-10-17 03:34:30.832189
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e93b1902f4c9'
+down_revision = '724b8339e9dc'
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of app.utils.ranking.spaced_ranks at this revision
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+
+def spaced_ranks(count):
+    width = 1
+    while 36 ** width < (count + 1) * 36:
+        width += 1
+    step = 36 ** width // (count + 1)
+    ranks = []
+    for i in range(1, count + 1):
+        value, digits = i * step, []
+        for _ in range(width):
+            value, digit = divmod(value, 36)
+            digits.append(DIGITS[digit])
+        ranks.append(''.join(reversed(digits)).rstrip('0'))
+    return ranks
+
+
+def upgrade():
+    # Plain ALTERs: a batch table rebuild on SQLite would drop the search triggers
+    op.add_column('team_tasks', sa.Column(
+        'position',
+        sa.String(length=255).with_variant(sa.String(length=255, collation='C'), 'postgresql'),
+        server_default='',
+        nullable=False
+    ))
+
+    # Existing columns keep their created_at order
+    conn = op.get_bind()
+    team_tasks = sa.table('team_tasks', sa.column('id'), sa.column('team_id'), sa.column('status'),
+                          sa.column('created_at'), sa.column('position'))
+    columns = {}
+    for task_id, team_id, status in conn.execute(
+        sa.select(team_tasks.c.id, team_tasks.c.team_id, team_tasks.c.status).order_by(
+            team_tasks.c.team_id, team_tasks.c.status, team_tasks.c.created_at, team_tasks.c.id
+        )
+    ):
+        columns.setdefault((team_id, status), []).append(task_id)
+    params = [
+        {'task_id': task_id, 'position': position}
+        for ids in columns.values()
+        for task_id, position in zip(ids, spaced_ranks(len(ids)))
+    ]
+    if params:
+        conn.execute(
+            team_tasks.update().where(team_tasks.c.id == sa.bindparam('task_id')).values(
+                position=sa.bindparam('position')
+            ),
+            params
+        )
+
+    op.create_index('ix_team_tasks_team_status_position', 'team_tasks',
+                    ['team_id', 'status', 'position', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_team_tasks_team_status_position', table_name='team_tasks')
+    op.drop_column('team_tasks', 'position')
@@ -0,0 +1,101 @@
+"""full-text search
+
+Revision ID: f3e7bd424ba1
+Revises: f1f1f1d5af41
+Create Date: 2026-10-17 03:22:46.125654
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3e7bd424ba1'
+down_revision = 'f1f1f1d5af41'
+branch_labels = None
+depends_on = None
+
+
+# Frozen copies of the search DDL in app/models/search.py at this revision
+DOCUMENTS = {
+    'team_tasks': "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))",
+    'sub_tasks': "to_tsvector('simple', coalesce(title, ''))",
+    'private_todos': "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))",
+}
+
+SQLITE_DDL = (
+    """CREATE VIRTUAL TABLE search_index USING fts5(
+        kind UNINDEXED, entity_id UNINDEXED, parent_id UNINDEXED, scope, title, body,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER team_tasks_search_ai AFTER INSERT ON team_tasks BEGIN
+        INSERT INTO search_index (rowid, kind, entity_id, parent_id, scope, title, body)
+        VALUES (NEW.id * 4 + 1, 'team_task', NEW.id, NULL, 'team' || NEW.team_id, NEW.title, NEW.description);
+    END""",
+    """CREATE TRIGGER team_tasks_search_au AFTER UPDATE OF title, description, team_id ON team_tasks BEGIN
+        UPDATE search_index SET scope = 'team' || NEW.team_id, title = NEW.title, body = NEW.description
+        WHERE rowid = NEW.id * 4 + 1;
+    END""",
+    """CREATE TRIGGER team_tasks_search_ad AFTER DELETE ON team_tasks BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 4 + 1;
+    END""",
+    """CREATE TRIGGER sub_tasks_search_ai AFTER INSERT ON sub_tasks BEGIN
+        INSERT INTO search_index (rowid, kind, entity_id, parent_id, scope, title, body)
+        VALUES (NEW.id * 4 + 2, 'sub_task', NEW.id, NEW.team_task_id,
+                'team' || (SELECT team_id FROM team_tasks WHERE id = NEW.team_task_id), NEW.title, NULL);
+    END""",
+    """CREATE TRIGGER sub_tasks_search_au AFTER UPDATE OF title, team_task_id ON sub_tasks BEGIN
+        UPDATE search_index SET title = NEW.title, parent_id = NEW.team_task_id,
+            scope = 'team' || (SELECT team_id FROM team_tasks WHERE id = NEW.team_task_id)
+        WHERE rowid = NEW.id * 4 + 2;
+    END""",
+    """CREATE TRIGGER sub_tasks_search_ad AFTER DELETE ON sub_tasks BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 4 + 2;
+    END""",
+    """CREATE TRIGGER private_todos_search_ai AFTER INSERT ON private_todos BEGIN
+        INSERT INTO search_index (rowid, kind, entity_id, parent_id, scope, title, body)
+        VALUES (NEW.id * 4 + 3, 'private_todo', NEW.id, NULL, 'user' || NEW.owner_user_id, NEW.title, NEW.description);
+    END""",
+    """CREATE TRIGGER private_todos_search_au AFTER UPDATE OF title, description, owner_user_id ON private_todos BEGIN
+        UPDATE search_index SET scope = 'user' || NEW.owner_user_id, title = NEW.title, body = NEW.description
+        WHERE rowid = NEW.id * 4 + 3;
+    END""",
+    """CREATE TRIGGER private_todos_search_ad AFTER DELETE ON private_todos BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 4 + 3;
+    END""",
+    # Index existing rows
+    """INSERT INTO search_index (rowid, kind, entity_id, parent_id, scope, title, body)
+        SELECT id * 4 + 1, 'team_task', id, NULL, 'team' || team_id, title, description FROM team_tasks""",
+    """INSERT INTO search_index (rowid, kind, entity_id, parent_id, scope, title, body)
+        SELECT s.id * 4 + 2, 'sub_task', s.id, s.team_task_id, 'team' || t.team_id, s.title, NULL
+        FROM sub_tasks s JOIN team_tasks t ON t.id = s.team_task_id""",
+    """INSERT INTO search_index (rowid, kind, entity_id, parent_id, scope, title, body)
+        SELECT id * 4 + 3, 'private_todo', id, NULL, 'user' || owner_user_id, title, description FROM private_todos""",
+)
+
+SQLITE_TRIGGERS = [
+    f'{table}_search_{suffix}'
+    for table in ('team_tasks', 'sub_tasks', 'private_todos')
+    for suffix in ('ai', 'au', 'ad')
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for table, document in DOCUMENTS.items():
+            op.create_index(f'ix_{table}_search', table, [sa.text(document)], postgresql_using='gin')
+    elif dialect == 'sqlite':
+        for statement in SQLITE_DDL:
+            op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for table in DOCUMENTS:
+            op.drop_index(f'ix_{table}_search', table_name=table)
+    elif dialect == 'sqlite':
+        for trigger in SQLITE_TRIGGERS:
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute('DROP TABLE IF EXISTS search_index')
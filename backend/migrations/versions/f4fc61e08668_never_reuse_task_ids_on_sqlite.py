@@ -0,0 +1,91 @@
+"""never reuse task ids on sqlite
+
+Revision ID: f4fc61e08668
+Revises: 66a8b8443343
+Create Date: 2026-10-17 04:14:17.815182
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4fc61e08668'
+down_revision = '66a8b8443343'
+branch_labels = None
+depends_on = None
+
+
+# SQLite hands out max(rowid) + 1, so deleting or archiving the newest task
+# let the next one take its id. AUTOINCREMENT needs a table rebuild, which
+# drops the table's triggers; these are frozen copies of the search
+# triggers from f3e7bd424ba1. PostgreSQL sequences never reuse ids.
+SEARCH_TRIGGERS = {
+    'team_tasks': (
+        """CREATE TRIGGER team_tasks_search_ai AFTER INSERT ON team_tasks BEGIN
+            INSERT INTO search_index (rowid, kind, entity_id, parent_id, scope, title, body)
+            VALUES (NEW.id * 4 + 1, 'team_task', NEW.id, NULL, 'team' || NEW.team_id, NEW.title, NEW.description);
+        END""",
+        """CREATE TRIGGER team_tasks_search_au AFTER UPDATE OF title, description, team_id ON team_tasks BEGIN
+            UPDATE search_index SET scope = 'team' || NEW.team_id, title = NEW.title, body = NEW.description
+            WHERE rowid = NEW.id * 4 + 1;
+        END""",
+        """CREATE TRIGGER team_tasks_search_ad AFTER DELETE ON team_tasks BEGIN
+            DELETE FROM search_index WHERE rowid = OLD.id * 4 + 1;
+        END""",
+    ),
+    'sub_tasks': (
+        """CREATE TRIGGER sub_tasks_search_ai AFTER INSERT ON sub_tasks BEGIN
+            INSERT INTO search_index (rowid, kind, entity_id, parent_id, scope, title, body)
+            VALUES (NEW.id * 4 + 2, 'sub_task', NEW.id, NEW.team_task_id,
+                    'team' || (SELECT team_id FROM team_tasks WHERE id = NEW.team_task_id), NEW.title, NULL);
+        END""",
+        """CREATE TRIGGER sub_tasks_search_au AFTER UPDATE OF title, team_task_id ON sub_tasks BEGIN
+            UPDATE search_index SET title = NEW.title, parent_id = NEW.team_task_id,
+                scope = 'team' || (SELECT team_id FROM team_tasks WHERE id = NEW.team_task_id)
+            WHERE rowid = NEW.id * 4 + 2;
+        END""",
+        """CREATE TRIGGER sub_tasks_search_ad AFTER DELETE ON sub_tasks BEGIN
+            DELETE FROM search_index WHERE rowid = OLD.id * 4 + 2;
+        END""",
+    ),
+}
+
+# Ids already handed out, including ones that only survive in the archive or a tombstone
+USED_IDS = {
+    'team_tasks': """SELECT max(id) AS id FROM team_tasks
+        UNION ALL SELECT max(id) FROM archived_team_tasks
+        UNION ALL SELECT max(entity_id) FROM tombstones WHERE entity_type = 'team_task'""",
+    'sub_tasks': """SELECT max(id) AS id FROM sub_tasks
+        UNION ALL SELECT max(id) FROM archived_sub_tasks
+        UNION ALL SELECT max(entity_id) FROM tombstones WHERE entity_type = 'sub_task'""",
+}
+
+
+def rebuild(autoincrement):
+    # sub_tasks triggers read team_tasks, so none may exist while either table is swapped
+    for table in SEARCH_TRIGGERS:
+        for suffix in ('ai', 'au', 'ad'):
+            op.execute(f'DROP TRIGGER IF EXISTS {table}_search_{suffix}')
+    for table in SEARCH_TRIGGERS:
+        with op.batch_alter_table(table, recreate='always', table_kwargs={'sqlite_autoincrement': autoincrement}):
+            pass
+    for statements in SEARCH_TRIGGERS.values():
+        for statement in statements:
+            op.execute(statement)
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    rebuild(True)
+    for table, used_ids in USED_IDS.items():
+        op.execute(f"DELETE FROM sqlite_sequence WHERE name = '{table}'")
+        op.execute(
+            f"INSERT INTO sqlite_sequence (name, seq) SELECT '{table}', coalesce(max(id), 0) FROM ({used_ids})"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    rebuild(False)
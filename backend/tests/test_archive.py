@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import update
+from app import create_app
+from app.config import TestingConfig
+from app.models import db, Team, TeamTask, SubTask, ArchivedTeamTask, ArchivedSubTask
+from app.services.archive import archive_done_tasks
+from tests.conftest import auth_header
+
+
+def add_task(team_id, title, status='DONE', age_days=100, sub_tasks=0):
+    """Create a task with sub-tasks, last updated `age_days` ago."""
+    task = TeamTask(team_id=team_id, title=title, status=status)
+    db.session.add(task)
+    db.session.flush()
+    for i in range(sub_tasks):
+        db.session.add(SubTask(team_task_id=task.id, title=f'{title} {i}', status='DONE'))
+    task.sub_task_total = task.sub_task_done = sub_tasks
+    db.session.commit()
+    updated_at = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=age_days)
+    db.session.execute(update(TeamTask).where(TeamTask.id == task.id).values(updated_at=updated_at))
+    db.session.commit()
+    return task.id
+
+
+class TestArchiveJob:
+    """Test old DONE tasks are moved out of the hot tables."""
+
+    def test_moves_old_done_tasks(self, app, team):
+        """Test only DONE tasks past the cutoff move, together with their sub-tasks."""
+        old = add_task(team, 'Old', sub_tasks=2)
+        recent = add_task(team, 'Recent', age_days=10)
+        open_task = add_task(team, 'Open', status='IN_PROGRESS', sub_tasks=1)
+
+        assert archive_done_tasks(90, 500) == (1, 2)
+
+        assert {t.id for t in TeamTask.query} == {recent, open_task}
+        assert SubTask.query.count() == 1
+        archived = db.session.get(ArchivedTeamTask, old)
+        assert (archived.title, archived.team_id, archived.sub_task_total) == ('Old', team, 2)
+        assert archived.archived_at is not None
+        assert [s.team_task_id for s in ArchivedSubTask.query] == [old, old]
+
+        # A second run has nothing left to do
+        assert archive_done_tasks(90, 500) == (0, 0)
+
+    def test_batches(self, app, team, count_queries):
+        """Test the job commits one transaction per batch."""
+        for i in range(5):
+            add_task(team, f'Task {i}', sub_tasks=1)
+
+        with count_queries() as statements:
+            assert archive_done_tasks(90, 2) == (5, 5)
+        deletes = [s for s in statements if s.startswith('DELETE FROM team_tasks')]
+        assert len(deletes) == 3
+        assert TeamTask.query.count() == 0
+
+    def test_sync_clients_drop_archived_tasks(self, app, client, admin_token, team):
+        """Test archived tasks and sub-tasks show up as deleted in the changes feed."""
+        task_id = add_task(team, 'Old', sub_tasks=1)
+        sub_task_id = SubTask.query.one().id
+        watermark = client.get('/api/team-tasks/changes', headers=auth_header(admin_token)).get_json()['data']['watermark']
+
+        archive_done_tasks(90, 500)
+
+        data = client.get(f'/api/team-tasks/changes?since={watermark}', headers=auth_header(admin_token)).get_json()['data']
+        assert data['deleted'] == {'team_tasks': [task_id], 'sub_tasks': [sub_task_id]}
+
+    def test_ids_not_reused(self, app, team):
+        """Test a task created after the newest one was archived gets a fresh id, and archives too."""
+        first = add_task(team, 'First', sub_tasks=1)
+        archive_done_tasks(90, 500)
+
+        second = add_task(team, 'Second', sub_tasks=1)
+        assert second > first
+        assert SubTask.query.one().id > ArchivedSubTask.query.one().id
+
+        assert archive_done_tasks(90, 500) == (1, 1)
+        assert [t.id for t in ArchivedTeamTask.query.order_by(ArchivedTeamTask.id)] == [first, second]
+
+    def test_cli(self, app, runner, team):
+        """Test the archive-tasks command honours --older-than-days."""
+        add_task(team, 'Old', age_days=20, sub_tasks=1)
+
+        result = runner.invoke(args=['archive-tasks'])
+        assert 'Archived 0 tasks and 0 sub-tasks' in result.output
+
+        result = runner.invoke(args=['archive-tasks', '--older-than-days', '14', '--batch-size', '10'])
+        assert result.exit_code == 0, result.output
+        assert 'Archived 1 tasks and 1 sub-tasks' in result.output
+        assert ArchivedTeamTask.query.count() == 1
+
+
+class TestTaskArchiver:
+    """Test the optional in-process archiving schedule."""
+
+    def test_thread_started_by_first_request(self, monkeypatch):
+        """Test the thread starts in the process serving requests, not in create_app."""
+        monkeypatch.setattr(TestingConfig, 'ARCHIVE_INTERVAL', 3600)
+        app = create_app('testing')
+        archiver = app.extensions['task_archiver']
+        try:
+            assert archiver._thread is None
+            app.test_client().get('/api/health/db')
+            assert archiver._thread.is_alive()
+        finally:
+            archiver.stop()
+
+    def test_run(self, app, team):
+        """Test a scheduled run archives with the configured settings."""
+        add_task(team, 'Old', sub_tasks=1)
+        assert app.extensions['task_archiver'].run() == (1, 1)
+
+
+class TestArchiveEndpoint:
+    """Test listing the archive."""
+
+    def test_pages_team_archive(self, app, client, member_token, team):
+        """Test archived tasks are paged newest first, with sub-tasks, for the caller's team only."""
+        first = add_task(team, 'First', age_days=300, sub_tasks=2)
+        second = add_task(team, 'Second', age_days=200)
+        other_team = Team(name='Other Team')
+        db.session.add(other_team)
+        db.session.commit()
+        add_task(other_team.id, 'Elsewhere')
+        archive_done_tasks(90, 500)
+
+        response = client.get('/api/team-tasks/archive?limit=1', headers=auth_header(member_token))
+        assert response.status_code == 200
+        body = response.get_json()
+        assert [(t['id'], t['progress'], t['sub_tasks']) for t in body['data']] == [(second, 100, [])]
+
+        cursor = body['meta']['next_cursor']
+        body = client.get(f'/api/team-tasks/archive?limit=1&cursor={cursor}',
+                          headers=auth_header(member_token)).get_json()
+        [task] = body['data']
+        assert task['id'] == first
+        assert [s['title'] for s in task['sub_tasks']] == ['First 0', 'First 1']
+        assert body['meta']['next_cursor'] is None
+
+    def test_invalid_cursor(self, client, member_token):
+        """Test a malformed cursor is rejected."""
+        response = client.get('/api/team-tasks/archive?cursor=nope', headers=auth_header(member_token))
+        assert response.status_code == 400
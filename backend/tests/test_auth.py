@@ -1,4 +1,6 @@
 import pytest
+from datetime import datetime, timedelta, timezone
+from app.models import db, User, RevokedToken
 from tests.conftest import auth_header
 
 
@@ -107,6 +109,16 @@ class TestLogin:
         })
         assert response.status_code == 401
 
+    def test_login_not_rate_limited_in_testing(self, client, admin_user):
+        """Test rate limiting is off by default under the testing config."""
+        for _ in range(20):
+            response = client.post('/api/auth/login', json={
+                'email': 'admin@test.com',
+                'password': 'wrongpassword'
+            })
+        assert response.status_code == 401
+        assert 'RateLimit-Limit' not in response.headers
+
 
 class TestCurrentUser:
     """Test getting current user."""
@@ -124,6 +136,29 @@ class TestCurrentUser:
         assert response.status_code == 401
 
 
+class TestCurrentUserLookup:
+    """Test the authenticated user is loaded once per request."""
+
+    def test_admin_route_fetches_user_once(self, client, admin_token, team, count_queries):
+        """Test admin_required and the route share one user lookup."""
+        with count_queries() as statements:
+            response = client.post('/api/team-tasks',
+                headers=auth_header(admin_token),
+                json={'title': 'Task'}
+            )
+        assert response.status_code == 201
+        user_selects = [s for s in statements if s.lstrip().startswith('SELECT') and 'FROM users' in s]
+        assert len(user_selects) == 1
+
+    def test_deleted_user_token_rejected(self, app, client, admin_token, admin_user):
+        """Test a token for a deleted user returns 404."""
+        db.session.delete(db.session.get(User, admin_user))
+        db.session.commit()
+
+        response = client.get('/api/auth/me', headers=auth_header(admin_token))
+        assert response.status_code == 404
+
+
 class TestLogout:
     """Test user logout."""
 
@@ -135,3 +170,58 @@ class TestLogout:
         # Token should be revoked
         response = client.get('/api/auth/me', headers=auth_header(admin_token))
         assert response.status_code == 401
+
+    def test_revocation_shared_across_workers(self, app, client, admin_token):
+        """Test a revoked token is found in the database when another worker's cache is cold."""
+        client.post('/api/auth/logout', headers=auth_header(admin_token))
+        assert RevokedToken.query.count() == 1
+
+        app.extensions['token_blocklist'].cache.clear()
+        response = client.get('/api/auth/me', headers=auth_header(admin_token))
+        assert response.status_code == 401
+
+    def test_prune_expired_revoked_tokens(self, app, runner):
+        """Test the prune command removes only expired entries."""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        db.session.add(RevokedToken(jti='expired', expires_at=now - timedelta(hours=1)))
+        db.session.add(RevokedToken(jti='live', expires_at=now + timedelta(hours=1)))
+        db.session.commit()
+
+        result = runner.invoke(args=['prune-revoked-tokens'])
+        assert 'Pruned 1' in result.output
+        assert [t.jti for t in RevokedToken.query.all()] == ['live']
+
+
+class TestPasswordHashing:
+    """Test bcrypt cost handling and hashing backpressure."""
+
+    def test_login_rehashes_on_cost_change(self, app, client, admin_user):
+        """Test login upgrades a hash created with a different cost."""
+        hasher = app.extensions['password_hasher']
+        old_hash = db.session.get(User, admin_user).password_hash
+        assert old_hash.split('$')[2] == '04'
+
+        hasher.rounds = 5
+        response = client.post('/api/auth/login', json={
+            'email': 'admin@test.com',
+            'password': 'password123'
+        })
+        assert response.status_code == 200
+
+        user = db.session.get(User, admin_user)
+        db.session.refresh(user)
+        assert user.password_hash.split('$')[2] == '05'
+        assert user.check_password('password123')
+
+    def test_login_returns_503_when_queue_full(self, app, client, admin_user):
+        """Test a full hashing queue sheds load with Retry-After."""
+        hasher = app.extensions['password_hasher']
+        while hasher._slots.acquire(blocking=False):
+            pass
+
+        response = client.post('/api/auth/login', json={
+            'email': 'admin@test.com',
+            'password': 'password123'
+        })
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
@@ -0,0 +1,101 @@
+import json
+import threading
+from app import create_app
+from app.config import TestingConfig
+from app.services.events import PostgresFanout
+from tests.conftest import auth_header
+
+
+class TestEventBroker:
+    """Test board events are published to team subscribers."""
+
+    def test_mutations_publish_events(self, app, client, admin_token, member_user, team):
+        """Test task and sub-task mutations publish typed events."""
+        subscription = app.extensions['event_broker'].subscribe(team)
+
+        task_id = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Task'}
+        ).get_json()['data']['id']
+        client.patch(f'/api/team-tasks/{task_id}/assign',
+            headers=auth_header(admin_token),
+            json={'assigned_user_id': member_user}
+        )
+        client.post(f'/api/team-tasks/{task_id}/sub-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Sub Task'}
+        )
+        client.delete(f'/api/team-tasks/{task_id}', headers=auth_header(admin_token))
+
+        events = []
+        while True:
+            event = subscription.get(timeout=0)
+            if event is None:
+                break
+            events.append(event)
+
+        assert [e['type'] for e in events] == ['task.created', 'task.assigned', 'sub_task.created', 'task.deleted']
+        assert events[1]['data']['assigned_user_id'] == member_user
+        assert events[3]['data'] == {'id': task_id}
+
+    def test_events_scoped_to_team(self, app):
+        """Test subscribers only receive their own team's events."""
+        broker = app.extensions['event_broker']
+        mine = broker.subscribe(1)
+        other = broker.subscribe(2)
+
+        broker.publish(1, 'task.created', {'id': 1})
+
+        assert mine.get(timeout=0)['type'] == 'task.created'
+        assert other.get(timeout=0) is None
+
+    def test_slow_client_buffer_is_bounded(self, app):
+        """Test a full buffer marks the subscriber for resync instead of growing."""
+        broker = app.extensions['event_broker']
+        subscription = broker.subscribe(1)
+
+        for i in range(app.config['SSE_CLIENT_BUFFER'] + 5):
+            broker.publish(1, 'task.created', {'id': i})
+
+        assert subscription.queue.qsize() == app.config['SSE_CLIENT_BUFFER']
+        assert subscription.overflowed
+
+
+class TestEventStream:
+    """Test the Server-Sent Events endpoint."""
+
+    def test_stream_delivers_events(self, app, client, admin_token, team):
+        """Test the stream emits published events, authenticating via query string."""
+        response = client.get(f'/api/team-tasks/stream?jwt={admin_token}', buffered=False)
+        assert response.status_code == 200
+        assert response.mimetype == 'text/event-stream'
+        chunks = (chunk.decode('utf-8') for chunk in response.response)
+        assert next(chunks).startswith('retry:')
+
+        app.extensions['event_broker'].publish(team, 'task.created', {'id': 42})
+        chunk = next(chunks)
+        assert 'event: task.created' in chunk
+        assert json.loads(chunk.split('data: ')[1]) == {'id': 42}
+        response.close()
+
+    def test_stream_requires_token(self, client):
+        """Test the stream rejects anonymous clients."""
+        response = client.get('/api/team-tasks/stream')
+        assert response.status_code == 401
+
+
+class TestPostgresFanout:
+    """Test each worker listens for other workers' events."""
+
+    def test_subscriber_starts_listener(self, monkeypatch):
+        """Test a worker that only serves subscribers listens without publishing anything."""
+        stop = threading.Event()
+        monkeypatch.setattr(TestingConfig, 'EVENT_BACKEND', 'postgres')
+        monkeypatch.setattr(PostgresFanout, '_listen', lambda self: stop.wait())
+        broker = create_app('testing').extensions['event_broker']
+        try:
+            assert broker.backend._thread is None
+            broker.subscribe(1)
+            assert broker.backend._thread.is_alive()
+        finally:
+            stop.set()
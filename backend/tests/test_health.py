@@ -0,0 +1,91 @@
+from app.config import Config, engine_options
+
+
+def config_for(uri, **overrides):
+    config = {key: getattr(Config, key) for key in dir(Config) if key.startswith('DB_')}
+    config['SQLALCHEMY_DATABASE_URI'] = uri
+    config.update(overrides)
+    return config
+
+
+class TestEngineOptions:
+    """Test SQLALCHEMY_ENGINE_OPTIONS are derived from the DB_* settings."""
+
+    def test_postgres_pool_and_statement_timeout(self):
+        """Test pool sizing and the statement timeout apply to PostgreSQL."""
+        options = engine_options(config_for(
+            'postgresql://u:p@localhost/taskish',
+            DB_POOL_SIZE=20, DB_MAX_OVERFLOW=5, DB_POOL_RECYCLE=600, DB_STATEMENT_TIMEOUT_MS=5000
+        ))
+
+        assert options['pool_size'] == 20
+        assert options['max_overflow'] == 5
+        assert options['pool_recycle'] == 600
+        assert options['pool_pre_ping'] is True
+        assert options['connect_args'] == {'options': '-c statement_timeout=5000'}
+
+    def test_statement_timeout_disabled(self):
+        """Test a zero statement timeout adds no connect args."""
+        options = engine_options(config_for('postgresql://localhost/taskish', DB_STATEMENT_TIMEOUT_MS=0))
+        assert 'connect_args' not in options
+
+    def test_sqlite_skips_pool_sizing(self):
+        """Test SQLite keeps Flask-SQLAlchemy's pool setup."""
+        options = engine_options(config_for('sqlite:///:memory:'))
+        assert options == {'pool_pre_ping': True}
+
+    def test_applied_to_app(self, app):
+        """Test create_app installs the engine options."""
+        assert app.config['SQLALCHEMY_ENGINE_OPTIONS'] == {'pool_pre_ping': False}
+
+
+class TestDatabaseHealth:
+    """Test the database health endpoint."""
+
+    def test_database_health(self, client):
+        """Test /api/health/db reports connectivity and pool stats."""
+        response = client.get('/api/health/db')
+
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert data['dialect'] == 'sqlite'
+        assert data['latency_ms'] >= 0
+        assert 'pool' in data
+
+    def test_database_unavailable(self, app, client, monkeypatch):
+        """Test a failing database returns 503."""
+        from sqlalchemy.exc import OperationalError
+        from app.routes import health
+
+        def fail():
+            raise OperationalError('SELECT 1', {}, Exception('down'))
+
+        monkeypatch.setattr(health, 'check_database', fail)
+        response = client.get('/api/health/db')
+
+        assert response.status_code == 503
+        assert response.get_json()['error']['message'] == 'Database unavailable'
+
+    def test_queue_pool_stats(self, tmp_path):
+        """Test pool counters are reported for QueuePool engines."""
+        from sqlalchemy import create_engine
+        from app.services.database import pool_status
+
+        engine = create_engine(f'sqlite:///{tmp_path}/pool.db', pool_size=3, max_overflow=1)
+        with engine.connect():
+            status = pool_status(engine)
+
+        assert status['pool'] == 'QueuePool'
+        assert status['size'] == 3
+        assert status['checked_out'] == 1
+        engine.dispose()
+
+    def test_dispose_engines_resets_pool(self, app):
+        """Test dispose_engines leaves the app with an empty pool."""
+        from app.models import db
+        from app.services.database import dispose_engines, pool_status
+
+        with db.engine.connect():
+            pass
+        dispose_engines(app)
+        assert pool_status(db.engine).get('checked_out', 0) == 0
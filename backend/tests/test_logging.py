@@ -0,0 +1,79 @@
+import json
+import logging
+import pytest
+from app.utils.log import JsonFormatter, request_logger, redact_headers
+from tests.conftest import auth_header
+
+
+class ListHandler(logging.Handler):
+    """Collect records emitted to a logger."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def captured(app):
+    """Capture request log events at INFO level."""
+    handler = ListHandler()
+    logger = logging.getLogger('taskish')
+    previous = logger.level
+    logger.setLevel(logging.INFO)
+    request_logger.addHandler(handler)
+    yield handler.records
+    request_logger.removeHandler(handler)
+    logger.setLevel(previous)
+
+
+class TestRequestLogging:
+    """Test structured request logging."""
+
+    def test_one_event_per_request(self, app, client, admin_token, team, captured):
+        """Test a create request emits a single event with context fields."""
+        app.config['LOG_HEADERS'] = True
+        response = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Task'}
+        )
+        assert response.status_code == 201
+
+        assert len(captured) == 1
+        fields = captured[0].fields
+        assert fields['status'] == 201
+        assert fields['endpoint'] == 'team_tasks.create_team_task'
+        assert fields['task_id'] == response.get_json()['data']['id']
+        assert fields['headers']['Authorization'] == '[REDACTED]'
+
+    def test_timing_fields(self, app, client, admin_token, captured):
+        """Test request events carry query count, DB and serialization time."""
+        client.get('/api/team-tasks', headers=auth_header(admin_token))
+
+        fields = captured[0].fields
+        assert fields['db_queries'] > 0
+        assert fields['db_ms'] >= 0
+        assert fields['serialize_ms'] >= 0
+
+    def test_sampling_keeps_errors(self, app, client, admin_token, captured):
+        """Test sampled-out successful requests are dropped but errors are kept."""
+        app.config['LOG_SAMPLE_RATE'] = 0.0
+        client.get('/api/private-todos', headers=auth_header(admin_token))
+        client.get('/api/private-todos/999', headers=auth_header(admin_token))
+
+        assert [r.fields['status'] for r in captured] == [404]
+
+    def test_json_formatter(self):
+        """Test records are rendered as a single JSON object."""
+        record = logging.LogRecord('taskish.request', logging.INFO, __file__, 1, 'request', None, None)
+        record.fields = {'status': 200}
+        event = json.loads(JsonFormatter().format(record))
+        assert event['message'] == 'request'
+        assert event['status'] == 200
+
+    def test_redact_headers_case_insensitive(self):
+        """Test header redaction ignores case."""
+        headers = redact_headers({'authorization': 'Bearer x', 'Accept': '*/*'}, ['Authorization'])
+        assert headers == {'authorization': '[REDACTED]', 'Accept': '*/*'}
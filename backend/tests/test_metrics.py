@@ -0,0 +1,93 @@
+import importlib.util
+import re
+from app.utils.metrics import Histogram
+from tests.conftest import auth_header
+
+
+def parse_server_timing(header):
+    """Return {metric: (duration_ms, desc)} from a Server-Timing header."""
+    timings = {}
+    for entry in header.split(','):
+        name, *params = [part.strip() for part in entry.split(';')]
+        values = dict(param.split('=', 1) for param in params)
+        timings[name] = (float(values['dur']), values.get('desc', '').strip('"'))
+    return timings
+
+
+class TestServerTiming:
+    """Test the per-request Server-Timing header."""
+
+    def test_board_request_timings(self, app, client, admin_token, team, count_queries):
+        """Test the header reports the request's query count and timing phases."""
+        client.post('/api/team-tasks', headers=auth_header(admin_token), json={'title': 'Task'})
+
+        with count_queries() as statements:
+            response = client.get('/api/team-tasks', headers=auth_header(admin_token))
+
+        timings = parse_server_timing(response.headers['Server-Timing'])
+        assert set(timings) == {'db', 'serialize', 'app', 'total'}
+        assert timings['db'][1] == f'{len(statements)} queries'
+        assert timings['serialize'][0] > 0
+        assert timings['total'][0] >= timings['db'][0] + timings['serialize'][0]
+
+    def test_disabled(self, app, client, admin_token):
+        """Test SERVER_TIMING=False suppresses the header."""
+        app.extensions['request_metrics'].server_timing = False
+        response = client.get('/api/team-tasks', headers=auth_header(admin_token))
+        assert 'Server-Timing' not in response.headers
+
+
+class TestPrometheusMetrics:
+    """Test the /metrics endpoint."""
+
+    def test_endpoint_histograms(self, app, client, admin_token):
+        """Test requests are aggregated per endpoint in Prometheus text format."""
+        for _ in range(3):
+            client.get('/api/team-tasks', headers=auth_header(admin_token))
+
+        response = client.get('/metrics')
+        body = response.get_data(as_text=True)
+
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/plain; version=0.0.4')
+        assert '# TYPE taskish_request_duration_seconds histogram' in body
+        labels = 'endpoint="team_tasks.get_team_tasks",method="GET"'
+        assert f'taskish_request_duration_seconds_count{{{labels}}} 3' in body
+        assert f'taskish_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in body
+        assert f'taskish_requests_total{{{labels},status="200"}} 3' in body
+        assert re.search(rf'taskish_request_queries_sum\{{{labels}\}} [1-9]', body)
+        assert 'endpoint="metrics"' not in body
+
+    def test_token_required(self, app, client):
+        """Test /metrics requires the bearer token when METRICS_TOKEN is set."""
+        app.extensions['request_metrics'].token = 'scrape-secret'
+
+        assert client.get('/metrics').status_code == 401
+        assert client.get('/metrics', headers=auth_header('wrong')).status_code == 401
+        assert client.get('/metrics', headers=auth_header('scrape-secret')).status_code == 200
+
+    def test_off_in_production(self, monkeypatch):
+        """Test production only serves /metrics and Server-Timing when opted in."""
+        monkeypatch.delenv('METRICS_ENABLED', raising=False)
+        monkeypatch.delenv('SERVER_TIMING', raising=False)
+        # A fresh copy of the module, so its settings are read from the cleared environment
+        spec = importlib.util.spec_from_file_location('fresh_config', importlib.util.find_spec('app.config').origin)
+        fresh_config = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(fresh_config)
+
+        assert fresh_config.ProductionConfig.METRICS_ENABLED is False
+        assert fresh_config.ProductionConfig.SERVER_TIMING is False
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test bucket counts accumulate up to +Inf."""
+        histogram = Histogram('latency', 'Latency.', ('endpoint',), (0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(('a',), value)
+
+        assert list(histogram.samples()) == [
+            'latency_bucket{endpoint="a",le="0.1"} 1',
+            'latency_bucket{endpoint="a",le="1.0"} 3',
+            'latency_bucket{endpoint="a",le="+Inf"} 4',
+            'latency_sum{endpoint="a"} 6.05',
+            'latency_count{endpoint="a"} 4',
+        ]
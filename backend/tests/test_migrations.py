@@ -0,0 +1,63 @@
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from flask_migrate import upgrade
+from sqlalchemy import inspect, text
+from app import create_app
+from app.cli import LEGACY_SCHEMA_REVISION
+from app.config import TestingConfig
+from app.models import db
+
+
+@pytest.fixture
+def file_app(tmp_path, monkeypatch):
+    """Create an app backed by an empty SQLite file."""
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f'sqlite:///{tmp_path}/taskish.db')
+    app = create_app('testing')
+    with app.app_context():
+        yield app
+        db.engine.dispose()
+
+
+class TestMigrations:
+    """Test the schema is managed through migrations only."""
+
+    def test_create_app_does_not_touch_schema(self, file_app):
+        """Test creating the app issues no DDL."""
+        assert inspect(db.engine).get_table_names() == []
+
+    def test_migrations_match_models(self, file_app):
+        """Test upgrading an empty database yields exactly the model schema."""
+        upgrade()
+
+        with db.engine.connect() as conn:
+            context = MigrationContext.configure(conn, opts=file_app.extensions['migrate'].configure_args)
+            diff = compare_metadata(context, db.metadata)
+        assert diff == []
+
+    def test_bootstrap_fresh_database(self, file_app):
+        """Test bootstrap-db creates the schema on an empty database."""
+        result = file_app.test_cli_runner().invoke(args=['bootstrap-db'])
+
+        assert result.exit_code == 0, result.output
+        assert 'teams' in inspect(db.engine).get_table_names()
+
+    def test_bootstrap_legacy_database(self, file_app):
+        """Test bootstrap-db adopts a create_all() schema and backfills counters."""
+        upgrade(revision=LEGACY_SCHEMA_REVISION)
+        with db.engine.begin() as conn:
+            conn.execute(text('DROP TABLE alembic_version'))
+            conn.execute(text("INSERT INTO teams (id, name) VALUES (1, 'Team')"))
+            conn.execute(text("INSERT INTO team_tasks (id, team_id, title, status) VALUES (1, 1, 'Task', 'TODO')"))
+            conn.execute(text(
+                "INSERT INTO sub_tasks (team_task_id, title, status) "
+                "VALUES (1, 'A', 'DONE'), (1, 'B', 'TODO'), (1, 'C', 'DONE')"
+            ))
+
+        result = file_app.test_cli_runner().invoke(args=['bootstrap-db'])
+
+        assert result.exit_code == 0, result.output
+        assert f'Stamped existing schema at {LEGACY_SCHEMA_REVISION}' in result.output
+        with db.engine.connect() as conn:
+            counters = conn.execute(text('SELECT sub_task_total, sub_task_done FROM team_tasks')).one()
+        assert tuple(counters) == (3, 2)
@@ -105,6 +105,81 @@ class TestPrivateTodos:
         assert response.status_code == 404
 
 
+class TestPrivateTodoPagination:
+    """Test keyset pagination and filters on private todos."""
+
+    def test_paginate_with_cursor(self, client, admin_token):
+        """Test pages follow next_cursor without gaps or duplicates."""
+        for i in range(3):
+            client.post('/api/private-todos',
+                headers=auth_header(admin_token),
+                json={'title': f'Todo {i}'}
+            )
+
+        response = client.get('/api/private-todos?limit=2', headers=auth_header(admin_token))
+        data = response.get_json()
+        assert [t['title'] for t in data['data']] == ['Todo 2', 'Todo 1']
+        cursor = data['meta']['next_cursor']
+        assert cursor
+
+        response = client.get(f'/api/private-todos?limit=2&cursor={cursor}', headers=auth_header(admin_token))
+        data = response.get_json()
+        assert [t['title'] for t in data['data']] == ['Todo 0']
+        assert data['meta']['next_cursor'] is None
+
+    def test_stream(self, client, admin_token):
+        """Test stream=1 returns every matching todo in page order in one response."""
+        for i in range(3):
+            client.post('/api/private-todos',
+                headers=auth_header(admin_token),
+                json={'title': f'Todo {i}', 'status': 'DONE' if i == 1 else 'TODO'}
+            )
+
+        response = client.get('/api/private-todos?stream=1&limit=1', headers=auth_header(admin_token))
+        assert response.is_streamed
+        data = response.get_json()
+        assert data['success'] is True
+        assert [t['title'] for t in data['data']] == ['Todo 2', 'Todo 1', 'Todo 0']
+
+        response = client.get('/api/private-todos?stream=1&status=TODO', headers=auth_header(admin_token))
+        assert [t['title'] for t in response.get_json()['data']] == ['Todo 2', 'Todo 0']
+
+    def test_filter_by_status(self, client, admin_token):
+        """Test status filter."""
+        client.post('/api/private-todos',
+            headers=auth_header(admin_token),
+            json={'title': 'Done', 'status': 'DONE'}
+        )
+        client.post('/api/private-todos',
+            headers=auth_header(admin_token),
+            json={'title': 'Open'}
+        )
+
+        response = client.get('/api/private-todos?status=DONE', headers=auth_header(admin_token))
+        assert [t['title'] for t in response.get_json()['data']] == ['Done']
+
+
+class TestPrivateTodoConditionalGet:
+    """Test ETag support on the todo list."""
+
+    def test_todos_not_modified(self, client, admin_token):
+        """Test the todo list returns 304 until a todo changes."""
+        client.post('/api/private-todos',
+            headers=auth_header(admin_token),
+            json={'title': 'Todo'}
+        )
+        etag = client.get('/api/private-todos', headers=auth_header(admin_token)).headers['ETag']
+        headers = {**auth_header(admin_token), 'If-None-Match': etag}
+
+        assert client.get('/api/private-todos', headers=headers).status_code == 304
+
+        client.post('/api/private-todos',
+            headers=auth_header(admin_token),
+            json={'title': 'Another'}
+        )
+        assert client.get('/api/private-todos', headers=headers).status_code == 200
+
+
 class TestPrivateTodoAuthorization:
     """Test private todo authorization."""
 
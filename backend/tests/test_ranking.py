@@ -0,0 +1,43 @@
+import random
+import pytest
+from app.utils.ranking import rank_after, rank_between, spaced_ranks
+
+
+def test_rank_between_random_inserts():
+    """Test ranks stay strictly ordered under random inserts and appends."""
+    rng = random.Random(0)
+    ranks = []
+    for _ in range(2000):
+        i = rng.randrange(len(ranks) + 1)
+        before = ranks[i - 1] if i > 0 else None
+        after = ranks[i] if i < len(ranks) else None
+        rank = rank_between(before, after)
+        assert (before or '') < rank and (after is None or rank < after)
+        assert not rank.endswith('0')
+        ranks.insert(i, rank)
+
+
+def test_rank_between_requires_order():
+    with pytest.raises(ValueError):
+        rank_between('b', 'a')
+    with pytest.raises(ValueError):
+        rank_between('a', 'a')
+
+
+def test_rank_after_stays_short():
+    """Test appending keeps ranks at a bounded width."""
+    rank = None
+    for _ in range(10000):
+        nxt = rank_after(rank)
+        assert rank is None or nxt > rank
+        rank = nxt
+    assert len(rank) <= 6
+    assert rank_after('zzzzzz') > 'zzzzzz'
+
+
+@pytest.mark.parametrize('count', [0, 1, 35, 36, 1000])
+def test_spaced_ranks(count):
+    ranks = spaced_ranks(count)
+    assert len(ranks) == count
+    assert ranks == sorted(set(ranks))
+    assert all(rank and not rank.endswith('0') for rank in ranks)
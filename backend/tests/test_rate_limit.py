@@ -0,0 +1,105 @@
+import pytest
+from app import create_app
+from app.config import TestingConfig
+from app.models import db
+from app.services.rate_limit import Limit, parse_limit
+from tests.conftest import auth_header
+
+
+@pytest.fixture(params=['memory', 'database'])
+def app(request, monkeypatch):
+    """Application with small write limits, once per bucket backend."""
+    monkeypatch.setattr(TestingConfig, 'RATE_LIMIT_ENABLED', True)
+    monkeypatch.setattr(TestingConfig, 'RATE_LIMIT_BACKEND', request.param)
+    monkeypatch.setattr(TestingConfig, 'RATE_LIMIT_DEFAULT', '3/minute')
+    monkeypatch.setattr(TestingConfig, 'RATE_LIMITS', {'auth': '5/minute', 'users': 'off'})
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def login(client, addr='10.0.0.1'):
+    return client.post('/api/auth/login', json={'email': 'admin@test.com', 'password': 'wrong'},
+                       environ_base={'REMOTE_ADDR': addr})
+
+
+class TestRateLimiting:
+    """Test token-bucket limits on auth and write endpoints."""
+
+    def test_login_limited_per_ip(self, client, admin_user):
+        """Test login attempts are refused once an address uses up its bucket."""
+        responses = [login(client) for _ in range(5)]
+        assert [r.status_code for r in responses] == [401] * 5
+        assert [r.headers['RateLimit-Remaining'] for r in responses] == ['4', '3', '2', '1', '0']
+        assert responses[0].headers['RateLimit-Limit'] == '5'
+        assert responses[0].headers['RateLimit-Policy'] == '5;w=60'
+
+        response = login(client)
+        assert response.status_code == 429
+        assert response.get_json()['error']['code'] == 429
+        assert 1 <= int(response.headers['Retry-After']) <= 12
+        assert int(response.headers['RateLimit-Reset']) <= 60
+
+        # Another client is unaffected
+        assert login(client, addr='10.0.0.2').status_code == 401
+
+    def test_writes_limited_per_user(self, client, admin_token, member_token):
+        """Test authenticated writes use a bucket per identity, and reads are not counted."""
+        for i in range(3):
+            response = client.post('/api/private-todos', headers=auth_header(admin_token), json={'title': f'T{i}'})
+            assert response.status_code == 201
+        response = client.post('/api/private-todos', headers=auth_header(admin_token), json={'title': 'T3'})
+        assert response.status_code == 429
+        assert 'Retry-After' in response.headers
+
+        response = client.get('/api/private-todos', headers=auth_header(admin_token))
+        assert response.status_code == 200
+        assert 'RateLimit-Limit' not in response.headers
+
+        # Same address, different user
+        response = client.post('/api/private-todos', headers=auth_header(member_token), json={'title': 'M'})
+        assert response.status_code == 201
+
+    def test_blueprint_limit_off(self, app):
+        """Test a blueprint can opt out of limiting."""
+        limiter = app.extensions['rate_limiter']
+        assert limiter.limit_for('users') is None
+        assert limiter.limit_for('team_tasks') == Limit(3, 60)
+
+    def test_bucket_refill(self, app):
+        """Test a bucket refills at capacity/period and never beyond capacity."""
+        backend = app.extensions['rate_limiter'].backend
+        limit = Limit(2, 10)
+        assert backend.consume('k', limit, 100.0) == (True, 1)
+        assert backend.consume('k', limit, 100.0) == (True, 0)
+        assert backend.consume('k', limit, 102.0) == (False, pytest.approx(0.4))
+        assert backend.consume('k', limit, 105.0) == (True, pytest.approx(0))
+        assert backend.consume('k', limit, 500.0) == (True, 1)
+
+    def test_prune_idle_buckets(self, app):
+        """Test buckets idle past the cutoff are dropped."""
+        backend = app.extensions['rate_limiter'].backend
+        backend.consume('old', Limit(2, 10), 100.0)
+        backend.consume('new', Limit(2, 10), 200.0)
+        assert backend.prune(150.0) == 1
+        assert backend.consume('new', Limit(2, 10), 200.0) == (True, 0)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('10/minute', Limit(10, 60)),
+    ('100 / 5 minutes', Limit(100, 300)),
+    ('1/second', Limit(1, 1)),
+    ('off', None),
+    ('', None),
+    ('0/hour', None),
+])
+def test_parse_limit(value, expected):
+    assert parse_limit(value) == expected
+
+
+def test_parse_limit_invalid():
+    with pytest.raises(ValueError):
+        parse_limit('ten per minute')
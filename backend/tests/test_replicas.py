@@ -0,0 +1,141 @@
+import pytest
+from sqlalchemy import delete, insert, select
+import app as app_module
+from app import create_app
+from app.config import TestingConfig, replica_binds
+from app.models import db, PrivateTodo
+from app.services.replicas import ReplicaRouter
+from tests.conftest import auth_header
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """Application on a SQLite primary file with two SQLite replica files."""
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f'sqlite:///{tmp_path}/primary.db')
+    monkeypatch.setattr(TestingConfig, 'DB_REPLICA_URLS', [
+        f'sqlite:///{tmp_path}/replica0.db', f'sqlite:///{tmp_path}/replica1.db'
+    ])
+    app = create_app('testing')
+    with app.app_context():
+        for engine in db.engines.values():
+            db.metadata.create_all(engine)
+        yield app
+        db.session.remove()
+        for key, engine in db.engines.items():
+            engine.dispose()
+            # Binds register a metadata on the shared extension; later apps have no such bind
+            if key is not None:
+                db.metadatas.pop(key, None)
+
+
+def replicate(*keys):
+    """Copy every table from the primary to the given replicas, standing in for replication."""
+    db.session.commit()
+    for key in keys:
+        with db.engines[key].begin() as replica:
+            for table in reversed(db.metadata.sorted_tables):
+                replica.execute(delete(table))
+            for table in db.metadata.sorted_tables:
+                rows = [dict(row._mapping) for row in db.session.connection().execute(select(table))]
+                if rows:
+                    replica.execute(insert(table), rows)
+
+
+def todo_titles(client, token):
+    response = client.get('/api/private-todos', headers=auth_header(token))
+    assert response.status_code == 200
+    return [t['title'] for t in response.get_json()['data']]
+
+
+class TestReplicaRouting:
+    """Test GET requests are served from replicas and writes stick to the primary."""
+
+    def test_reads_round_robin(self, app, client, admin_token, admin_user):
+        """Test successive reads alternate between the replicas."""
+        db.session.add(PrivateTodo(owner_user_id=admin_user, title='Everywhere'))
+        replicate('replica_0', 'replica_1')
+        db.session.add(PrivateTodo(owner_user_id=admin_user, title='Replica 0 only'))
+        replicate('replica_0')
+        db.session.add(PrivateTodo(owner_user_id=admin_user, title='Primary only'))
+        db.session.commit()
+
+        seen = [len(todo_titles(client, admin_token)) for _ in range(4)]
+        assert seen == [2, 1, 2, 1]
+
+        # Streamed bodies are read after the view returns, still from the replica
+        response = client.get('/api/private-todos?stream=1', headers=auth_header(admin_token))
+        assert len(response.get_json()['data']) == 2
+
+    def test_read_your_writes(self, app, client, admin_token, member_token, admin_user, member_user):
+        """Test a writer reads from the primary for a while, other users still use replicas."""
+        replicate('replica_0', 'replica_1')
+        response = client.post('/api/private-todos', headers=auth_header(admin_token), json={'title': 'New'})
+        assert response.status_code == 201
+        assert todo_titles(client, admin_token) == ['New']
+        assert todo_titles(client, admin_token) == ['New']
+
+        db.session.add(PrivateTodo(owner_user_id=member_user, title='Not replicated'))
+        db.session.commit()
+        assert todo_titles(client, member_token) == []
+
+        app.extensions['replica_router'].recent_writers.clear()
+        assert todo_titles(client, admin_token) == []
+
+    def test_read_your_writes_across_workers(self, app, client, admin_token, monkeypatch):
+        """Test a write handled by one worker keeps the caller's reads on the primary in another."""
+        replicate('replica_0', 'replica_1')
+        # A second worker process has its own router and in-memory state
+        monkeypatch.setattr(app_module, 'replica_router', ReplicaRouter())
+        other = create_app('testing')
+        try:
+            response = client.post('/api/private-todos', headers=auth_header(admin_token), json={'title': 'New'})
+            assert response.status_code == 201
+            assert todo_titles(other.test_client(), admin_token) == ['New']
+        finally:
+            with other.app_context():
+                for engine in db.engines.values():
+                    engine.dispose()
+
+    def test_failed_write_not_sticky(self, app, client, admin_token, admin_user):
+        """Test a rejected write does not pin the caller to the primary."""
+        replicate('replica_0', 'replica_1')
+        response = client.post('/api/private-todos', headers=auth_header(admin_token), json={'title': ''})
+        assert response.status_code == 400
+        db.session.add(PrivateTodo(owner_user_id=admin_user, title='Not replicated'))
+        db.session.commit()
+        assert todo_titles(client, admin_token) == []
+
+    def test_auth_state_read_from_primary(self, app, client, admin_token):
+        """Test token revocations and user lookups never wait for replication."""
+        replicate('replica_0', 'replica_1')
+        client.post('/api/auth/logout', headers=auth_header(admin_token))
+        app.extensions['replica_router'].recent_writers.clear()
+        app.extensions['token_blocklist'].cache.clear()
+
+        response = client.get('/api/private-todos', headers=auth_header(admin_token))
+        assert response.status_code == 401
+
+    def test_other_blueprints_use_primary(self, app, client, admin_token, admin_user):
+        """Test GETs outside the configured blueprints are not routed."""
+        replicate('replica_0', 'replica_1')
+        db.session.add(PrivateTodo(owner_user_id=admin_user, title='Fresh invoice'))
+        db.session.commit()
+
+        response = client.get('/api/search', headers=auth_header(admin_token), query_string={'q': 'invoice'})
+        assert response.status_code == 200
+        assert len(response.get_json()['data']) == 1
+
+
+def test_replica_binds():
+    """Test DB_REPLICA_URLS become replica binds next to explicitly configured ones."""
+    config = {
+        'SQLALCHEMY_BINDS': {'replica_0': 'sqlite:///explicit.db', 'events': 'sqlite:///events.db'},
+        'DB_REPLICA_URLS': ['postgres://a/db', 'postgresql://b/db'],
+    }
+    assert replica_binds(config) == {
+        'replica_0': 'sqlite:///explicit.db',
+        'events': 'sqlite:///events.db',
+        'replica_1': 'postgresql://a/db',
+        'replica_2': 'postgresql://b/db',
+    }
+    assert replica_binds({'DB_REPLICA_URLS': []}) == {}
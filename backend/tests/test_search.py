@@ -0,0 +1,113 @@
+import pytest
+from app.models import db, Team, User, TeamTask, SubTask, PrivateTodo
+from tests.conftest import auth_header
+
+
+@pytest.fixture
+def other_team_data(app):
+    """Create another team with a task and a user with a todo, all mentioning 'invoice'."""
+    team = Team(name='Other Team')
+    db.session.add(team)
+    db.session.flush()
+    user = User(name='Other', email='other@test.com', role='ADMIN', team_id=team.id, password_hash='x')
+    db.session.add(user)
+    db.session.flush()
+    db.session.add(TeamTask(team_id=team.id, title='Invoice other team'))
+    db.session.add(PrivateTodo(owner_user_id=user.id, title='Invoice other user'))
+    db.session.commit()
+
+
+def search(client, token, q, **params):
+    return client.get('/api/search', headers=auth_header(token), query_string={'q': q, **params})
+
+
+class TestSearch:
+    """Test full-text search across tasks, sub-tasks and todos."""
+
+    def test_scoped_to_team_and_owner(self, app, client, admin_token, admin_user, member_user, team,
+                                      other_team_data):
+        """Test results cover the team's tasks and sub-tasks and only the caller's todos."""
+        task = TeamTask(team_id=team, title='Send invoice', description='Monthly billing')
+        db.session.add(task)
+        db.session.flush()
+        db.session.add(SubTask(team_task_id=task.id, title='Check invoice totals'))
+        db.session.add(PrivateTodo(owner_user_id=admin_user, title='Pay invoice'))
+        db.session.add(PrivateTodo(owner_user_id=member_user, title='Member invoice'))
+        db.session.commit()
+
+        response = search(client, admin_token, 'invoice')
+
+        assert response.status_code == 200
+        results = response.get_json()['data']
+        assert sorted((r['type'], r['title']) for r in results) == [
+            ('private_todo', 'Pay invoice'),
+            ('sub_task', 'Check invoice totals'),
+            ('team_task', 'Send invoice'),
+        ]
+        sub_task = next(r for r in results if r['type'] == 'sub_task')
+        assert sub_task['team_task_id'] == task.id
+
+    def test_prefix_and_all_terms(self, app, client, admin_token, team):
+        """Test every term must match and the last term matches as a prefix."""
+        db.session.add_all([
+            TeamTask(team_id=team, title='Quarterly report draft'),
+            TeamTask(team_id=team, title='Quarterly planning'),
+        ])
+        db.session.commit()
+
+        titles = [r['title'] for r in search(client, admin_token, 'quarterly rep').get_json()['data']]
+        assert titles == ['Quarterly report draft']
+
+    def test_title_matches_rank_first(self, app, client, admin_token, team):
+        """Test a title hit outranks a description-only hit."""
+        db.session.add_all([
+            TeamTask(team_id=team, title='Misc', description='Remember the deployment checklist'),
+            TeamTask(team_id=team, title='Deployment'),
+        ])
+        db.session.commit()
+
+        titles = [r['title'] for r in search(client, admin_token, 'deployment').get_json()['data']]
+        assert titles == ['Deployment', 'Misc']
+
+    def test_index_follows_writes(self, app, client, admin_token, team):
+        """Test updates and deletes made through the API are reflected in results."""
+        response = client.post('/api/team-tasks', headers=auth_header(admin_token), json={'title': 'Alpha'})
+        task_id = response.get_json()['data']['id']
+        assert len(search(client, admin_token, 'alpha').get_json()['data']) == 1
+
+        client.put(f'/api/team-tasks/{task_id}', headers=auth_header(admin_token), json={'title': 'Beta'})
+        assert search(client, admin_token, 'alpha').get_json()['data'] == []
+        assert len(search(client, admin_token, 'beta').get_json()['data']) == 1
+
+        client.delete(f'/api/team-tasks/{task_id}', headers=auth_header(admin_token))
+        assert search(client, admin_token, 'beta').get_json()['data'] == []
+
+    def test_pagination(self, app, client, admin_token, team):
+        """Test results page with a keyset cursor and no duplicates."""
+        db.session.add_all([TeamTask(team_id=team, title=f'Ticket {i}') for i in range(5)])
+        db.session.commit()
+
+        first = search(client, admin_token, 'ticket', limit=3).get_json()
+        second = search(client, admin_token, 'ticket', limit=3, cursor=first['meta']['next_cursor']).get_json()
+
+        ids = [r['id'] for r in first['data'] + second['data']]
+        assert len(ids) == 5 and len(set(ids)) == 5
+        assert second['meta']['next_cursor'] is None
+
+    def test_query_syntax_is_not_interpreted(self, app, client, admin_token, team):
+        """Test FTS operators and punctuation in q are treated as plain words."""
+        db.session.add(TeamTask(team_id=team, title='Fix login'))
+        db.session.commit()
+
+        assert len(search(client, admin_token, 'login" OR scope:team*').get_json()['data']) == 0
+        assert len(search(client, admin_token, '"login"').get_json()['data']) == 1
+        assert search(client, admin_token, '***').get_json()['data'] == []
+
+    def test_q_required(self, client, admin_token):
+        """Test a missing query is rejected."""
+        response = client.get('/api/search', headers=auth_header(admin_token))
+        assert response.status_code == 400
+
+    def test_requires_auth(self, client):
+        """Test search requires a token."""
+        assert client.get('/api/search?q=x').status_code == 401
@@ -0,0 +1,49 @@
+from sqlalchemy import func
+from app.models import db, User, Team, PrivateTodo, TeamTask, SubTask
+from app.models.sub_task import SubTaskStatus
+from app.services.seed import seed_email
+
+SEED_ARGS = [
+    'seed-bench', '--teams', '2', '--users-per-team', '3', '--tasks-per-team', '4',
+    '--sub-tasks-per-task', '3', '--todos-per-user', '2', '--password', 'secret123',
+]
+
+
+class TestSeedBench:
+    """Test the benchmark data seeding command."""
+
+    def test_seed_counts(self, app, runner):
+        """Test the requested number of rows is inserted per table."""
+        result = runner.invoke(args=SEED_ARGS)
+
+        assert result.exit_code == 0, result.output
+        assert '2 teams, 6 users, 8 team_tasks, 24 sub_tasks, 12 private_todos' in result.output
+        assert Team.query.count() == 2
+        assert User.query.count() == 6
+        assert TeamTask.query.count() == 8
+        assert SubTask.query.count() == 24
+        assert PrivateTodo.query.count() == 12
+
+    def test_seeded_data_is_consistent(self, app, runner):
+        """Test seeded users can log in and task counters match their sub-tasks."""
+        runner.invoke(args=SEED_ARGS)
+
+        admin = User.query.filter_by(email=seed_email(1, 0)).one()
+        assert admin.is_admin()
+        assert admin.check_password('secret123')
+        assert all(user.team_id == admin.team_id for user in User.query.filter(User.email.like('user1-%')))
+
+        for task in TeamTask.query.all():
+            done = db.session.query(func.count(SubTask.id)).filter(
+                SubTask.team_task_id == task.id, SubTask.status == SubTaskStatus.DONE.value
+            ).scalar()
+            assert task.sub_task_total == task.sub_tasks.count()
+            assert task.sub_task_done == done
+
+    def test_seed_refuses_to_run_twice(self, app, runner):
+        """Test seeding an already seeded database fails cleanly."""
+        runner.invoke(args=SEED_ARGS)
+        result = runner.invoke(args=SEED_ARGS)
+
+        assert result.exit_code != 0
+        assert 'already seeded' in result.output
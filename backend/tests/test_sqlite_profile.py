@@ -0,0 +1,118 @@
+import threading
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app import create_app
+from app.config import TestingConfig
+from app.models import db, Team
+
+
+@pytest.fixture
+def file_app(tmp_path, monkeypatch):
+    """Return a factory for apps backed by a temporary SQLite file."""
+    apps = []
+
+    def factory(wal, checkpoint_interval=0):
+        monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f'sqlite:///{tmp_path}/taskish.db')
+        monkeypatch.setattr(TestingConfig, 'SQLITE_WAL', wal)
+        monkeypatch.setattr(TestingConfig, 'SQLITE_BUSY_TIMEOUT_MS', 200)
+        monkeypatch.setattr(TestingConfig, 'SQLITE_CHECKPOINT_INTERVAL', checkpoint_interval)
+        # Match the profile's busy timeout so the default mode fails just as fast
+        monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_ENGINE_OPTIONS', {'connect_args': {'timeout': 0.2}}, raising=False)
+        app = create_app('testing')
+        with app.app_context():
+            db.create_all()
+            db.session.add(Team(name='Existing'))
+            db.session.commit()
+        apps.append(app)
+        return app
+
+    yield factory
+    for app in apps:
+        with app.app_context():
+            db.engine.dispose()
+
+
+def hold_write_lock(engine, locked, release):
+    """Insert a team inside an exclusive transaction and hold it until released."""
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute('BEGIN EXCLUSIVE')
+        cursor.execute("INSERT INTO teams (name) VALUES ('Pending')")
+        locked.set()
+        release.wait(5)
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def read_during_write(app):
+    """Count teams while another thread holds the write lock."""
+    with app.app_context():
+        engine = db.engine
+        locked, release = threading.Event(), threading.Event()
+        writer = threading.Thread(target=hold_write_lock, args=(engine, locked, release))
+        writer.start()
+        assert locked.wait(5)
+        try:
+            with engine.connect() as conn:
+                count = conn.execute(text('SELECT COUNT(*) FROM teams')).scalar()
+            # The write transaction is still open, so the read did not wait for it
+            assert writer.is_alive()
+            return count
+        finally:
+            release.set()
+            writer.join()
+
+
+class TestSQLiteProfile:
+    """Test the opt-in SQLite WAL profile."""
+
+    def test_pragmas_applied(self, file_app):
+        """Test new connections get the configured pragmas."""
+        app = file_app(wal=True)
+        with app.app_context(), db.engine.connect() as conn:
+            assert conn.exec_driver_sql('PRAGMA journal_mode').scalar() == 'wal'
+            assert conn.exec_driver_sql('PRAGMA synchronous').scalar() == 1  # NORMAL
+            assert conn.exec_driver_sql('PRAGMA busy_timeout').scalar() == 200
+            assert conn.exec_driver_sql('PRAGMA cache_size').scalar() == app.config['SQLITE_CACHE_SIZE']
+
+    def test_reads_do_not_block_during_writes(self, file_app):
+        """Test readers see the last committed snapshot while a write is in progress."""
+        app = file_app(wal=True)
+        # A blocked read would fail after the 200ms busy timeout instead of returning
+        assert read_during_write(app) == 1
+
+    def test_rollback_journal_blocks_readers(self, file_app):
+        """Test the default journal mode locks readers out during the same write."""
+        app = file_app(wal=False)
+        with pytest.raises(OperationalError, match='locked'):
+            read_during_write(app)
+
+    def test_checkpoint(self, file_app):
+        """Test a passive checkpoint copies WAL frames back into the database."""
+        app = file_app(wal=True)
+        with app.app_context():
+            db.session.add(Team(name='Another'))
+            db.session.commit()
+            busy, frames, checkpointed = app.extensions['sqlite_profile'].checkpoint(db.engine)
+
+        assert busy == 0
+        assert checkpointed == frames
+
+    def test_checkpoint_thread_started_by_first_request(self, file_app):
+        """Test the checkpoint thread starts in the process serving requests, not in create_app."""
+        app = file_app(wal=True, checkpoint_interval=3600)
+        profile = app.extensions['sqlite_profile']
+        try:
+            assert profile._thread is None
+            app.test_client().get('/api/health/db')
+            assert profile._thread.is_alive()
+        finally:
+            profile.stop()
+
+    def test_memory_database_untouched(self, app):
+        """Test the in-memory test database is left in its default mode."""
+        with db.engine.connect() as conn:
+            assert conn.exec_driver_sql('PRAGMA journal_mode').scalar() == 'memory'
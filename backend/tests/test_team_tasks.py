@@ -1,5 +1,10 @@
+import base64
+import json
+from datetime import timedelta
 import pytest
+from sqlalchemy import update
 from app.models import db, TeamTask, SubTask
+from app.utils.pagination import parse_timestamp
 from tests.conftest import auth_header
 
 
@@ -259,3 +264,748 @@ class TestSubTasks:
             headers=auth_header(admin_token)
         )
         assert response.get_json()['data']['progress'] == 50
+
+
+class TestBoardQueries:
+    """Test the board is loaded in a fixed number of queries."""
+
+    def _create_tasks(self, client, token, count, assigned_user_id):
+        for i in range(count):
+            response = client.post('/api/team-tasks',
+                headers=auth_header(token),
+                json={'title': f'Task {i}', 'assigned_user_id': assigned_user_id}
+            )
+            task_id = response.get_json()['data']['id']
+            for j in range(2):
+                client.post(f'/api/team-tasks/{task_id}/sub-tasks',
+                    headers=auth_header(token),
+                    json={'title': f'Sub Task {j}', 'status': 'DONE' if j == 0 else 'TODO'}
+                )
+
+    def test_load_board_query_count(self, app, client, admin_token, member_user, team, count_queries):
+        """Test load_board reads tasks, assignees and progress in one query."""
+        from app.services.board import load_board
+
+        self._create_tasks(client, admin_token, 5, member_user)
+
+        db.session.expire_all()
+        with count_queries() as statements:
+            board, _ = load_board(team, 100)
+
+        assert len(board) == 5
+        assert len(statements) == 1
+        assert all(task['progress'] == 50 for task in board)
+        assert all(task['assigned_user']['id'] == member_user for task in board)
+
+    def test_board_query_count_independent_of_size(self, client, admin_token, member_user, team, count_queries):
+        """Test GET /api/team-tasks issues the same number of queries for 1 or 10 tasks."""
+        self._create_tasks(client, admin_token, 1, member_user)
+        with count_queries() as small:
+            response = client.get('/api/team-tasks', headers=auth_header(admin_token))
+        assert len(response.get_json()['data']) == 1
+
+        self._create_tasks(client, admin_token, 9, member_user)
+        with count_queries() as large:
+            response = client.get('/api/team-tasks', headers=auth_header(admin_token))
+        assert len(response.get_json()['data']) == 10
+
+        assert len(large) == len(small)
+
+    def test_board_rows_match_to_dict(self, app, client, admin_token, member_user, team):
+        """Test the column-tuple board path serializes tasks exactly like to_dict."""
+        from app.services.board import load_board
+
+        self._create_tasks(client, admin_token, 2, member_user)
+        client.post('/api/team-tasks', headers=auth_header(admin_token), json={'title': 'Unassigned'})
+
+        board, _ = load_board(team, 100)
+        for row in board:
+            task = db.session.get(TeamTask, row['id'])
+            assert row == task.to_dict(include_assigned_user=True)
+
+
+class TestJSONProvider:
+    """Test JSON encoding of API responses."""
+
+    def test_datetimes_are_iso_8601(self, app, client, admin_token):
+        """Test datetimes are encoded as ISO 8601 strings."""
+        from datetime import datetime
+
+        response = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Task'}
+        )
+        created_at = response.get_json()['data']['created_at']
+        task = db.session.get(TeamTask, response.get_json()['data']['id'])
+        assert created_at == task.created_at.isoformat()
+        assert datetime.fromisoformat(created_at)
+
+    @pytest.mark.parametrize('name', ['stdlib', 'orjson'])
+    def test_providers_encode_alike(self, app, name):
+        """Test both JSON_PROVIDER choices produce the same ISO output."""
+        from datetime import datetime
+        from app.utils.json_provider import get_json_provider_class, orjson
+
+        if name == 'orjson' and orjson is None:
+            pytest.skip('orjson is not installed')
+
+        provider = get_json_provider_class(name)(app)
+        value = {'at': datetime(2024, 1, 2, 3, 4, 5, 123456), 'status': 'TODO'}
+        assert provider.loads(provider.dumps(value)) == {
+            'at': '2024-01-02T03:04:05.123456', 'status': 'TODO'
+        }
+
+
+class TestBoardPagination:
+    """Test keyset pagination and filters on the board."""
+
+    def test_paginate_with_cursor(self, client, admin_token, team):
+        """Test pages follow next_cursor without gaps or duplicates."""
+        for i in range(5):
+            client.post('/api/team-tasks',
+                headers=auth_header(admin_token),
+                json={'title': f'Task {i}'}
+            )
+
+        seen = []
+        cursor = None
+        while True:
+            url = '/api/team-tasks?limit=2' + (f'&cursor={cursor}' if cursor else '')
+            response = client.get(url, headers=auth_header(admin_token))
+            assert response.status_code == 200
+            data = response.get_json()
+            assert len(data['data']) <= 2
+            seen.extend(task['title'] for task in data['data'])
+            cursor = data['meta']['next_cursor']
+            if not cursor:
+                break
+
+        assert seen == [f'Task {i}' for i in reversed(range(5))]
+
+    def test_filter_by_status_and_assignee(self, client, admin_token, member_user, team):
+        """Test status and assigned_user_id filters."""
+        client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Blocked', 'status': 'BLOCKED', 'assigned_user_id': member_user}
+        )
+        client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Todo'}
+        )
+
+        response = client.get('/api/team-tasks?status=BLOCKED', headers=auth_header(admin_token))
+        assert [t['title'] for t in response.get_json()['data']] == ['Blocked']
+
+        response = client.get(f'/api/team-tasks?assigned_user_id={member_user}', headers=auth_header(admin_token))
+        assert [t['title'] for t in response.get_json()['data']] == ['Blocked']
+
+    def test_filter_updated_since(self, client, admin_token, team):
+        """Test updated_since excludes older rows."""
+        client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Task'}
+        )
+
+        response = client.get('/api/team-tasks?updated_since=2000-01-01T00:00:00Z', headers=auth_header(admin_token))
+        assert len(response.get_json()['data']) == 1
+
+        response = client.get('/api/team-tasks?updated_since=2999-01-01T00:00:00Z', headers=auth_header(admin_token))
+        assert response.get_json()['data'] == []
+
+    def test_invalid_page_args(self, client, admin_token, team):
+        """Test invalid limit, cursor and status are rejected."""
+        for query in ('limit=0', 'limit=abc', 'cursor=not-a-cursor', 'status=NOPE', 'updated_since=yesterday'):
+            response = client.get(f'/api/team-tasks?{query}', headers=auth_header(admin_token))
+            assert response.status_code == 400, query
+
+    def test_forged_cursor(self, client, admin_token, team):
+        """Test cursor values of the wrong type for their column are rejected, not sent to the database."""
+        forged = [
+            ('created', ['2020-01-01T00:00:00', {'a': 1}]),
+            ('created', ['2020-01-01T00:00:00', True]),
+            ('created', ['yesterday', 1]),
+            ('position', ['TODO', ['a'], 1]),
+            ('position', [1, 'a', 1]),
+        ]
+        for sort, values in forged:
+            cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+            response = client.get(f'/api/team-tasks?sort={sort}&cursor={cursor}', headers=auth_header(admin_token))
+            assert response.status_code == 400, values
+            assert response.get_json()['error']['message'] == 'Invalid cursor'
+
+
+class TestBatchOperations:
+    """Test batch create/update/delete endpoints."""
+
+    def test_batch_tasks(self, client, admin_token, member_user, team):
+        """Test a mixed batch is applied and returns per-item results."""
+        existing = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Existing'}
+        ).get_json()['data']['id']
+        doomed = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Doomed'}
+        ).get_json()['data']['id']
+
+        response = client.post('/api/team-tasks/batch',
+            headers=auth_header(admin_token),
+            json={
+                'create': [
+                    {'title': 'New 1', 'assigned_user_id': member_user},
+                    {'title': 'New 2', 'status': 'BLOCKED'}
+                ],
+                'update': [{'id': existing, 'status': 'DONE'}],
+                'delete': [doomed]
+            }
+        )
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert [t['title'] for t in data['created']] == ['New 1', 'New 2']
+        assert data['created'][0]['assigned_user_id'] == member_user
+        assert data['created'][0]['assigned_user']['id'] == member_user
+        assert 'assigned_user' not in data['created'][1]
+        assert data['updated'][0]['status'] == 'DONE'
+        assert data['deleted'] == [doomed]
+
+        # Same shape and naive UTC timestamps as the single-task endpoint
+        for task in data['created'] + data['updated']:
+            single = client.get(f'/api/team-tasks/{task["id"]}', headers=auth_header(admin_token)).get_json()['data']
+            assert (task['created_at'], task['updated_at']) == (single['created_at'], single['updated_at'])
+            assert not task['updated_at'].endswith('+00:00')
+
+        titles = {t['title'] for t in client.get('/api/team-tasks', headers=auth_header(admin_token)).get_json()['data']}
+        assert titles == {'Existing', 'New 1', 'New 2'}
+
+    def test_batch_rejected_atomically(self, client, admin_token, team):
+        """Test one invalid item rejects the whole batch."""
+        response = client.post('/api/team-tasks/batch',
+            headers=auth_header(admin_token),
+            json={'create': [{'title': 'Good'}, {'title': ''}, {'title': 'Bad user', 'assigned_user_id': 999}]}
+        )
+        assert response.status_code == 400
+        details = response.get_json()['error']['details']
+        assert set(details) == {'create[1].title', 'create[2].assigned_user_id'}
+
+        response = client.get('/api/team-tasks', headers=auth_header(admin_token))
+        assert response.get_json()['data'] == []
+
+    def test_batch_rejects_malformed_ids(self, client, admin_token, team):
+        """Test non-integer ids and ids both updated and deleted are validation errors."""
+        task_id = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Existing'}
+        ).get_json()['data']['id']
+
+        response = client.post('/api/team-tasks/batch',
+            headers=auth_header(admin_token),
+            json={
+                'create': [{'title': 'Bool user', 'assigned_user_id': True}],
+                'update': [{'id': task_id, 'title': 'Renamed'}, {'id': True, 'title': 'Bool id'}],
+                'delete': [{'x': 1}, [1], task_id]
+            }
+        )
+        assert response.status_code == 400
+        details = response.get_json()['error']['details']
+        assert set(details) == {
+            'create[0].assigned_user_id', 'update[1].id', 'delete[0]', 'delete[1]', 'delete[2]'
+        }
+
+    def test_member_cannot_batch(self, client, member_token):
+        """Test member cannot use batch endpoint."""
+        response = client.post('/api/team-tasks/batch',
+            headers=auth_header(member_token),
+            json={'create': [{'title': 'Task'}]}
+        )
+        assert response.status_code == 403
+
+    def test_batch_sub_tasks(self, client, admin_token, member_user, team, count_queries):
+        """Test sub-task batch checks all responsible users with one IN query."""
+        task_id = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Main Task'}
+        ).get_json()['data']['id']
+
+        items = [{'title': f'Sub {i}', 'responsible_user_id': member_user} for i in range(20)]
+        with count_queries() as statements:
+            response = client.post(f'/api/team-tasks/{task_id}/sub-tasks/batch',
+                headers=auth_header(admin_token),
+                json={'create': items}
+            )
+        assert response.status_code == 200
+        created = response.get_json()['data']['created']
+        assert len(created) == 20
+        assert created[0]['responsible_user']['id'] == member_user
+        assert not created[0]['created_at'].endswith('+00:00')
+        user_selects = [s for s in statements if s.lstrip().startswith('SELECT') and 'FROM users' in s]
+        # One for the current user, one IN query for all responsible users
+        assert len(user_selects) == 2
+        # The results are reloaded after the commit in one query, not one per row
+        assert len([s for s in statements if s.lstrip().startswith('SELECT sub_tasks.id')]) == 1
+
+        response = client.get(f'/api/team-tasks/{task_id}/sub-tasks', headers=auth_header(admin_token))
+        assert len(response.get_json()['data']) == 20
+
+
+class TestConditionalGet:
+    """Test ETag / If-None-Match support."""
+
+    def test_board_not_modified(self, client, admin_token, team):
+        """Test the board returns 304 until a task or sub-task changes."""
+        task_id = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Task'}
+        ).get_json()['data']['id']
+        sub_task_id = client.post(f'/api/team-tasks/{task_id}/sub-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Sub Task'}
+        ).get_json()['data']['id']
+
+        response = client.get('/api/team-tasks', headers=auth_header(admin_token))
+        etag = response.headers['ETag']
+        assert etag
+
+        headers = {**auth_header(admin_token), 'If-None-Match': etag}
+        response = client.get('/api/team-tasks', headers=headers)
+        assert response.status_code == 304
+        assert response.data == b''
+
+        client.patch(f'/api/team-tasks/{task_id}/sub-tasks/{sub_task_id}/status',
+            headers=auth_header(admin_token),
+            json={'status': 'DONE'}
+        )
+        response = client.get('/api/team-tasks', headers=headers)
+        assert response.status_code == 200
+        assert response.get_json()['data'][0]['progress'] == 100
+        assert response.headers['ETag'] != etag
+
+    def test_task_detail_and_sub_tasks_not_modified(self, client, admin_token, team):
+        """Test task detail and sub-task list honour If-None-Match."""
+        task_id = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Task'}
+        ).get_json()['data']['id']
+
+        for url in (f'/api/team-tasks/{task_id}', f'/api/team-tasks/{task_id}/sub-tasks'):
+            etag = client.get(url, headers=auth_header(admin_token)).headers['ETag']
+            response = client.get(url, headers={**auth_header(admin_token), 'If-None-Match': etag})
+            assert response.status_code == 304
+
+    def test_etag_fallback_for_other_endpoints(self, client, admin_token):
+        """Test endpoints without a version stamp still get a body-hash ETag."""
+        response = client.get('/api/auth/me', headers=auth_header(admin_token))
+        etag = response.headers['ETag']
+        response = client.get('/api/auth/me', headers={**auth_header(admin_token), 'If-None-Match': etag})
+        assert response.status_code == 304
+
+
+class TestDeltaSync:
+    """Test the changes endpoint used to keep a client mirror."""
+
+    def test_changes_since_watermark(self, app, client, admin_token, team):
+        """Test only rows changed after the watermark are returned."""
+        app.config['SYNC_OVERLAP_SECONDS'] = 0
+        kept = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Kept'}
+        ).get_json()['data']['id']
+        doomed = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Doomed'}
+        ).get_json()['data']['id']
+        sub_task_id = client.post(f'/api/team-tasks/{kept}/sub-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Sub Task'}
+        ).get_json()['data']['id']
+
+        initial = client.get('/api/team-tasks/changes', headers=auth_header(admin_token)).get_json()['data']
+        assert {t['id'] for t in initial['tasks']} == {kept, doomed}
+        watermark = initial['watermark']
+
+        # Nothing changed: empty delta, same watermark
+        data = client.get(f'/api/team-tasks/changes?since={watermark}', headers=auth_header(admin_token)).get_json()['data']
+        assert data['tasks'] == [] and data['sub_tasks'] == []
+        assert data['deleted'] == {'team_tasks': [], 'sub_tasks': []}
+        assert data['watermark'] == watermark
+
+        client.delete(f'/api/team-tasks/{doomed}', headers=auth_header(admin_token))
+        client.patch(f'/api/team-tasks/{kept}/sub-tasks/{sub_task_id}/status',
+            headers=auth_header(admin_token),
+            json={'status': 'DONE'}
+        )
+
+        data = client.get(f'/api/team-tasks/changes?since={watermark}', headers=auth_header(admin_token)).get_json()['data']
+        assert data['deleted']['team_tasks'] == [doomed]
+        assert [st['status'] for st in data['sub_tasks']] == ['DONE']
+        assert [(t['id'], t['progress']) for t in data['tasks']] == [(kept, 100)]
+        assert data['watermark'] > watermark
+
+    def test_deleted_sub_tasks_tombstoned(self, client, admin_token, team):
+        """Test deleting a task tombstones its sub-tasks too."""
+        task_id = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Task'}
+        ).get_json()['data']['id']
+        sub_task_id = client.post(f'/api/team-tasks/{task_id}/sub-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Sub Task'}
+        ).get_json()['data']['id']
+        watermark = client.get('/api/team-tasks/changes', headers=auth_header(admin_token)).get_json()['data']['watermark']
+
+        client.delete(f'/api/team-tasks/{task_id}', headers=auth_header(admin_token))
+
+        data = client.get(f'/api/team-tasks/changes?since={watermark}', headers=auth_header(admin_token)).get_json()['data']
+        assert data['deleted'] == {'team_tasks': [task_id], 'sub_tasks': [sub_task_id]}
+
+    def test_late_commit_not_missed(self, client, admin_token, team):
+        """Test a row committed after a newer watermark was handed out is still sent."""
+        early = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Early'}
+        ).get_json()['data']['id']
+        synced = client.get('/api/team-tasks/changes', headers=auth_header(admin_token)).get_json()['data']
+        watermark = synced['watermark']
+
+        # A transaction that stamped its row before the watermark but committed after it
+        stamped = parse_timestamp(watermark) - timedelta(seconds=5)
+        late = TeamTask(team_id=team, title='Late', created_at=stamped, updated_at=stamped)
+        db.session.add(late)
+        old = TeamTask(team_id=team, title='Old')
+        db.session.add(old)
+        db.session.flush()
+        db.session.execute(update(TeamTask).where(TeamTask.id == old.id).values(
+            updated_at=stamped - timedelta(minutes=5)))
+        db.session.commit()
+
+        data = client.get(f'/api/team-tasks/changes?since={watermark}', headers=auth_header(admin_token)).get_json()['data']
+        # The overlap window re-sends the already-synced task too; old, unchanged rows stay out
+        assert {t['id'] for t in data['tasks']} == {early, late.id}
+        assert data['watermark'] == watermark
+
+    def test_stale_watermark_requires_resync(self, client, admin_token, team):
+        """Test a watermark older than the tombstone retention returns 410."""
+        response = client.get('/api/team-tasks/changes?since=2000-01-01T00:00:00', headers=auth_header(admin_token))
+        assert response.status_code == 410
+
+
+class TestSubTaskCounters:
+    """Test denormalized sub-task counters stay in sync."""
+
+    def _progress(self, client, token, task_id):
+        return client.get(f'/api/team-tasks/{task_id}', headers=auth_header(token)).get_json()['data']['progress']
+
+    def test_counters_follow_sub_task_writes(self, client, admin_token, team):
+        """Test create, update, status change and delete keep the counters right."""
+        task_id = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Main Task'}
+        ).get_json()['data']['id']
+        ids = [
+            client.post(f'/api/team-tasks/{task_id}/sub-tasks',
+                headers=auth_header(admin_token),
+                json={'title': f'Sub {i}', 'status': 'DONE' if i == 0 else 'TODO'}
+            ).get_json()['data']['id']
+            for i in range(4)
+        ]
+        task = db.session.get(TeamTask, task_id)
+        assert (task.sub_task_total, task.sub_task_done) == (4, 1)
+        assert self._progress(client, admin_token, task_id) == 25
+
+        client.put(f'/api/team-tasks/{task_id}/sub-tasks/{ids[1]}',
+            headers=auth_header(admin_token),
+            json={'status': 'DONE'}
+        )
+        client.patch(f'/api/team-tasks/{task_id}/sub-tasks/{ids[0]}/status',
+            headers=auth_header(admin_token),
+            json={'status': 'IN_PROGRESS'}
+        )
+        assert self._progress(client, admin_token, task_id) == 25
+
+        client.delete(f'/api/team-tasks/{task_id}/sub-tasks/{ids[2]}', headers=auth_header(admin_token))
+        assert self._progress(client, admin_token, task_id) == 33
+
+        client.post(f'/api/team-tasks/{task_id}/sub-tasks/batch',
+            headers=auth_header(admin_token),
+            json={'create': [{'title': 'New', 'status': 'DONE'}], 'update': [{'id': ids[3], 'status': 'DONE'}], 'delete': [ids[0]]}
+        )
+        db.session.expire_all()
+        task = db.session.get(TeamTask, task_id)
+        assert (task.sub_task_total, task.sub_task_done) == (3, 3)
+
+    def test_repair_command(self, app, client, admin_token, team, runner):
+        """Test the repair command recomputes drifted counters in bulk."""
+        task_id = client.post('/api/team-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Main Task'}
+        ).get_json()['data']['id']
+        client.post(f'/api/team-tasks/{task_id}/sub-tasks',
+            headers=auth_header(admin_token),
+            json={'title': 'Sub', 'status': 'DONE'}
+        )
+        task = db.session.get(TeamTask, task_id)
+        task.sub_task_total, task.sub_task_done = 7, 0
+        db.session.commit()
+
+        result = runner.invoke(args=['repair-subtask-counters'])
+        assert 'on 1 tasks' in result.output
+
+        db.session.expire_all()
+        task = db.session.get(TeamTask, task_id)
+        assert (task.sub_task_total, task.sub_task_done) == (1, 1)
+
+
+class TestBoardStats:
+    """Test the aggregated board statistics endpoint."""
+
+    def _create(self, client, token, title, assigned_user_id=None, status=None, sub_tasks=()):
+        response = client.post('/api/team-tasks', headers=auth_header(token),
+                               json={'title': title, 'assigned_user_id': assigned_user_id})
+        task_id = response.get_json()['data']['id']
+        if status:
+            client.patch(f'/api/team-tasks/{task_id}/status', headers=auth_header(token), json={'status': status})
+        for sub_status, responsible in sub_tasks:
+            client.post(f'/api/team-tasks/{task_id}/sub-tasks', headers=auth_header(token),
+                        json={'title': 'Sub', 'status': sub_status, 'responsible_user_id': responsible})
+        return task_id
+
+    def test_stats(self, client, admin_token, admin_user, member_user, team):
+        """Test counts, progress and workload match the board."""
+        self._create(client, admin_token, 'A', member_user, sub_tasks=[('DONE', member_user), ('TODO', member_user)])
+        self._create(client, admin_token, 'B', admin_user, status='DONE')
+        self._create(client, admin_token, 'C', sub_tasks=[('TODO', None)])
+
+        response = client.get('/api/team-tasks/stats', headers=auth_header(admin_token))
+
+        assert response.status_code == 200
+        stats = response.get_json()['data']
+        assert stats['total_tasks'] == 3
+        assert stats['by_status'] == {'TODO': 2, 'IN_PROGRESS': 0, 'BLOCKED': 0, 'DONE': 1}
+        assert stats['progress'] == (50 + 100 + 0) // 3
+        workload = {w['user_id']: w for w in stats['workload']}
+        assert workload[member_user]['open_tasks'] == 1
+        assert workload[member_user]['open_sub_tasks'] == 1
+        assert workload[admin_user]['open_tasks'] == 0
+        assert stats['unassigned'] == {'open_tasks': 1, 'open_sub_tasks': 1}
+
+    def test_cached_until_board_event(self, client, admin_token, team, count_queries):
+        """Test stats are served from cache and refreshed after a mutation."""
+        task_id = self._create(client, admin_token, 'A')
+        client.get('/api/team-tasks/stats', headers=auth_header(admin_token))
+
+        with count_queries() as statements:
+            response = client.get('/api/team-tasks/stats', headers=auth_header(admin_token))
+        assert not any('GROUP BY' in s for s in statements)
+        assert response.get_json()['data']['by_status']['TODO'] == 1
+
+        client.patch(f'/api/team-tasks/{task_id}/status', headers=auth_header(admin_token),
+                     json={'status': 'IN_PROGRESS'})
+        stats = client.get('/api/team-tasks/stats', headers=auth_header(admin_token)).get_json()['data']
+        assert stats['by_status']['TODO'] == 0
+        assert stats['by_status']['IN_PROGRESS'] == 1
+
+    def test_refreshed_after_change_in_other_worker(self, client, admin_token, team):
+        """Test a change that published no event here is still picked up from the board version."""
+        task_id = self._create(client, admin_token, 'A')
+        client.get('/api/team-tasks/stats', headers=auth_header(admin_token))
+
+        # As another worker would write it: no event reaches this process
+        db.session.get(TeamTask, task_id).status = 'DONE'
+        db.session.commit()
+
+        stats = client.get('/api/team-tasks/stats', headers=auth_header(admin_token)).get_json()['data']
+        assert (stats['by_status']['TODO'], stats['by_status']['DONE']) == (0, 1)
+
+    def test_empty_board(self, client, admin_token, team):
+        """Test a team without tasks gets zeroed stats."""
+        stats = client.get('/api/team-tasks/stats', headers=auth_header(admin_token)).get_json()['data']
+        assert stats['total_tasks'] == 0
+        assert stats['progress'] == 0
+
+
+class TestTaskOrdering:
+    """Test board ranks, moves and rebalancing."""
+
+    def _create(self, client, token, title, status='TODO'):
+        response = client.post('/api/team-tasks', headers=auth_header(token), json={'title': title, 'status': status})
+        return response.get_json()['data']['id']
+
+    def _board(self, client, token):
+        response = client.get('/api/team-tasks?sort=position', headers=auth_header(token))
+        return [(t['status'], t['title']) for t in response.get_json()['data']]
+
+    def _move(self, client, token, task_id, **body):
+        return client.patch(f'/api/team-tasks/{task_id}/move', headers=auth_header(token), json=body)
+
+    def test_new_tasks_append_to_column(self, client, admin_token, team):
+        """Test created tasks go to the end of their column and the board lists columns in order."""
+        self._create(client, admin_token, 'A')
+        self._create(client, admin_token, 'D', status='DONE')
+        self._create(client, admin_token, 'B')
+
+        assert self._board(client, admin_token) == [('DONE', 'D'), ('TODO', 'A'), ('TODO', 'B')]
+
+    def test_move_within_column_writes_one_row(self, client, admin_token, team, count_queries):
+        """Test moving a task between two others updates only that task."""
+        a, b, c = (self._create(client, admin_token, title) for title in 'ABC')
+
+        with count_queries() as statements:
+            response = self._move(client, admin_token, c, status='TODO', after_id=a, before_id=b)
+        assert response.status_code == 200
+        updates = [s for s in statements if s.startswith('UPDATE')]
+        assert len(updates) == 1 and 'team_tasks' in updates[0]
+        assert self._board(client, admin_token) == [('TODO', 'A'), ('TODO', 'C'), ('TODO', 'B')]
+
+    def test_move_with_one_neighbour(self, client, admin_token, team):
+        """Test a single neighbour places the task next to it, and none appends."""
+        a, b, c = (self._create(client, admin_token, title) for title in 'ABC')
+        d = self._create(client, admin_token, 'D', status='DONE')
+
+        self._move(client, admin_token, c, before_id=a)
+        assert [t for _, t in self._board(client, admin_token)] == ['D', 'C', 'A', 'B']
+        self._move(client, admin_token, d, status='TODO', after_id=c)
+        assert self._board(client, admin_token) == [('TODO', 'C'), ('TODO', 'D'), ('TODO', 'A'), ('TODO', 'B')]
+        self._move(client, admin_token, c, status='DONE')
+        self._move(client, admin_token, a, status='TODO')
+        assert self._board(client, admin_token) == [('DONE', 'C'), ('TODO', 'D'), ('TODO', 'B'), ('TODO', 'A')]
+
+    def test_move_validation(self, client, admin_token, member_token, team):
+        """Test neighbours must be other tasks in the target column, in order."""
+        a, b = self._create(client, admin_token, 'A'), self._create(client, admin_token, 'B')
+        d = self._create(client, admin_token, 'D', status='DONE')
+
+        assert self._move(client, admin_token, a, status='TODO', after_id=d).status_code == 400
+        assert self._move(client, admin_token, a, after_id=a).status_code == 400
+        assert self._move(client, admin_token, d, status='TODO', after_id=b, before_id=a).status_code == 400
+        assert self._move(client, admin_token, a, after_id='b').status_code == 400
+        assert self._move(client, admin_token, a, status='NOPE').status_code == 400
+        assert self._move(client, member_token, a, status='DONE').status_code == 403
+
+    def test_tied_neighbours_conflict(self, app, client, admin_token, team, monkeypatch):
+        """Test moving between tasks that share a rank asks the client to retry."""
+        a, b, c = (self._create(client, admin_token, title) for title in 'ABC')
+        db.session.get(TeamTask, b).position = db.session.get(TeamTask, a).position
+        db.session.commit()
+
+        scheduled = []
+        monkeypatch.setattr(app.extensions['rank_rebalancer'], 'schedule', lambda *key: scheduled.append(key))
+        response = self._move(client, admin_token, c, after_id=a, before_id=b)
+        assert response.status_code == 409
+        assert scheduled == [(team, 'TODO')]
+
+    def test_status_change_appends_to_new_column(self, client, admin_token, team):
+        """Test a plain status update puts the task at the end of its new column."""
+        a = self._create(client, admin_token, 'A')
+        self._create(client, admin_token, 'B', status='DONE')
+        client.patch(f'/api/team-tasks/{a}/status', headers=auth_header(admin_token), json={'status': 'DONE'})
+
+        assert self._board(client, admin_token) == [('DONE', 'B'), ('DONE', 'A')]
+
+    def test_long_rank_schedules_rebalance(self, app, client, admin_token, team, monkeypatch):
+        """Test repeated moves into one gap queue the column for renumbering."""
+        rebalancer = app.extensions['rank_rebalancer']
+        monkeypatch.setattr(rebalancer, 'max_length', 3)
+        scheduled = []
+        monkeypatch.setattr(rebalancer, 'schedule', lambda *key: scheduled.append(key))
+        a, b = self._create(client, admin_token, 'A'), self._create(client, admin_token, 'B')
+
+        for i in range(20):
+            task_id = self._create(client, admin_token, f'T{i}')
+            self._move(client, admin_token, task_id, after_id=a, before_id=b)
+            b = task_id
+        assert (team, 'TODO') in scheduled
+
+    def test_rebalance_column(self, app, client, admin_token, team):
+        """Test the background rebalance shortens ranks and keeps the order."""
+        a, b = self._create(client, admin_token, 'A'), self._create(client, admin_token, 'B')
+        for i in range(30):
+            task_id = self._create(client, admin_token, f'T{i}')
+            self._move(client, admin_token, task_id, after_id=a, before_id=b)
+            b = task_id
+        before = self._board(client, admin_token)
+        assert max(len(t.position) for t in TeamTask.query) > 5
+
+        app.extensions['rank_rebalancer'].schedule(team, 'TODO').result()
+        db.session.expire_all()
+
+        assert self._board(client, admin_token) == before
+        assert max(len(t.position) for t in TeamTask.query) <= 2
+
+    def test_rebalance_ranks_command(self, app, runner, client, admin_token, team):
+        """Test the CLI renumbers only columns with long ranks."""
+        self._create(client, admin_token, 'A')
+        task = TeamTask.query.one()
+        task.position = 'i' * 40
+        db.session.commit()
+
+        result = runner.invoke(args=['rebalance-ranks'])
+        assert 'Rebalanced 1 columns (1 tasks)' in result.output
+        db.session.expire_all()
+        assert TeamTask.query.one().position == 'i'
+
+    def test_invalid_sort(self, client, admin_token, team):
+        response = client.get('/api/team-tasks?sort=title', headers=auth_header(admin_token))
+        assert response.status_code == 400
+
+    def test_position_pagination(self, client, admin_token, team):
+        """Test sort=position pages through the board with a keyset cursor."""
+        for i in range(5):
+            self._create(client, admin_token, f'T{i}', status='DONE' if i % 2 else 'TODO')
+
+        titles, cursor = [], None
+        while True:
+            url = '/api/team-tasks?sort=position&limit=2' + (f'&cursor={cursor}' if cursor else '')
+            body = client.get(url, headers=auth_header(admin_token)).get_json()
+            titles += [t['title'] for t in body['data']]
+            cursor = body['meta']['next_cursor']
+            if not cursor:
+                break
+        assert titles == ['T1', 'T3', 'T0', 'T2', 'T4']
+
+
+class TestStreaming:
+    """Test ?stream=1 list responses."""
+
+    def _collect(self, response):
+        chunks = list(response.response)
+        return chunks, json.loads(b''.join(c if isinstance(c, bytes) else c.encode() for c in chunks))
+
+    def test_stream_board(self, app, client, admin_token, member_user, team, monkeypatch):
+        """Test the streamed board matches the paginated one, written in batches."""
+        monkeypatch.setitem(app.config, 'STREAM_BATCH_SIZE', 2)
+        for i in range(5):
+            client.post('/api/team-tasks', headers=auth_header(admin_token),
+                        json={'title': f'Task {i}', 'assigned_user_id': member_user if i % 2 else None})
+
+        for sort in ('created', 'position'):
+            paged = client.get(f'/api/team-tasks?sort={sort}', headers=auth_header(admin_token)).get_json()
+            response = client.get(f'/api/team-tasks?sort={sort}&stream=1', headers=auth_header(admin_token),
+                                  buffered=False)
+            assert response.is_streamed
+            assert response.mimetype == 'application/json'
+            chunks, body = self._collect(response)
+            assert len(chunks) == 5  # opening, three batches of up to two tasks, closing
+            assert body == {'success': True, 'data': paged['data']}
+
+    def test_stream_empty_and_not_modified(self, client, admin_token, team):
+        """Test an empty stream is valid JSON and streamed responses honour ETags."""
+        response = client.get('/api/team-tasks?stream=1', headers=auth_header(admin_token))
+        assert response.get_json() == {'success': True, 'data': []}
+
+        etag = response.headers['ETag']
+        response = client.get('/api/team-tasks?stream=1',
+                              headers={**auth_header(admin_token), 'If-None-Match': etag})
+        assert response.status_code == 304
+
+    def test_stream_sub_tasks(self, client, admin_token, member_user, team):
+        """Test streamed sub-tasks match the regular list, responsible users included."""
+        task_id = client.post('/api/team-tasks', headers=auth_header(admin_token),
+                              json={'title': 'Task'}).get_json()['data']['id']
+        for i in range(3):
+            client.post(f'/api/team-tasks/{task_id}/sub-tasks', headers=auth_header(admin_token),
+                        json={'title': f'Sub {i}', 'responsible_user_id': member_user if i else None})
+
+        url = f'/api/team-tasks/{task_id}/sub-tasks'
+        expected = client.get(url, headers=auth_header(admin_token)).get_json()['data']
+        streamed = client.get(f'{url}?stream=1', headers=auth_header(admin_token)).get_json()
+        assert streamed == {'success': True, 'data': expected}
+        assert streamed['data'][1]['responsible_user']['id'] == member_user
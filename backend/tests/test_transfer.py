@@ -0,0 +1,230 @@
+import csv
+import io
+import json
+from app.models import db, Team, TeamTask, SubTask, PrivateTodo
+from app.services import transfer
+from tests.conftest import auth_header
+
+
+def create_board(client, token, member_id):
+    """Two tasks, the first with two sub-tasks."""
+    ids = []
+    for i, status in enumerate(('TODO', 'DONE')):
+        ids.append(client.post('/api/team-tasks', headers=auth_header(token), json={
+            'title': f'Task {i}', 'description': 'Line 1\nLine "2", with comma' if i == 0 else None,
+            'status': status, 'assigned_user_id': member_id
+        }).get_json()['data']['id'])
+    for i in range(2):
+        client.post(f'/api/team-tasks/{ids[0]}/sub-tasks', headers=auth_header(token), json={
+            'title': f'Sub {i}', 'responsible_user_id': member_id if i else None
+        })
+    client.patch(f'/api/team-tasks/{ids[0]}/sub-tasks/2/status', headers=auth_header(token),
+                 json={'status': 'DONE'})
+    return ids
+
+
+def board(team_id):
+    """Comparable snapshot of a team's tasks and sub-tasks."""
+    tasks = TeamTask.query.filter_by(team_id=team_id).order_by(TeamTask.id).all()
+    return [
+        (t.title, t.description, t.status, t.assigned_user_id, t.sub_task_total, t.sub_task_done,
+         [(s.title, s.status, s.responsible_user_id) for s in t.sub_tasks.order_by(SubTask.id)])
+        for t in tasks
+    ]
+
+
+def import_file(client, token, url, body, fmt=None, content_type='application/x-ndjson'):
+    query = f'?format={fmt}' if fmt else ''
+    return client.post(f'{url}{query}', headers=auth_header(token), data=body, content_type=content_type)
+
+
+def move_to_new_team(team_id):
+    """Move the team's tasks to a fresh team so an import can be compared against them."""
+    other = Team(name='Old')
+    db.session.add(other)
+    db.session.commit()
+    TeamTask.query.filter_by(team_id=team_id).update({'team_id': other.id})
+    db.session.commit()
+    return other.id
+
+
+class TestTeamTaskExport:
+    """Test streamed team task exports."""
+
+    def test_export_ndjson(self, client, admin_token, member_user, team):
+        """Test NDJSON export holds one task per line with nested sub-tasks."""
+        ids = create_board(client, admin_token, member_user)
+        response = client.get('/api/team-tasks/export', headers=auth_header(admin_token), buffered=False)
+        assert response.is_streamed
+        assert response.mimetype == 'application/x-ndjson'
+        assert 'team-tasks.ndjson' in response.headers['Content-Disposition']
+
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [line['id'] for line in lines] == ids
+        assert [s['title'] for s in lines[0]['sub_tasks']] == ['Sub 0', 'Sub 1']
+        assert lines[0]['sub_tasks'][1]['status'] == 'DONE'
+        assert lines[1]['sub_tasks'] == []
+
+    def test_export_csv(self, app, client, admin_token, member_user, team, monkeypatch):
+        """Test CSV export writes each task row followed by its sub-task rows."""
+        monkeypatch.setitem(app.config, 'STREAM_BATCH_SIZE', 1)
+        ids = create_board(client, admin_token, member_user)
+        response = client.get('/api/team-tasks/export?format=csv', headers=auth_header(admin_token))
+        assert response.mimetype == 'text/csv'
+
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+        assert [(r['record'], r['parent_id']) for r in rows] == [
+            ('task', ''), ('sub_task', str(ids[0])), ('sub_task', str(ids[0])), ('task', '')
+        ]
+        assert rows[0]['description'] == 'Line 1\nLine "2", with comma'
+        assert rows[3]['description'] == ''
+        assert rows[3]['user_id'] == str(member_user)
+
+    def test_csv_formulas_escaped(self, client, admin_token, team):
+        """Test cells a spreadsheet would run as formulas are prefixed, and import back unchanged."""
+        titles = ['=HYPERLINK("http://evil")', '+1', '-2', '@SUM(A1)', 'Plain']
+        for title in titles:
+            client.post('/api/team-tasks', headers=auth_header(admin_token), json={'title': title})
+        exported = client.get('/api/team-tasks/export?format=csv', headers=auth_header(admin_token)).get_data()
+
+        rows = list(csv.DictReader(io.StringIO(exported.decode())))
+        assert [r['title'] for r in rows] == ["'" + t for t in titles[:4]] + ['Plain']
+
+        move_to_new_team(team)
+        import_file(client, admin_token, '/api/team-tasks/import', exported, 'csv')
+        assert [t.title for t in TeamTask.query.filter_by(team_id=team).order_by(TeamTask.id)] == titles
+
+    def test_export_invalid_format(self, client, admin_token, team):
+        """Test unknown export formats are rejected."""
+        response = client.get('/api/team-tasks/export?format=xml', headers=auth_header(admin_token))
+        assert response.status_code == 400
+
+
+class TestTeamTaskImport:
+    """Test bulk team task imports."""
+
+    def test_round_trip(self, app, client, admin_token, member_user, team):
+        """Test an export imports back into an identical board, in both formats."""
+        create_board(client, admin_token, member_user)
+        for fmt in ('ndjson', 'csv'):
+            exported = client.get(f'/api/team-tasks/export?format={fmt}',
+                                  headers=auth_header(admin_token)).get_data()
+            expected = board(team)
+            old_team = move_to_new_team(team)
+
+            response = import_file(client, admin_token, '/api/team-tasks/import', exported, fmt)
+            assert response.status_code == 200
+            result = response.get_json()['data']
+            assert result == {'created': {'team_tasks': 2, 'sub_tasks': 2}, 'skipped': 0, 'errors': []}
+            assert board(team) == expected
+            TeamTask.query.filter_by(team_id=old_team).delete()
+
+    def test_round_trip_portable_insert(self, app, client, admin_token, member_user, team, monkeypatch):
+        """Test the RETURNING insert used on PostgreSQL keeps sub-tasks linked to their tasks."""
+        monkeypatch.setattr(transfer, '_executemany', transfer._insert_returning)
+        create_board(client, admin_token, member_user)
+        exported = client.get('/api/team-tasks/export', headers=auth_header(admin_token)).get_data()
+        expected = board(team)
+        move_to_new_team(team)
+
+        response = import_file(client, admin_token, '/api/team-tasks/import', exported)
+        assert response.get_json()['data']['created'] == {'team_tasks': 2, 'sub_tasks': 2}
+        assert board(team) == expected
+
+    def test_imported_tasks_appended_to_columns(self, client, admin_token, team):
+        """Test imported tasks get positions after existing tasks in their column."""
+        client.post('/api/team-tasks', headers=auth_header(admin_token), json={'title': 'Existing'})
+        body = '\n'.join(json.dumps({'title': f'New {i}'}) for i in range(3))
+        import_file(client, admin_token, '/api/team-tasks/import', body)
+
+        response = client.get('/api/team-tasks?sort=position', headers=auth_header(admin_token))
+        assert [t['title'] for t in response.get_json()['data']] == ['Existing', 'New 0', 'New 1', 'New 2']
+
+    def test_invalid_rows_skipped(self, client, admin_token, member_user, team):
+        """Test invalid records are skipped and reported with their line numbers."""
+        body = '\n'.join([
+            json.dumps({'title': 'Good'}),
+            '{not json',
+            json.dumps({'title': '', 'status': 'NOPE'}),
+            '',
+            json.dumps({'title': 'Bad sub-task', 'sub_tasks': [{'title': 'x', 'responsible_user_id': 999}]}),
+            json.dumps({'title': 'Also good', 'assigned_user_id': member_user}),
+            json.dumps({'title': 'Bool user', 'assigned_user_id': True}),
+        ])
+        result = import_file(client, admin_token, '/api/team-tasks/import', body).get_json()['data']
+        assert result['created'] == {'team_tasks': 2, 'sub_tasks': 0}
+        assert result['skipped'] == 4
+        assert [e['line'] for e in result['errors']] == [2, 3, 5, 7]
+        assert set(result['errors'][1]['errors']) == {'title', 'status'}
+        assert 'sub_tasks[0].responsible_user_id' in result['errors'][2]['errors']
+        assert result['errors'][3]['errors'] == {'assigned_user_id': 'assigned_user_id must be an integer'}
+        assert [t.title for t in TeamTask.query.order_by(TeamTask.id)] == ['Good', 'Also good']
+
+    def test_csv_orphan_sub_task(self, client, admin_token, team):
+        """Test CSV sub-task rows that do not follow their task are reported."""
+        body = 'record,id,parent_id,title\nsub_task,1,7,Orphan\ntask,7,,Task\nsub_task,2,7,Child\n'
+        result = import_file(client, admin_token, '/api/team-tasks/import', body,
+                             content_type='text/csv').get_json()['data']
+        assert result['created'] == {'team_tasks': 1, 'sub_tasks': 1}
+        assert result['errors'] == [{'line': 2, 'errors': {'parent_id': 'Sub-task rows must directly follow their task row'}}]
+
+    def test_chunked_commits(self, app, client, admin_token, team, monkeypatch, count_queries):
+        """Test records are inserted in chunks, each in its own transaction."""
+        monkeypatch.setitem(app.config, 'IMPORT_CHUNK_SIZE', 4)
+        body = '\n'.join(json.dumps({'title': f'T{i}', 'sub_tasks': [{'title': 's'}]}) for i in range(5))
+        with count_queries() as statements:
+            result = import_file(client, admin_token, '/api/team-tasks/import', body).get_json()['data']
+        assert result['created'] == {'team_tasks': 5, 'sub_tasks': 5}
+        task_inserts = [s for s in statements if s.lstrip().startswith('INSERT INTO team_tasks')]
+        assert len(task_inserts) == 3  # two records (four rows) per chunk
+
+    def test_multipart_upload(self, client, admin_token, team):
+        """Test a file field is accepted, with the format taken from its extension."""
+        data = {'file': (io.BytesIO(b'title,status\nFrom file,BLOCKED\n'), 'tasks.csv')}
+        response = client.post('/api/team-tasks/import', headers=auth_header(admin_token),
+                               data=data, content_type='multipart/form-data')
+        assert response.get_json()['data']['created']['team_tasks'] == 1
+        assert TeamTask.query.one().status == 'BLOCKED'
+
+    def test_unreadable_file(self, client, admin_token, team):
+        """Test files that cannot be parsed at all are rejected."""
+        response = import_file(client, admin_token, '/api/team-tasks/import', b'\xff\xfe\x00bad')
+        assert response.status_code == 400
+        response = import_file(client, admin_token, '/api/team-tasks/import', 'name\nx\n', 'csv')
+        assert response.status_code == 400
+        assert 'title' in response.get_json()['error']['message']
+
+    def test_import_requires_admin(self, client, member_token, team):
+        """Test members cannot import tasks."""
+        response = import_file(client, member_token, '/api/team-tasks/import', '{"title": "x"}')
+        assert response.status_code == 403
+
+
+class TestPrivateTodoTransfer:
+    """Test private todo export and import."""
+
+    def test_round_trip(self, client, admin_token, member_token, member_user):
+        """Test todos exported by one user import into another user's list."""
+        client.post('/api/private-todos', headers=auth_header(admin_token),
+                    json={'title': 'Dated', 'due_date': '2026-01-02T03:04:05Z', 'status': 'DONE'})
+        client.post('/api/private-todos', headers=auth_header(admin_token), json={'title': 'Plain'})
+
+        for fmt in ('ndjson', 'csv'):
+            exported = client.get(f'/api/private-todos/export?format={fmt}',
+                                  headers=auth_header(admin_token)).get_data()
+            response = import_file(client, member_token, '/api/private-todos/import', exported, fmt)
+            assert response.get_json()['data'] == {'created': {'private_todos': 2}, 'skipped': 0, 'errors': []}
+
+            todos = client.get('/api/private-todos', headers=auth_header(member_token)).get_json()['data']
+            assert sorted((t['title'], t['status'], t['due_date']) for t in todos) == [
+                ('Dated', 'DONE', '2026-01-02T03:04:05'), ('Plain', 'TODO', None)
+            ]
+            PrivateTodo.query.filter_by(owner_user_id=member_user).delete()
+            db.session.commit()
+
+    def test_invalid_due_date(self, client, admin_token):
+        """Test invalid todos are skipped and reported."""
+        body = '\n'.join([json.dumps({'title': 'ok'}), json.dumps({'title': 'bad', 'due_date': 'soon'})])
+        result = import_file(client, admin_token, '/api/private-todos/import', body).get_json()['data']
+        assert result['created'] == {'private_todos': 1}
+        assert result['errors'] == [{'line': 2, 'errors': {'due_date': 'Invalid due_date format'}}]
@@ -33,12 +33,10 @@ export function Dashboard() {
       setIsLoading(true);
       const [todosData, tasksData] = await Promise.all([
         todosService.getAll(),
-        tasksService.getAll(),
+        user ? tasksService.getAll({ assigned_user_id: user.id }) : Promise.resolve([]),
       ]);
       setTodos(todosData);
-      setAssignedTasks(
-        tasksData.filter((t) => t.assigned_user_id === user?.id)
-      );
+      setAssignedTasks(tasksData);
     } catch (err) {
       setError('Failed to load data');
     } finally {
@@ -13,6 +13,10 @@ const COLUMNS: { status: TaskStatus; label: string; color: string }[] = [
   { status: 'DONE', label: 'Done', color: 'bg-green-100' },
 ];
 
+// Ranks compare as plain strings; ties fall back to id like the API does
+const byPosition = (a: TeamTask, b: TeamTask) =>
+  a.position < b.position ? -1 : a.position > b.position ? 1 : a.id - b.id;
+
 export function TeamBoard() {
   const { user, isAdmin } = useAuth();
   const [tasks, setTasks] = useState<TeamTask[]>([]);
@@ -35,7 +39,7 @@ export function TeamBoard() {
     try {
       setIsLoading(true);
       const [tasksData, membersData] = await Promise.all([
-        tasksService.getAll(),
+        tasksService.getAll({ sort: 'position' }),
         user?.team_id ? usersService.getTeamMembers(user.team_id) : [],
       ]);
       setTasks(tasksData);
@@ -51,7 +55,7 @@ export function TeamBoard() {
     e.preventDefault();
     try {
       const created = await tasksService.create(taskForm);
-      setTasks([created, ...tasks]);
+      setTasks([...tasks, created]);
       setIsModalOpen(false);
       setTaskForm({ title: '', description: '', assigned_user_id: undefined });
     } catch (err) {
@@ -67,13 +71,15 @@ export function TeamBoard() {
     e.preventDefault();
   };
 
-  const handleDrop = async (status: TaskStatus) => {
-    if (!draggedTask || draggedTask.status === status) {
+  // Dropping on a card places the dragged task above it; dropping on the
+  // column background moves it to the end of the column
+  const handleDrop = async (status: TaskStatus, beforeTask?: TeamTask) => {
+    if (!draggedTask || beforeTask?.id === draggedTask.id) {
       setDraggedTask(null);
       return;
     }
 
-    // Check permission: admin can update any, member can update assigned
+    // Check permission: admin can move any, member can move assigned
     if (!isAdmin && draggedTask.assigned_user_id !== user?.id) {
       setError('You can only update tasks assigned to you');
       setDraggedTask(null);
@@ -81,16 +87,16 @@ export function TeamBoard() {
     }
 
     try {
-      const updated = await tasksService.updateStatus(draggedTask.id, status);
+      const updated = await tasksService.move(draggedTask.id, { status, before_id: beforeTask?.id });
       setTasks(tasks.map((t) => (t.id === updated.id ? updated : t)));
     } catch (err) {
-      setError('Failed to update task status');
+      setError('Failed to move task');
     }
     setDraggedTask(null);
   };
 
   const getTasksByStatus = (status: TaskStatus) =>
-    tasks.filter((t) => t.status === status);
+    tasks.filter((t) => t.status === status).sort(byPosition);
 
   if (isLoading) {
     return (
@@ -151,6 +157,10 @@ export function TeamBoard() {
                     to={`/tasks/${task.id}`}
                     draggable
                     onDragStart={() => handleDragStart(task)}
+                    onDrop={(e) => {
+                      e.stopPropagation();
+                      handleDrop(column.status, task);
+                    }}
                     className={`block bg-white rounded-lg p-3 shadow-sm hover:shadow-md transition-shadow cursor-pointer ${
                       draggedTask?.id === task.id ? 'opacity-50' : ''
                     }`}
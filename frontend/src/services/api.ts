@@ -52,6 +52,12 @@ class ApiService {
     return response.data;
   }
 
+  // Fetch a whole list in one streamed response instead of page by page
+  async getAll<T>(url: string): Promise<ApiResponse<T[]>> {
+    const separator = url.includes('?') ? '&' : '?';
+    return this.get<T[]>(`${url}${separator}stream=1`);
+  }
+
   async post<T>(url: string, data?: unknown): Promise<ApiResponse<T>> {
     console.log('API POST:', url, data);
     const response = await this.client.post<ApiResponse<T>>(url, data);
@@ -15,6 +15,12 @@ export interface UpdateTaskData {
   assigned_user_id?: number | null;
 }
 
+export interface MoveTaskData {
+  status: TaskStatus;
+  before_id?: number;
+  after_id?: number;
+}
+
 export interface CreateSubTaskData {
   title: string;
   status?: TaskStatus;
@@ -28,8 +34,14 @@ export interface UpdateSubTaskData {
 }
 
 export const tasksService = {
-  async getAll(): Promise<TeamTask[]> {
-    const response = await api.get<TeamTask[]>('/team-tasks');
+  async getAll(
+    filters: { assigned_user_id?: number; sort?: 'created' | 'position' } = {}
+  ): Promise<TeamTask[]> {
+    const params = new URLSearchParams();
+    if (filters.assigned_user_id) params.set('assigned_user_id', String(filters.assigned_user_id));
+    if (filters.sort) params.set('sort', filters.sort);
+    const query = params.toString() ? `?${params}` : '';
+    const response = await api.getAll<TeamTask>(`/team-tasks${query}`);
     if (response.success && response.data) {
       return response.data;
     }
@@ -68,6 +80,14 @@ export const tasksService = {
     throw new Error(response.error?.message || 'Failed to update status');
   },
 
+  async move(id: number, data: MoveTaskData): Promise<TeamTask> {
+    const response = await api.patch<TeamTask>(`/team-tasks/${id}/move`, data);
+    if (response.success && response.data) {
+      return response.data;
+    }
+    throw new Error(response.error?.message || 'Failed to move task');
+  },
+
   async assign(id: number, userId: number | null): Promise<TeamTask> {
     const response = await api.patch<TeamTask>(`/team-tasks/${id}/assign`, {
       assigned_user_id: userId,
@@ -17,7 +17,7 @@ export interface UpdateTodoData {
 
 export const todosService = {
   async getAll(): Promise<PrivateTodo[]> {
-    const response = await api.get<PrivateTodo[]>('/private-todos');
+    const response = await api.getAll<PrivateTodo>('/private-todos');
     if (response.success && response.data) {
       return response.data;
     }
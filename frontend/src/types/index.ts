@@ -41,6 +41,7 @@ export interface TeamTask {
   status: TaskStatus;
   assigned_user_id: number | null;
   assigned_user?: Pick<User, 'id' | 'name' | 'email'> | null;
+  position: string;
   progress: number;
   sub_tasks?: SubTask[];
   created_at: string;
@@ -58,10 +59,16 @@ export interface SubTask {
   updated_at: string;
 }
 
+export interface PageMeta {
+  next_cursor: string | null;
+  limit: number;
+}
+
 export interface ApiResponse<T> {
   success: boolean;
   data?: T;
   message?: string;
+  meta?: PageMeta;
   error?: {
     message: string;
     code: number;